@@ -0,0 +1,186 @@
+# replication_src/active_learning.py
+
+import csv
+import heapq
+import json
+import multiprocessing
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .parallel import bounded_map
+
+
+# Active-learning sampler for new NER annotations.
+# Sentences are streamed in chunks to a pool of worker processes. Each worker predicts with
+# beam search and scores every sentence by
+#   uncertainty    1 - (probability of the best beam parse - probability of the runner-up)
+#   disagreement   share of labels where a plain-text cue ("Member State", "Commission", ...)
+#                  and the predicted entities disagree (cue without entity or entity without cue)
+# and returns the best candidates of its chunk with a MinHash signature. The parent keeps only
+# a bounded heap of candidates and a bounded number of chunks in flight, so memory does not
+# grow with the corpus. Finally, near-duplicates are dropped (MinHash LSH over word shingles)
+# while taking candidates in score order, and the top k are written as Prodigy-style tasks.
+
+LABEL_CUES = {
+    "MS": ["member state"],
+    "COM": ["commission"],
+    "CA": ["competent authorit", "national authorit", "designated authorit"],
+    "AGE": ["agency", "the authority"],
+}
+
+NUM_PERM = 64
+SHINGLE_SIZE = 3
+_PRIME = (1 << 61) - 1
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, 1 << 31, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, 1 << 31, size=NUM_PERM).astype(np.uint64)
+
+
+# --- INPUT ---
+def iter_sentences_jsonl(path):
+    """Yield (id, text, meta) from EurLex_sentences.jsonl."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            item = json.loads(line)
+            meta = item["metadata"]
+            yield meta.get("sub_sentence_id"), item["text"], {"celex": meta.get("CELEX_number")}
+
+
+def iter_annotated_csv(path):
+    """Yield (id, text, meta) from EURLEX_corpus_annotated.csv."""
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield row["subsub_sentence_id"], row["text"], {"celex": row.get("celex")}
+
+
+def load_annotated_texts(jsonl_file):
+    """Texts that are already annotated (Prodigy JSONL), to be skipped."""
+    texts = set()
+    if jsonl_file.exists():
+        with open(jsonl_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    texts.add(json.loads(line)["text"])
+    return texts
+
+
+def iter_chunks(records, chunk_size, skip_texts=frozenset()):
+    chunk = []
+    for record in records:
+        if record[1] in skip_texts:
+            continue
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# --- SCORING ---
+def minhash(text):
+    words = text.lower().split()
+    shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(max(1, len(words) - SHINGLE_SIZE + 1))}
+    hashes = np.array([zlib.crc32(s.encode("utf-8")) for s in shingles], dtype=np.uint64)
+    return ((np.outer(hashes, _PERM_A) + _PERM_B) % _PRIME).min(axis=0)
+
+
+def lsh_bands(signature, bands):
+    rows = NUM_PERM // bands
+    return [(b, signature[b * rows:(b + 1) * rows].tobytes()) for b in range(bands)]
+
+
+def cue_disagreement(text, labels):
+    lowered = text.lower()
+    disagree = [any(cue in lowered for cue in cues) != (label in labels) for label, cues in LABEL_CUES.items()]
+    return sum(disagree) / len(disagree)
+
+
+def prodigy_task(doc, meta):
+    return {
+        "text": doc.text,
+        "tokens": [{"text": t.text, "start": t.idx, "end": t.idx + len(t.text), "id": t.i, "ws": bool(t.whitespace_)}
+                   for t in doc],
+        "spans": [{"start": e.start_char, "end": e.end_char, "token_start": e.start, "token_end": e.end - 1,
+                   "label": e.label_} for e in doc.ents],
+        "meta": meta,
+    }
+
+
+_worker = {}
+
+
+def init_worker(model_dir, beam_width, weights, keep, bands):
+    import spacy
+    nlp = spacy.load(model_dir)
+    nlp.replace_listeners("tok2vec", "ner", ["model.tok2vec"])
+    _worker.update(nlp=nlp, ner=nlp.get_pipe("ner"), beam_width=beam_width, weights=weights,
+                   keep=keep, bands=bands)
+
+
+def score_chunk(chunk):
+    """Score one chunk of (id, text, meta); returns its best `keep` candidates as (score, task, bands)."""
+    from spacy.tokens import Span
+    nlp, ner = _worker["nlp"], _worker["ner"]
+    w_uncertainty, w_disagreement = _worker["weights"]
+
+    docs = [nlp.make_doc(text) for _, text, _ in chunk]
+    beams = ner.beam_parse(docs, beam_width=_worker["beam_width"])
+    candidates = []
+    for (row_id, text, meta), doc, beam in zip(chunk, docs, beams):
+        parses = sorted(ner.moves.get_beam_parses(beam), key=lambda p: p[0], reverse=True)
+        if not parses:
+            continue
+        margin = parses[0][0] - (parses[1][0] if len(parses) > 1 else 0.0)
+        doc.ents = [Span(doc, start, end, label=label) for start, end, label in parses[0][1]]
+        uncertainty = 1.0 - margin
+        disagreement = cue_disagreement(text, {e.label_ for e in doc.ents})
+        score = w_uncertainty * uncertainty + w_disagreement * disagreement
+        task_meta = dict(meta, id=row_id, score=round(score, 4), uncertainty=round(uncertainty, 4),
+                         disagreement=round(disagreement, 4))
+        candidates.append((score, prodigy_task(doc, task_meta), lsh_bands(minhash(text), _worker["bands"])))
+    return heapq.nlargest(_worker["keep"], candidates, key=lambda c: c[0])
+
+
+# --- SAMPLING ---
+def sample(records, model_dir, k, n_workers=1, chunk_size=2000, beam_width=8, weights=(0.7, 0.3),
+           oversample=5, bands=16, max_in_flight=None, skip_texts=frozenset()):
+    """Select the `k` highest-scoring, mutually dissimilar sentences; returns Prodigy-style tasks."""
+    pool_size = k * oversample
+    max_in_flight = max_in_flight or 2 * n_workers
+    heap = []   # min-heap of the best pool_size candidates seen so far
+    counter = 0
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx, initializer=init_worker,
+                             initargs=(str(model_dir), beam_width, weights, pool_size, bands)) as pool:
+        chunks = iter_chunks(records, chunk_size, skip_texts)
+        for n_chunk, candidates in enumerate(bounded_map(pool, score_chunk, chunks, max_in_flight), start=1):
+            for score, task, task_bands in candidates:
+                counter += 1
+                item = (score, counter, task, task_bands)
+                if len(heap) < pool_size:
+                    heapq.heappush(heap, item)
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, item)
+            if n_chunk % 50 == 0:
+                print(f"   {n_chunk * chunk_size:,} sentences scored")
+
+    selected = []
+    seen_bands = set()
+    for score, _, task, task_bands in sorted(heap, key=lambda c: (-c[0], c[1])):
+        if any(band in seen_bands for band in task_bands):
+            continue
+        seen_bands.update(task_bands)
+        selected.append(task)
+        if len(selected) == k:
+            break
+    return selected
+
+
+def write_tasks(tasks, out_file):
+    with open(out_file, "w", encoding="utf-8") as f:
+        for task in tasks:
+            f.write(json.dumps(task, ensure_ascii=False) + "\n")
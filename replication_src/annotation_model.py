@@ -0,0 +1,44 @@
+# replication_src/annotation_model.py
+
+import spacy
+
+
+# Composite annotation model: the institutions NER ("ner") and the verbs NER ("ner_verbs",
+# DELEGATION/PERMISSION/CONSTRAINT/SOFT_IMPL, used by find_root) in one pipeline package.
+#
+#   shared     tok2vec + ner + ner_verbs, both NERs trained to listen to en_core_web_lg's
+#              frozen tok2vec (see ner_distillation.shared_tok2vec_config). Added to the
+#              annotation pipeline, they reuse the base tok2vec: no extra embedding pass.
+#   separate   ner + ner_verbs, each with its own copy of its tok2vec (replace_listeners);
+#              the shipped models as they are, at the cost of two extra tok2vec passes.
+
+COMPONENTS = ["ner", "ner_verbs"]
+
+
+def assemble_composite(institutions_dir, verbs_dir, out_dir, shared=True):
+    """Combine a trained institutions and verbs pipeline into one composite package."""
+    institutions = spacy.load(institutions_dir)
+    verbs = spacy.load(verbs_dir)
+    if shared:
+        # the frozen tok2vec weights are identical in both pipelines, so one copy serves both NERs
+        composite = institutions
+    else:
+        institutions.replace_listeners("tok2vec", "ner", ["model.tok2vec"])
+        verbs.replace_listeners("tok2vec", "ner", ["model.tok2vec"])
+        composite = spacy.blank(institutions.lang, vocab=institutions.vocab)
+        composite.add_pipe("ner", name="ner", source=institutions)
+    composite.add_pipe("ner", name="ner_verbs", source=verbs)
+    composite.meta["name"] = "eurlex_composite_ner"
+    composite.to_disk(out_dir)
+    return composite.pipe_names
+
+
+def add_annotation_model(nlp, model_dir):
+    """
+    Add the NER components of a composite package to an annotation pipeline built on
+    en_core_web_lg. Shared-tok2vec components are linked to the pipeline's own tok2vec.
+    """
+    composite = spacy.load(model_dir)
+    for name in COMPONENTS:
+        nlp.add_pipe(name, source=composite)
+    return nlp
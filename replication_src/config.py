@@ -14,6 +14,8 @@ CORPUS_DIR         = Path(os.getenv("CORPUS_DIR",         ROOT / "corpus_files")
 MODELS_DIR         = Path(os.getenv("MODELS_DIR",         ROOT / "models_files"))
 OUTPUT_FILES_DIR   = Path(os.getenv("OUTPUT_FILES_DIR",   ROOT / "output_files"))
 OUTPUT_TABLES_DIR  = Path(os.getenv("OUTPUT_TABLES_DIR",  ROOT / "output_tables"))
+REGRESSION_DIR     = Path(os.getenv("REGRESSION_DIR",     ROOT / "regression_files"))
+BENCHMARK_DIR      = Path(os.getenv("BENCHMARK_DIR",      ROOT / "benchmark_files"))
 
 # Make sure common outputs exist (non-destructive)
 for d in [CORPUS_DIR, MODELS_DIR, OUTPUT_FILES_DIR, OUTPUT_TABLES_DIR]:
@@ -0,0 +1,165 @@
+# replication_src/corpus_store.py
+
+import json
+import random
+from pathlib import Path
+
+import spacy
+from spacy.tokens import Doc, DocBin
+from spacy.training import Example
+from spacy.util import load_config
+
+
+# Shared corpus store for the cross-validation folds.
+# The fold train.spacy/dev.spacy files are mostly overlapping copies of the same annotated
+# sentences. The store keeps every distinct annotated doc once (corpus.spacy) and describes
+# each fold by an index file listing the positions of its train and dev docs:
+#
+#   corpus_store/corpus.spacy
+#   corpus_store/folds/<fold>/index.json     {"train": [...], "dev": [...]}
+#   corpus_store/folds/<fold>/config.cfg     fold config reading through the store
+#
+# Training reads the store through the "eurlex.IndexedCorpus.v1" reader registered below
+# (pass this file as code to training: `spacy train --code`, or ner_training.train_job's code_path). The store is deserialised once per process and
+# shared by the train and dev corpora and by every evaluation during training.
+
+STORE_FILE = "corpus.spacy"
+READER_NAME = "eurlex.IndexedCorpus.v1"
+
+_STORE_CACHE = {}
+
+
+def doc_key(doc):
+    """Docs are duplicates when both their text and their entity annotation coincide."""
+    return doc.text, tuple((e.start_char, e.end_char, e.label_) for e in doc.ents)
+
+
+def load_store_docs(store_path, vocab):
+    """Deserialise the store once per process and vocab; later calls reuse the docs."""
+    key = (str(Path(store_path).resolve()), id(vocab))
+    if key not in _STORE_CACHE:
+        _STORE_CACHE[key] = list(DocBin().from_disk(store_path).get_docs(vocab))
+    return _STORE_CACHE[key]
+
+
+def load_index(index_path):
+    with open(index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def iter_store_docs(store_path, index_path, split, vocab):
+    docs = load_store_docs(store_path, vocab)
+    for i in load_index(index_path)[split]:
+        yield docs[i]
+
+
+# --- READER ---
+class IndexedCorpus:
+    """Drop-in replacement for spacy.Corpus.v1 reading one split of a fold from the store."""
+
+    def __init__(self, path, index, split, gold_preproc=False, max_length=0, limit=0, augmenter=None):
+        self.path = path
+        self.index = index
+        self.split = split
+        self.gold_preproc = gold_preproc
+        self.max_length = max_length
+        self.limit = limit
+        self.augmenter = augmenter
+
+    def _make_example(self, nlp, reference):
+        if self.gold_preproc or reference.has_unknown_spaces:
+            predicted = Doc(nlp.vocab, words=[t.text for t in reference],
+                            spaces=[bool(t.whitespace_) for t in reference])
+        else:
+            predicted = nlp.make_doc(reference.text)
+        return Example(predicted, reference)
+
+    def __call__(self, nlp):
+        n = 0
+        for reference in iter_store_docs(self.path, self.index, self.split, nlp.vocab):
+            if self.max_length and len(reference) > self.max_length:
+                continue
+            example = self._make_example(nlp, reference)
+            examples = self.augmenter(nlp, example) if self.augmenter is not None else [example]
+            for example in examples:
+                yield example
+                n += 1
+                if self.limit and n >= self.limit:
+                    return
+
+
+@spacy.registry.readers(READER_NAME)
+def create_indexed_corpus(path, index, split, gold_preproc=False, max_length=0, limit=0, augmenter=None):
+    return IndexedCorpus(path, index, split, gold_preproc, max_length, limit, augmenter)
+
+
+# --- BUILDING THE STORE ---
+def write_fold(store_dir, name, index, base_config):
+    """Write the index file and a config reading its train/dev splits through the store."""
+    fold_dir = store_dir / "folds" / name
+    fold_dir.mkdir(parents=True, exist_ok=True)
+    index_path = fold_dir / "index.json"
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+    config = load_config(base_config, interpolate=False)
+    for split in ["train", "dev"]:
+        config["corpora"][split] = {
+            "@readers": READER_NAME,
+            "path": str((store_dir / STORE_FILE).resolve()),
+            "index": str(index_path.resolve()),
+            "split": split,
+            "max_length": 0,
+            "gold_preproc": False,
+            "limit": 0,
+            "augmenter": None,
+        }
+    config.to_disk(fold_dir / "config.cfg")
+    return fold_dir
+
+
+def build_store(fold_dirs, store_dir):
+    """
+    Merge the train/dev DocBins of `fold_dirs` into one deduplicated corpus.spacy and write
+    an index file (in original document order) and a store-reading config for every fold.
+    Returns the number of distinct docs.
+    """
+    nlp = spacy.blank("en")
+    store = DocBin(store_user_data=True)
+    positions = {}
+    indices = {}
+
+    for fold_dir in fold_dirs:
+        indices[fold_dir.name] = {}
+        for split in ["train", "dev"]:
+            ids = []
+            for doc in DocBin().from_disk(fold_dir / f"{split}.spacy").get_docs(nlp.vocab):
+                key = doc_key(doc)
+                if key not in positions:
+                    positions[key] = len(positions)
+                    store.add(doc)
+                ids.append(positions[key])
+            indices[fold_dir.name][split] = ids
+
+    store_dir.mkdir(parents=True, exist_ok=True)
+    store.to_disk(store_dir / STORE_FILE)
+    for fold_dir in fold_dirs:
+        write_fold(store_dir, fold_dir.name, indices[fold_dir.name], fold_dir / "config.cfg")
+    return len(positions)
+
+
+def make_kfold_splits(store_dir, n_folds, base_config, seed=0, prefix="split"):
+    """Generate new k-fold splits over all docs of the store as index files only."""
+    n_docs = len(DocBin().from_disk(store_dir / STORE_FILE))
+    ids = list(range(n_docs))
+    random.Random(seed).shuffle(ids)
+
+    names = []
+    for k in range(n_folds):
+        dev = ids[k::n_folds]
+        dev_set = set(dev)
+        train = [i for i in ids if i not in dev_set]
+        name = f"{prefix}_{k + 1}"
+        write_fold(store_dir, name, {"train": train, "dev": dev}, base_config)
+        names.append(name)
+    return names
@@ -1,3 +1,5 @@
+import re
+
 ## Function to separate coordinated sentences
 
 # The `segment_sentence_into_chunks` function is designed to process and segment sentences into smaller chunks based on coordinated conjunctions.
@@ -1280,6 +1282,40 @@ def find_comitproc(root):
                                                                            or (child.dep_ == 'compound' and (child.text =='management' or child.text =='safeguard' or child.text =='examination'))):
                                                                                return True
 
+## Phrases tested by the classification rules
+# The classification rules test the sentence text for ~40 fixed phrases. Instead of one
+# str.find per test, all phrases are matched in a single pass by one precompiled regex and the
+# set of phrases found is stored in the sentence dictionary under 'phrases', so the rules only
+# depend on their dictionary argument.
+RULE_PHRASES = [
+    'grounds', 'public security', 'public policy',
+    'in collaboration with', 'in coordination with', 'in cooperation with',
+    'in close collaboration with', 'in close coordination with', 'in close cooperation with',
+    'After consulting', 'after consulting', 'After consultation',
+    'after consultation', 'In consultation', 'in consultation',
+    'After having consulted', 'after having consulted', 'Following consultation',
+    'following consultation', 'After having heard', 'after having heard',
+    'with the agreement of', 'in agreement with', 'personnel',
+    'On the', 'On a', 'Upon the',
+    'on the', 'on a', 'upon the',
+    'submission by the Commission', 'by a legislative proposal', 'by legislative proposals',
+    'to the Commission', 'assisted', 'subject to the advisory procedure',
+    'subject to the management procedure', 'subject to the regulatory procedure', 'subject to the safeguard procedure',
+    'subject to the examination procedure', 'subject to', 'shall comprise',
+]
+
+# A lookahead at every position returns the longest phrase starting there (alternatives are
+# sorted longest first); every shorter phrase starting at the same position is a prefix of it.
+_PHRASE_PATTERN = re.compile('(?=(' + '|'.join(re.escape(p) for p in sorted(RULE_PHRASES, key=len, reverse=True)) + '))')
+_PHRASE_PREFIXES = {p: frozenset(q for q in RULE_PHRASES if p.startswith(q)) for p in RULE_PHRASES}
+
+def find_phrases(sentence):
+    text = sentence if isinstance(sentence, str) else sentence.text
+    found = set()
+    for match in _PHRASE_PATTERN.finditer(text):
+        found |= _PHRASE_PREFIXES[match.group(1)]
+    return frozenset(found)
+
 """# Extraction Rules: Member States
 
 The following code contains a set of classification rules to categorize provisions in legal texts related to Member States. The subsections contain respectively rules to extract:
@@ -1378,9 +1414,9 @@ def classify_del_ms2(dict):
             return 'PREJEXPR1'
 
 # “save on grounds of public policy, public security or public health”
-    if (sentence.text.find("grounds") != -1 and
-        sentence.text.find("public security") != -1 and
-        sentence.text.find("public policy") != -1):
+    if ("grounds" in dict['phrases'] and
+        "public security" in dict['phrases'] and
+        "public policy" in dict['phrases']):
          return 'PREJEXPR2'
 
 """## Member States: Soft obligation provisions"""
@@ -1422,9 +1458,9 @@ def classify_so_ms2(dict):
 #### Collaboration: COLLABORATION
     if ((dict['subj']=='MS' or dict['subj2']=='MS' or dict['rep_subj']=='MS' or
          dict['agent']=='MS' or dict['agent2']=='MS' or dict['rep_agent']=='MS')
-          and (sentence.text.find('in collaboration with')!=-1 or sentence.text.find('in coordination with')!=-1
-          or sentence.text.find('in cooperation with')!=-1 or sentence.text.find('in close collaboration with')!=-1
-          or sentence.text.find('in close coordination with')!=-1 or sentence.text.find('in close cooperation with')!=-1)):
+          and ('in collaboration with' in dict['phrases'] or 'in coordination with' in dict['phrases']
+          or 'in cooperation with' in dict['phrases'] or 'in close collaboration with' in dict['phrases']
+          or 'in close coordination with' in dict['phrases'] or 'in close cooperation with' in dict['phrases'])):
                     return 'COLLABORATION'
 
 """### Member States: Constraining provisions"""
@@ -1520,13 +1556,13 @@ def classify_con_ms2(dict):
 #### Consultation: CONSULTATION
     if ((dict['subj']=='MS' or dict['subj2']=='MS' or dict['rep_subj']=='MS' or
          dict['agent']=='MS' or dict['agent2']=='MS' or dict['rep_agent']=='MS')
-          and (sentence.text.find('After consulting')!=-1 or sentence.text.find('after consulting')!=-1
-          or sentence.text.find('After consultation')!=-1 or sentence.text.find('after consultation')!=-1
-          or sentence.text.find('In consultation')!=-1 or sentence.text.find('in consultation')!=-1
-          or sentence.text.find('After having consulted')!=-1 or sentence.text.find('after having consulted')!=-1
-          or sentence.text.find('Following consultation')!=-1 or sentence.text.find('following consultation')!=-1
-          or sentence.text.find('After having heard')!=-1 or sentence.text.find('after having heard')!=-1
-          or sentence.text.find('with the agreement of')!=-1 or sentence.text.find('in agreement with')!=-1)):
+          and ('After consulting' in dict['phrases'] or 'after consulting' in dict['phrases']
+          or 'After consultation' in dict['phrases'] or 'after consultation' in dict['phrases']
+          or 'In consultation' in dict['phrases'] or 'in consultation' in dict['phrases']
+          or 'After having consulted' in dict['phrases'] or 'after having consulted' in dict['phrases']
+          or 'Following consultation' in dict['phrases'] or 'following consultation' in dict['phrases']
+          or 'After having heard' in dict['phrases'] or 'after having heard' in dict['phrases']
+          or 'with the agreement of' in dict['phrases'] or 'in agreement with' in dict['phrases'])):
                     return 'CONSULTATION'
 
 """# Extraction Rules: National Competent Authorities
@@ -1616,7 +1652,7 @@ def classify_del_nca(dict):
         ((dict['free']==True and dict['be']==True) # CA are free
           or (dict['competent']==True and dict['remain']==True) # CA remain competent
           or ((dict['right_dobj']==True and (dict['retain']==True or dict['have']==True)))  # CA retain/have the right
-          or (sentence.text.find('personnel')!=-1 and dict['have']==True))): # CA shall have sufficient personnel (ONLY FOR CA)
+          or ('personnel' in dict['phrases'] and dict['have']==True))): # CA shall have sufficient personnel (ONLY FOR CA)
               return 'RIGHT'
 
 def classify_del_nca2(dict):
@@ -1666,9 +1702,9 @@ def classify_so_nca2(dict):
 #### Collaboration SC : COLLABORATION
     if ((dict['subj']=='CA' or dict['subj2']=='CA' or dict['rep_subj']=='CA' or
          dict['agent']=='CA' or dict['agent2']=='CA' or dict['rep_agent']=='CA')
-          and (sentence.text.find('in collaboration with')!=-1 or sentence.text.find('in coordination with')!=-1
-          or sentence.text.find('in cooperation with')!=-1 or sentence.text.find('in close collaboration with')!=-1
-          or sentence.text.find('in close coordination with')!=-1 or sentence.text.find('in close cooperation with')!=-1)):
+          and ('in collaboration with' in dict['phrases'] or 'in coordination with' in dict['phrases']
+          or 'in cooperation with' in dict['phrases'] or 'in close collaboration with' in dict['phrases']
+          or 'in close coordination with' in dict['phrases'] or 'in close cooperation with' in dict['phrases'])):
                     return 'COLLABORATION'
 
 """### National Competent Authorities: Constraining provisions"""
@@ -1769,13 +1805,13 @@ def classify_con_nca2(dict):
 #### Consultation NC: CONSULTATION
     if ((dict['subj']=='CA' or dict['subj2']=='CA' or dict['rep_subj']=='CA' or
          dict['agent']=='CA' or dict['agent2']=='CA' or dict['rep_agent']=='CA')
-         and (sentence.text.find('After consulting')!=-1 or sentence.text.find('after consulting')!=-1
-          or sentence.text.find('After consultation')!=-1 or sentence.text.find('after consultation')!=-1
-          or sentence.text.find('In consultation')!=-1 or sentence.text.find('in consultation')!=-1
-          or sentence.text.find('After having consulted')!=-1 or sentence.text.find('after having consulted')!=-1
-          or sentence.text.find('Following consultation')!=-1 or sentence.text.find('following consultation')!=-1
-          or sentence.text.find('After having heard')!=-1 or sentence.text.find('after having heard')!=-1
-          or sentence.text.find('with the agreement of')!=-1 or sentence.text.find('in agreement with')!=-1)):
+         and ('After consulting' in dict['phrases'] or 'after consulting' in dict['phrases']
+          or 'After consultation' in dict['phrases'] or 'after consultation' in dict['phrases']
+          or 'In consultation' in dict['phrases'] or 'in consultation' in dict['phrases']
+          or 'After having consulted' in dict['phrases'] or 'after having consulted' in dict['phrases']
+          or 'Following consultation' in dict['phrases'] or 'following consultation' in dict['phrases']
+          or 'After having heard' in dict['phrases'] or 'after having heard' in dict['phrases']
+          or 'with the agreement of' in dict['phrases'] or 'in agreement with' in dict['phrases'])):
                     return 'CONSULTATION'
 
 """# Extraction Rules: European Commission
@@ -1822,14 +1858,14 @@ def classify_agenda(dict):
 # “(acting) on the basis of a proposal of the Commission”, “on the basis of a Commission proposal”
     if ((dict['pobj3']=='COM' or dict['pobj5']=='COM'or dict['pobj6']=='COM' or dict['pobj7']=='COM' or dict['compound']=='COM')
          and dict['proposal']==True
-         and (sentence.text.find("On the") != -1 or sentence.text.find("On a") != -1 or sentence.text.find("Upon the") != -1
-          or sentence.text.find("on the") != -1 or sentence.text.find("on a") != -1 or sentence.text.find("upon the") != -1
-          or sentence.text.find("submission by the Commission") != -1)):
+         and ("On the" in dict['phrases'] or "On a" in dict['phrases'] or "Upon the" in dict['phrases']
+          or "on the" in dict['phrases'] or "on a" in dict['phrases'] or "upon the" in dict['phrases']
+          or "submission by the Commission" in dict['phrases'])):
                 return 'PROPOSAL1'
 # “accompanied … by a legislative proposal”
     if ((dict['by']==True or dict['by2']==True or dict['by3']==True) and dict['legprop']==True):
                 return 'PROPOSAL2'
-    if (sentence.text.find("by a legislative proposal") != -1 or sentence.text.find("by legislative proposals") != -1):
+    if ("by a legislative proposal" in dict['phrases'] or "by legislative proposals" in dict['phrases']):
                 return 'PROPOSAL3'
 
 """## European Commission: Delegating provisions"""
@@ -1852,14 +1888,14 @@ def classify_del_com(dict):
 # Act
     if ((dict['pobj2subj']=='COM' or dict['compound']=='COM' or (dict['pobj4']=='COM' and dict['by2']==True)) #  e.g. Measures of the Commission (Commission measures / decided upon by the Commission) may set
         and dict['pmod']==True and dict['auxpass']==None and dict['neg']==None
-        and dict['measure_subj']==True and sentence.text.find("to the Commission") == -1 # To exclude false positives
+        and dict['measure_subj']==True and "to the Commission" not in dict['phrases'] # To exclude false positives
         and (dict['root']==None or dict['root']=='DELEGATION'
              or dict['root']=='PERMISSION' or dict['root']=='CONSTRAINT')):
                 return 'G1_act'
 # Act Passive
     if ((dict['pobj3']=='COM' or dict['compound']=='COM' or (dict['pobj5']=='COM' and dict['by3']==True))
           and dict['auxpass']==True and dict['neg']==None and dict['measure_pobj']==True and dict['by']==True
-          and sentence.text.find("to the Commission") == -1 # To exclude false positives
+          and "to the Commission" not in dict['phrases'] # To exclude false positives
           and (dict['root']==None or dict['root']=='DELEGATION'
              or dict['root']=='PERMISSION' or dict['root']=='CONSTRAINT')):
                 return 'G1_actpass'
@@ -1930,9 +1966,9 @@ def classify_si_com2(dict):
 #### Collaboration: COLLABORATION
     if ((dict['subj']=='COM' or dict['subj2']=='COM' or dict['rep_subj']=='COM' or
          dict['agent']=='COM' or dict['agent2']=='COM' or dict['rep_agent']=='COM')
-          and (sentence.text.find('in collaboration with')!=-1 or sentence.text.find('in coordination with')!=-1
-          or sentence.text.find('in cooperation with')!=-1 or sentence.text.find('in close collaboration with')!=-1
-          or sentence.text.find('in close coordination with')!=-1 or sentence.text.find('in close cooperation with')!=-1)):
+          and ('in collaboration with' in dict['phrases'] or 'in coordination with' in dict['phrases']
+          or 'in cooperation with' in dict['phrases'] or 'in close collaboration with' in dict['phrases']
+          or 'in close coordination with' in dict['phrases'] or 'in close cooperation with' in dict['phrases'])):
                     return 'COLLABORATION'
 
 """## European Commission: Constraining provisions"""
@@ -2060,7 +2096,7 @@ def classify_con_com(dict):
                 return 'COMIT88-99a'
 # Variant b
     if ((dict['subj']=='COM' or dict['subjpass']=='COM' or dict['agent']=='COM') and dict['smod']==True
-          and dict['neg']==None and sentence.text.find('assisted')!=-1
+          and dict['neg']==None and 'assisted' in dict['phrases']
           and dict['committee']==True and (dict['by2']==True or dict['by3']==True)): # "The Commission, assisted by a committee, shall [be]"
                 return 'COMIT88-99b' # "...by the Commission assisted by a committee"
 ## Period 2000-2022: COMIT00-22
@@ -2075,17 +2111,17 @@ def classify_con_com(dict):
 ## Period 2000-2009: COMIT00-09
 # Variant a
     if ((dict['subj']=='COM' or dict['subjpass']=='COM' or dict['agent']=='COM' ) and
-             (sentence.text.find('subject to the advisory procedure') != -1
-          or sentence.text.find('subject to the management procedure') != -1
-          or sentence.text.find('subject to the regulatory procedure') != -1
-          or sentence.text.find('subject to the safeguard procedure') != -1
-          or sentence.text.find('subject to the examination procedure') != -1)): # COMIT10-22
+             ('subject to the advisory procedure' in dict['phrases']
+          or 'subject to the management procedure' in dict['phrases']
+          or 'subject to the regulatory procedure' in dict['phrases']
+          or 'subject to the safeguard procedure' in dict['phrases']
+          or 'subject to the examination procedure' in dict['phrases'])): # COMIT10-22
                 return 'COMIT00-09'
 ## Period 2010-2022: COMIT10-22
 # Variant a
     if ((dict['pobj']=='COM' or dict['compound_subj']=='COM') and dict['auxpass']==True # compound_subj: to the Commission subject to
           and dict['neg']==None and dict['right_subj']==True and dict['teract']==True
-          and (sentence.text.find('subject to') != -1 or dict['accordance']==True)
+          and ('subject to' in dict['phrases'] or dict['accordance']==True)
           and dict['root']=='DELEGATION'):
                 return 'COMIT10-22a'
 # Variant b
@@ -2104,23 +2140,23 @@ def classify_con_com2(dict):
 #### Consultation: CONSULTATION
     if ((dict['subj']=='COM' or dict['subj2']=='COM' or dict['rep_subj']=='COM' or
          dict['agent']=='COM' or dict['agent2']=='COM' or dict['rep_agent']=='COM')
-        and (sentence.text.find('After consulting')!=-1 or sentence.text.find('After consultation')!=-1
-          or sentence.text.find('In consultation')!=-1 or sentence.text.find('After having heard')!=-1
-          or sentence.text.find('after consulting')!=-1 or sentence.text.find('after consultation')!=-1
-          or sentence.text.find('following consultation')!=-1 or sentence.text.find('Following consultation')!=-1
-          or sentence.text.find('in consultation')!=-1 or sentence.text.find('after having heard')!=-1
-          or sentence.text.find('with the agreement of')!=-1 or sentence.text.find('in agreement with')!=-1)):
+        and ('After consulting' in dict['phrases'] or 'After consultation' in dict['phrases']
+          or 'In consultation' in dict['phrases'] or 'After having heard' in dict['phrases']
+          or 'after consulting' in dict['phrases'] or 'after consultation' in dict['phrases']
+          or 'following consultation' in dict['phrases'] or 'Following consultation' in dict['phrases']
+          or 'in consultation' in dict['phrases'] or 'after having heard' in dict['phrases']
+          or 'with the agreement of' in dict['phrases'] or 'in agreement with' in dict['phrases'])):
                     return 'CONSULTATION'
 # Act
     if (((dict['pobj3']=='COM' or dict['pobj5']=='COM' or dict['compound']=='COM')
           and dict['auxpass']==True and dict['neg']==None and dict['measure_pobj']==True and (dict['by']==True or dict['by3']==True)
-          and sentence.text.find("to the Commission") == -1 ) # To exclude false positives
-          and (sentence.text.find('After consulting')!=-1 or sentence.text.find('After consultation')!=-1
-          or sentence.text.find('In consultation')!=-1 or sentence.text.find('After having heard')!=-1
-          or sentence.text.find('after consulting')!=-1 or sentence.text.find('after consultation')!=-1
-          or sentence.text.find('following consultation')!=-1 or sentence.text.find('Following consultation')!=-1
-          or sentence.text.find('in consultation')!=-1 or sentence.text.find('after having heard')!=-1
-          or sentence.text.find('with the agreement of')!=-1 or sentence.text.find('in agreement with')!=-1)):
+          and "to the Commission" not in dict['phrases'] ) # To exclude false positives
+          and ('After consulting' in dict['phrases'] or 'After consultation' in dict['phrases']
+          or 'In consultation' in dict['phrases'] or 'After having heard' in dict['phrases']
+          or 'after consulting' in dict['phrases'] or 'after consultation' in dict['phrases']
+          or 'following consultation' in dict['phrases'] or 'Following consultation' in dict['phrases']
+          or 'in consultation' in dict['phrases'] or 'after having heard' in dict['phrases']
+          or 'with the agreement of' in dict['phrases'] or 'in agreement with' in dict['phrases'])):
                     return 'CONSULTATION_act'
 
 """# Extraction Rules: Supranational Agencies
@@ -2136,7 +2172,7 @@ def classify_del_age(dict):
 #### General Rule: G1
     if ((dict['subj']=='AGE' or dict['subj2']=='AGE' or dict['rep_subj']=='AGE')
         and dict['neg']==None
-        and dict['board_dobj']==None and sentence.text.find("shall comprise")==-1 # excl. organizational features
+        and dict['board_dobj']==None and "shall comprise" not in dict['phrases'] # excl. organizational features
         and (dict['root']==None or dict['root']=='DELEGATION'
              or dict['root']=='PERMISSION' or dict['root']=='CONSTRAINT'
              or (dict['pmod']==True and dict['root']=='ACTIVE_CONSTRAINT'))):
@@ -2230,9 +2266,9 @@ def classify_si_age2(dict):
 #### Collaboration: COLLABORATION
     if ((dict['subj']=='AGE' or dict['subj2']=='AGE' or dict['rep_subj']=='AGE' or
          dict['agent']=='AGE' or dict['agent2']=='AGE' or dict['rep_agent']=='AGE')
-          and (sentence.text.find('in collaboration with')!=-1 or sentence.text.find('in coordination with')!=-1
-          or sentence.text.find('in cooperation with')!=-1 or sentence.text.find('in close collaboration with')!=-1
-          or sentence.text.find('in close coordination with')!=-1 or sentence.text.find('in close cooperation with')!=-1)):
+          and ('in collaboration with' in dict['phrases'] or 'in coordination with' in dict['phrases']
+          or 'in cooperation with' in dict['phrases'] or 'in close collaboration with' in dict['phrases']
+          or 'in close coordination with' in dict['phrases'] or 'in close cooperation with' in dict['phrases'])):
                     return 'COLLABORATION'
 
 """## Supranational Agencies: Constraining provisions"""
@@ -2368,29 +2404,29 @@ def classify_con_age2(dict):
 #### Consultation: CONSULTATION
     if ((dict['subj']=='AGE' or dict['subj2']=='AGE' or dict['rep_subj']=='AGE' or
          dict['agent']=='AGE' or dict['agent2']=='AGE' or dict['rep_agent']=='AGE')
-        and (sentence.text.find('After consulting')!=-1 or sentence.text.find('after consulting')!=-1
-          or sentence.text.find('After consultation')!=-1 or sentence.text.find('after consultation')!=-1
-          or sentence.text.find('In consultation')!=-1 or sentence.text.find('in consultation')!=-1
-          or sentence.text.find('After having consulted')!=-1 or sentence.text.find('after having consulted')!=-1
-          or sentence.text.find('Following consultation')!=-1 or sentence.text.find('following consultation')!=-1
-          or sentence.text.find('After having heard')!=-1 or sentence.text.find('after having heard')!=-1
-          or sentence.text.find('with the agreement of')!=-1 or sentence.text.find('in agreement with')!=-1)):
+        and ('After consulting' in dict['phrases'] or 'after consulting' in dict['phrases']
+          or 'After consultation' in dict['phrases'] or 'after consultation' in dict['phrases']
+          or 'In consultation' in dict['phrases'] or 'in consultation' in dict['phrases']
+          or 'After having consulted' in dict['phrases'] or 'after having consulted' in dict['phrases']
+          or 'Following consultation' in dict['phrases'] or 'following consultation' in dict['phrases']
+          or 'After having heard' in dict['phrases'] or 'after having heard' in dict['phrases']
+          or 'with the agreement of' in dict['phrases'] or 'in agreement with' in dict['phrases'])):
                     return 'CONSULTATION'
 # Act
     if (((dict['pobj3']=='AGE' or dict['pobj5']=='AGE' or dict['compound']=='AGE')
           and dict['auxpass']==True and dict['neg']==None and dict['measure_pobj']==True and (dict['by']==True or dict['by3']==True))
-        and (sentence.text.find('After consulting')!=-1 or sentence.text.find('after consulting')!=-1
-          or sentence.text.find('After consultation')!=-1 or sentence.text.find('after consultation')!=-1
-          or sentence.text.find('In consultation')!=-1 or sentence.text.find('in consultation')!=-1
-          or sentence.text.find('After having consulted')!=-1 or sentence.text.find('after having consulted')!=-1
-          or sentence.text.find('Following consultation')!=-1 or sentence.text.find('following consultation')!=-1
-          or sentence.text.find('After having heard')!=-1 or sentence.text.find('after having heard')!=-1
-          or sentence.text.find('with the agreement of')!=-1 or sentence.text.find('in agreement with')!=-1)):
+        and ('After consulting' in dict['phrases'] or 'after consulting' in dict['phrases']
+          or 'After consultation' in dict['phrases'] or 'after consultation' in dict['phrases']
+          or 'In consultation' in dict['phrases'] or 'in consultation' in dict['phrases']
+          or 'After having consulted' in dict['phrases'] or 'after having consulted' in dict['phrases']
+          or 'Following consultation' in dict['phrases'] or 'following consultation' in dict['phrases']
+          or 'After having heard' in dict['phrases'] or 'after having heard' in dict['phrases']
+          or 'with the agreement of' in dict['phrases'] or 'in agreement with' in dict['phrases'])):
                return 'CONSULTATION_act'
 
 #### Accordance: ACCORDANCE (ONLY RELEVANT FOR SUPRANATIONAL AGENCIES)
     if ((dict['subj']=='AGE' or dict['subj2']=='AGE' or dict['rep_subj']=='AGE' or
          dict['agent']=='AGE' or dict['agent2']=='AGE' or dict['rep_agent']=='AGE')
          and dict['neg']==None
-         and (sentence.text.find('subject to') != -1 or dict['accordance']==True)):
+         and ('subject to' in dict['phrases'] or dict['accordance']==True)):
                 return 'ACCORDANCE'
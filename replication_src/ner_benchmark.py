@@ -0,0 +1,142 @@
+# replication_src/ner_benchmark.py
+
+import json
+import sys
+import time
+
+import spacy
+from spacy.scorer import Scorer
+from spacy.tokens import DocBin
+
+from ner_evaluation import iter_docbin_examples
+from ner_training import train_job
+
+
+# Throughput/accuracy benchmark of the NER training configs.
+# Every run trains one architecture variant (tok2vec width/depth, embedding rows, batch size)
+# as a job of ner_training.run_jobs, then measures on the dev DocBin:
+#   train_wps   words/sec during training (from the logger below; includes the periodic dev evaluations)
+#   infer_wps   words/sec of nlp.pipe on the dev texts
+#   size_mb     size of model-best on disk
+#   ents_f      dev F-score
+# and writes them to <run>/benchmark.json, so finished runs are skipped on a rerun.
+
+THROUGHPUT_LOGGER = "eurlex.ThroughputLogger.v1"
+RESULT_FILE = "benchmark.json"
+
+# embedding rows for NORM, PREFIX, SUFFIX, SHAPE; "default" is what the shipped configs use
+ROWS_PRESETS = {
+    "small": [2500, 500, 1250, 1250],
+    "default": [5000, 1000, 2500, 2500],
+    "large": [10000, 2000, 5000, 5000],
+}
+
+
+@spacy.registry.loggers(THROUGHPUT_LOGGER)
+def throughput_logger(log_path, progress_bar=False):
+    """spaCy's console logger, additionally writing cumulative words and wall time per evaluation step."""
+    console = spacy.registry.loggers.get("spacy.ConsoleLogger.v1")(progress_bar=progress_bar)
+
+    def setup_printer(nlp, stdout=sys.stdout, stderr=sys.stderr):
+        log_step, finalize = console(nlp, stdout, stderr)
+        out = open(log_path, "w", encoding="utf-8")
+        start = time.perf_counter()
+
+        def log_throughput(info):
+            log_step(info)
+            if info is None:
+                return
+            out.write(json.dumps({
+                "step": info["step"],
+                "epoch": info["epoch"],
+                "words": info["words"],
+                "seconds": time.perf_counter() - start,
+                "score": info["score"],
+            }) + "\n")
+            out.flush()
+
+        def close():
+            finalize()
+            out.close()
+
+        return log_throughput, close
+
+    return setup_printer
+
+
+def variant_overrides(width, depth, rows, batch_size, max_steps):
+    """Config overrides for one architecture variant; batch_size is the final words per batch."""
+    return {
+        "components.tok2vec.model.encode.width": width,
+        "components.tok2vec.model.encode.depth": depth,
+        "components.tok2vec.model.embed.rows": list(rows),
+        "training.batcher.size.stop": batch_size,
+        "training.max_steps": max_steps,
+    }
+
+
+def dir_size_mb(path):
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file()) / 1024 ** 2
+
+
+def measure_model(model_dir, dev_path, batch_size=256):
+    """Inference words/sec and dev scores of a trained pipeline in one pass over the dev DocBin."""
+    nlp = spacy.load(model_dir)
+    gold_docs = list(DocBin().from_disk(dev_path).get_docs(nlp.vocab))
+    n_words = sum(len(doc) for doc in gold_docs)
+
+    start = time.perf_counter()
+    examples = list(iter_docbin_examples(nlp, gold_docs, batch_size))
+    seconds = time.perf_counter() - start
+
+    scores = Scorer.score_spans(examples, "ents")
+    return {
+        "infer_wps": n_words / seconds if seconds else None,
+        "size_mb": dir_size_mb(model_dir),
+        "ents_p": scores["ents_p"],
+        "ents_r": scores["ents_r"],
+        "ents_f": scores["ents_f"],
+    }
+
+
+def benchmark_job(cfg_path, train_path, dev_path, output_path, overrides, log_path):
+    """Train one variant and write its measurements to output_path/benchmark.json; returns training seconds."""
+    output_path.mkdir(parents=True, exist_ok=True)
+    throughput_path = output_path / "throughput.jsonl"
+    overrides = dict(overrides)
+    # the throughput log (and model-best) is only written at evaluation steps: evaluate at least once
+    eval_frequency = spacy.util.load_config(cfg_path)["training"]["eval_frequency"]
+    max_steps = overrides.get("training.max_steps", 0)
+    if max_steps and max_steps < eval_frequency:
+        overrides["training.eval_frequency"] = max_steps
+    overrides.update({
+        "paths.train": str(train_path.resolve()),
+        "paths.dev": str(dev_path.resolve()),
+        "training.logger.@loggers": THROUGHPUT_LOGGER,
+        "training.logger.log_path": str(throughput_path.resolve()),
+    })
+
+    seconds = train_job(cfg_path, output_path, overrides, log_path)
+
+    with open(throughput_path, "r", encoding="utf-8") as f:
+        logged = [json.loads(line) for line in f if line.strip()]
+    if not logged:
+        raise RuntimeError(f"No evaluation step was logged to {throughput_path} (see {log_path})")
+    last = logged[-1]
+    result = {
+        "train_seconds": seconds,
+        "steps": last["step"],
+        "train_wps": last["words"] / last["seconds"] if last["seconds"] else None,
+    }
+    result.update(measure_model(output_path / "model-best", dev_path))
+
+    with open(output_path / RESULT_FILE, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=4)
+    return seconds
+
+
+def pareto_front(rows, keys=("ents_f", "infer_wps")):
+    """Flags for the rows not dominated on `keys` (higher is better for every key)."""
+    def dominates(a, b):
+        return all(a[k] >= b[k] for k in keys) and any(a[k] > b[k] for k in keys)
+    return [not any(dominates(other, row) for other in rows if other is not row) for row in rows]
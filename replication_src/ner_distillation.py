@@ -0,0 +1,75 @@
+# replication_src/ner_distillation.py
+
+import json
+import time
+
+import spacy
+from spacy.tokens import DocBin
+from spacy.util import load_config
+
+
+# Faster institution NER for the annotation pipeline (script 05).
+# The shipped model has its own tok2vec, copied into the pipeline with replace_listeners, so
+# every token is embedded twice (once by en_core_web_lg, once by the NER). Two alternatives:
+#
+#   shared   the NER is retrained to listen to en_core_web_lg's tok2vec, which is sourced and
+#            frozen during training. At annotation time the NER is added without
+#            replace_listeners and reuses the embeddings the tagger/parser already computed.
+#   student  a smaller standalone tok2vec + NER trained on the gold data plus "silver"
+#            annotations of the current model (the teacher) over EurLex_sentences.jsonl.
+
+BASE_MODEL = "en_core_web_lg"
+
+
+def shared_tok2vec_config(base_config, out_path, base_model=BASE_MODEL):
+    """Write a copy of `base_config` whose NER listens to the frozen tok2vec of `base_model`."""
+    base_nlp = spacy.load(base_model, exclude=["ner"])
+    width = base_nlp.get_pipe("tok2vec").model.get_dim("nO")
+
+    config = load_config(base_config, interpolate=False)
+    config["components"]["tok2vec"] = {"source": base_model}
+    config["components"]["ner"]["model"]["tok2vec"]["width"] = width
+    config["training"]["frozen_components"] = ["tok2vec"]
+    config["training"]["annotating_components"] = ["tok2vec"]
+    config["initialize"]["vectors"] = base_model
+    config.to_disk(out_path)
+    return out_path
+
+
+def iter_sentence_texts(sentences_file, limit=0):
+    with open(sentences_file, "r", encoding="utf-8") as f:
+        for n, line in enumerate(f):
+            if limit and n >= limit:
+                return
+            yield json.loads(line)["text"]
+
+
+def write_silver_docbin(teacher_dir, sentences_file, out_path, limit=0, batch_size=256, n_process=1):
+    """Annotate corpus sentences with the teacher NER and save them as a DocBin; returns (docs, ents)."""
+    teacher = spacy.load(teacher_dir)
+    silver = DocBin(attrs=["ENT_IOB", "ENT_TYPE"])
+    n_docs = n_ents = 0
+    for doc in teacher.pipe(iter_sentence_texts(sentences_file, limit), batch_size=batch_size, n_process=n_process):
+        silver.add(doc)
+        n_docs += 1
+        n_ents += len(doc.ents)
+    silver.to_disk(out_path)
+    return n_docs, n_ents
+
+
+def annotation_pipeline(ner_dir, shared_tok2vec=False):
+    """en_core_web_lg plus the institution NER, assembled as in script 05."""
+    nlp = spacy.load(BASE_MODEL, exclude=["ner"])
+    ner = spacy.load(ner_dir)
+    if not shared_tok2vec:
+        ner.replace_listeners("tok2vec", "ner", ["model.tok2vec"])
+    nlp.add_pipe("ner", name="ner", source=ner)
+    return nlp
+
+
+def annotation_speed(nlp, texts, batch_size=64):
+    """Words/sec of the full pipeline over `texts`."""
+    start = time.perf_counter()
+    n_words = sum(len(doc) for doc in nlp.pipe(texts, batch_size=batch_size))
+    seconds = time.perf_counter() - start
+    return n_words / seconds if seconds else None
@@ -0,0 +1,192 @@
+# replication_src/ner_driver.py
+
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import spacy
+from spacy.schemas import ConfigSchemaTraining
+from spacy.training.initialize import init_nlp
+from spacy.training.loop import (create_before_to_disk_callback, create_evaluation_callback,
+                                 create_train_batches, train_while_improving, update_meta)
+from spacy.util import fix_random_seed, load_config, registry, resolve_dot_names
+
+
+# Resumable training driver for the spaCy NER models (scripts 02-04), used instead of
+# spaCy's train() when TRAIN_DRIVER=1. It runs the same training loop and additionally:
+#   - writes a durable checkpoint every CHECKPOINT_EVERY steps (<output>/checkpoint, swapped
+#     in atomically so a killed job always leaves the last good checkpoint behind);
+#   - resumes from that checkpoint (RESUME=1, default) at the step where the job stopped;
+#   - stops when dev score has not improved by more than MIN_DELTA for PLATEAU_PATIENCE steps
+#     (default: training.patience of the config);
+#   - stops when the fold has used TIME_BUDGET seconds of training, summed over resumes; a
+#     rerun with an exhausted budget leaves the outputs untouched (raise TIME_BUDGET to continue).
+# Checkpoints hold the averaged parameters, i.e. the weights spaCy saves as model-last. A resumed
+# run starts from them with fresh optimizer moments, parameter averages and batch-size schedule;
+# step count, best score and elapsed time are restored.
+
+CHECKPOINT_DIR = "checkpoint"
+STATE_FILE = "state.json"
+FINAL_STOPS = ["max_steps", "plateau", "epochs"]
+
+
+def driver_settings():
+    """Driver settings from the environment; None when TRAIN_DRIVER is off (plain spaCy train())."""
+    if os.getenv("TRAIN_DRIVER", "0") != "1":
+        return None
+    return {
+        "checkpoint_every": int(os.getenv("CHECKPOINT_EVERY", 1000)),
+        "resume": os.getenv("RESUME", "1") == "1",
+        "plateau_patience": int(os.getenv("PLATEAU_PATIENCE", 0)) or None,
+        "min_delta": float(os.getenv("MIN_DELTA", 0.0)),
+        "time_budget": float(os.getenv("TIME_BUDGET", 0)),
+    }
+
+
+# --- CHECKPOINTS ---
+def save_checkpoint(nlp, output_path, state):
+    """Write model + state to a temporary directory, then swap it in for the previous checkpoint."""
+    checkpoint = output_path / CHECKPOINT_DIR
+    tmp = output_path / f"{CHECKPOINT_DIR}.tmp"
+    old = output_path / f"{CHECKPOINT_DIR}.old"
+    shutil.rmtree(tmp, ignore_errors=True)
+
+    nlp.to_disk(tmp / "model")
+    with open(tmp / STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+
+    shutil.rmtree(old, ignore_errors=True)
+    if checkpoint.exists():
+        os.replace(checkpoint, old)
+    os.replace(tmp, checkpoint)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def find_checkpoint(output_path):
+    """The last complete checkpoint, also when a job was killed while swapping checkpoints."""
+    for name in [CHECKPOINT_DIR, f"{CHECKPOINT_DIR}.old"]:
+        if (output_path / name / STATE_FILE).exists():
+            return output_path / name
+    return None
+
+
+def load_state(checkpoint):
+    with open(checkpoint / STATE_FILE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- TRAINING ---
+def train_resumable(cfg_path, output_path, overrides, checkpoint_every=1000, resume=True,
+                    plateau_patience=None, min_delta=0.0, time_budget=0, stdout=None, stderr=None):
+    """Train (or continue training) one pipeline into `output_path`; returns the final state."""
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    checkpoint = find_checkpoint(output_path) if resume else None
+    if checkpoint is not None:
+        state = load_state(checkpoint)
+        if state["stopped"] in FINAL_STOPS:
+            stdout.write(f"Training already finished at step {state['step']} ({state['stopped']})\n")
+            return state
+        if time_budget and state["seconds"] >= time_budget:
+            stdout.write(f"Time budget of {time_budget:.0f}s already used ({state['seconds']:.0f}s, step "
+                         f"{state['step']}); outputs left unchanged, raise TIME_BUDGET to continue\n")
+            return state
+        stdout.write(f"Resuming from {checkpoint} at step {state['step']}\n")
+        nlp = spacy.load(checkpoint / "model", config=overrides)
+    else:
+        state = {"step": 0, "words": 0, "seconds": 0.0, "best_score": None, "best_step": 0,
+                 "improved_step": 0, "stopped": None}
+        nlp = init_nlp(load_config(cfg_path, overrides=overrides, interpolate=False))
+
+    config = nlp.config.interpolate()
+    T = registry.resolve(config["training"], schema=ConfigSchemaTraining)
+    fix_random_seed(T["seed"] + state["step"])
+    train_corpus, dev_corpus = resolve_dot_names(config, [T["train_corpus"], T["dev_corpus"]])
+    optimizer = T["optimizer"]
+    if checkpoint is not None:
+        nlp.resume_training(sgd=optimizer)
+    before_to_disk = create_before_to_disk_callback(T["before_to_disk"])
+    frozen_components = T["frozen_components"]
+    patience = plateau_patience or T["patience"]
+    max_steps = T["max_steps"]
+
+    # patience and max_steps are handled here, on the step count across resumes
+    training_steps = train_while_improving(
+        nlp,
+        optimizer,
+        create_train_batches(nlp, train_corpus, T["batcher"], T["max_epochs"]),
+        create_evaluation_callback(nlp, dev_corpus, T["score_weights"]),
+        dropout=T["dropout"],
+        accumulate_gradient=T["accumulate_gradient"],
+        patience=0,
+        max_steps=0,
+        eval_frequency=T["eval_frequency"],
+        exclude=frozen_components,
+        annotating_components=T["annotating_components"],
+        before_update=T["before_update"],
+    )
+
+    def save_model(name):
+        with nlp.use_params(optimizer.averages):
+            before_to_disk(nlp).to_disk(output_path / name)
+
+    def checkpoint_averages():
+        with nlp.use_params(optimizer.averages):
+            save_checkpoint(nlp, output_path, state)
+
+    with nlp.select_pipes(disable=frozen_components):
+        log_step, finalize_logger = T["logger"](nlp, stdout, stderr)
+
+    start = time.time()
+    start_step, start_words, start_seconds = state["step"], state["words"], state["seconds"]
+    stop = None
+    try:
+        for _, info, is_evaluation in training_steps:
+            state["step"] = start_step + info["step"] + 1
+            state["words"] = start_words + info["words"]
+            state["seconds"] = start_seconds + time.time() - start
+            info.update({"step": state["step"], "words": state["words"], "seconds": int(state["seconds"])})
+
+            if is_evaluation is not None:
+                score = info["score"]
+                if state["best_score"] is None or score > state["best_score"] + min_delta:
+                    state["improved_step"] = state["step"]
+                is_best = state["best_score"] is None or score > state["best_score"]
+                if is_best:
+                    state["best_score"], state["best_step"] = score, state["step"]
+                with nlp.select_pipes(disable=frozen_components):
+                    update_meta(T, nlp, info)
+                save_model("model-last")
+                if is_best:
+                    shutil.rmtree(output_path / "model-best", ignore_errors=True)
+                    shutil.copytree(output_path / "model-last", output_path / "model-best")
+                info["output_path"] = str(output_path / "model-last")
+            log_step(info if is_evaluation is not None else None)
+
+            if max_steps and state["step"] >= max_steps:
+                stop = "max_steps"
+            elif patience and state["step"] - state["improved_step"] >= patience:
+                stop = "plateau"
+            elif time_budget and state["seconds"] >= time_budget:
+                stop = "time_budget"
+            if stop:
+                break
+            if checkpoint_every and state["step"] % checkpoint_every == 0:
+                checkpoint_averages()
+    finally:
+        finalize_logger()
+
+    state["stopped"] = stop or "epochs"
+    save_model("model-last")
+    checkpoint_averages()
+    stdout.write(f"Stopped at step {state['step']} ({state['stopped']}), best score "
+                 f"{state['best_score']} at step {state['best_step']}\n")
+    return state
@@ -0,0 +1,65 @@
+# replication_src/ner_evaluation.py
+
+import json
+
+import spacy
+from spacy.scorer import Scorer
+from spacy.tokens import Doc, DocBin
+from spacy.training import Example
+
+
+# Shared evaluation of the NER models (scripts 02 and 03).
+# Gold annotations come either from Prodigy-style JSONL (streamed line by line, entities
+# rebuilt from character offsets) or directly from a binary DocBin such as dev.spacy (no JSON
+# parsing or offset alignment). Predictions are made in batches with nlp.pipe and scored with
+# Scorer.score_spans, which consumes the examples as a generator.
+
+
+def iter_gold_jsonl(jsonl_file):
+    """Yield (text, {"entities": [(start, end, label), ...]}) from a Prodigy-style JSONL file."""
+    with open(jsonl_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            entities = [(s["start"], s["end"], s["label"]) for s in data["spans"]]
+            yield data["text"], {"entities": entities}
+
+
+def iter_examples(nlp, gold, batch_size=256, n_process=1):
+    for doc_pred, annotations in nlp.pipe(gold, as_tuples=True, batch_size=batch_size, n_process=n_process):
+        yield Example.from_dict(doc_pred, annotations)
+
+
+def iter_docbin_examples(nlp, gold_docs, batch_size=256, n_process=1):
+    """Predict on unannotated copies of gold docs (e.g. from a DocBin), keeping their tokenization."""
+    copies = ((Doc(nlp.vocab, words=[t.text for t in gold], spaces=[bool(t.whitespace_) for t in gold]), gold)
+              for gold in gold_docs)
+    for doc_pred, gold in nlp.pipe(copies, as_tuples=True, batch_size=batch_size, n_process=n_process):
+        yield Example(doc_pred, gold)
+
+
+def evaluate_ner(model_dir, gold_file, batch_size=256, n_process=1):
+    """
+    Score a trained NER model on gold annotations; returns (overall, per_label).
+    `gold_file` is a JSONL annotation file, a .spacy DocBin, or a corpus-store fold
+    (store_path, index_path) tuple, whose dev split is used.
+    """
+    nlp = spacy.load(model_dir)
+    if isinstance(gold_file, tuple):
+        from corpus_store import iter_store_docs
+        store_path, index_path = gold_file
+        gold_docs = iter_store_docs(store_path, index_path, "dev", nlp.vocab)
+        examples = iter_docbin_examples(nlp, gold_docs, batch_size, n_process)
+    elif str(gold_file).endswith(".spacy"):
+        gold_docs = DocBin().from_disk(gold_file).get_docs(nlp.vocab)
+        examples = iter_docbin_examples(nlp, gold_docs, batch_size, n_process)
+    else:
+        examples = iter_examples(nlp, iter_gold_jsonl(gold_file), batch_size, n_process)
+    scores = Scorer.score_spans(examples, "ents")
+    overall = {
+        "ents_p": scores["ents_p"],
+        "ents_r": scores["ents_r"],
+        "ents_f": scores["ents_f"],
+    }
+    return overall, scores["ents_per_type"]
@@ -0,0 +1,91 @@
+# replication_src/ner_training.py
+
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+
+
+# Concurrent training of independent spaCy pipelines (e.g. the cross-validation folds).
+# Every job runs spaCy's train() in its own spawned process with stdout/stderr sent to a
+# per-job log file. The BLAS/OpenMP thread limits are set in the environment before the
+# workers are spawned, so that n_workers x threads_per_worker does not oversubscribe the CPU.
+# Keep the top-level imports of this module light: workers import it before spaCy/numpy.
+
+THREAD_ENV_VARS = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+]
+
+
+def thread_budget(n_workers, n_cpus=None):
+    """Threads each of `n_workers` concurrent jobs may use on this machine."""
+    n_cpus = n_cpus or os.cpu_count() or 1
+    return max(1, n_cpus // max(1, n_workers))
+
+
+def train_job(cfg_path, output_path, overrides, log_path=None, driver=None, code_path=None):
+    """
+    Train one spaCy pipeline; returns the wall time in seconds. Uses spaCy's internal train(),
+    or the resumable training driver when `driver` settings are given (see ner_driver.py).
+    `code_path` is a Python file with registered functions the config needs, imported first
+    as with `spacy train --code` (corpus_store.py for store-based fold configs).
+    Output goes to `log_path` when given.
+    """
+    def train():
+        if code_path is not None:
+            from spacy.cli._util import import_code
+            import_code(code_path)
+        if driver is None:
+            from spacy.cli.train import train as spacy_train
+            spacy_train(config_path=str(cfg_path), output_path=str(output_path), overrides=overrides)
+        else:
+            from ner_driver import train_resumable
+            train_resumable(cfg_path, output_path, overrides, stdout=sys.stdout, stderr=sys.stderr, **driver)
+
+    start = time.time()
+    if log_path is None:
+        train()
+    else:
+        with open(log_path, "w", encoding="utf-8") as log, redirect_stdout(log), redirect_stderr(log):
+            train()
+    return time.time() - start
+
+
+def run_jobs(jobs, n_workers, threads_per_worker, target=train_job, initializer=None, initargs=()):
+    """
+    Run `target(**kwargs)` for every {name: kwargs} in `jobs` in a pool of `n_workers`
+    spawned processes (each set up with `initializer(*initargs)` when given). Returns
+    {name: {"seconds": ..., "error": ...}}; a failing job does not stop the others.
+    """
+    saved_env = {var: os.environ.get(var) for var in THREAD_ENV_VARS}
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads_per_worker)
+
+    results = {}
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx, initializer=initializer,
+                                 initargs=initargs) as pool:
+            futures = {pool.submit(target, **kwargs): name for name, kwargs in jobs.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = {"seconds": future.result(), "error": None}
+                    print(f"✅ {name} finished in {results[name]['seconds']:.0f}s")
+                except Exception as e:
+                    results[name] = {"seconds": None, "error": repr(e)}
+                    print(f"❌ {name} failed: {e!r}")
+    finally:
+        for var, value in saved_env.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
+
+    return results
@@ -0,0 +1,32 @@
+# replication_src/parallel.py
+
+from concurrent.futures import FIRST_COMPLETED, wait
+
+
+# Process-pool helpers shared by the streaming workers (active_learning.py, transformer_inference.py).
+# Standard library only, so it can be imported both as a package module and from replication_src/
+# on sys.path (like config.py).
+
+
+def bounded_map(pool, fn, iterable, max_in_flight):
+    """
+    Yield `fn(item)` for every item of `iterable`, in completion order, keeping at most
+    `max_in_flight` tasks submitted to the executor `pool`, so the input is read lazily.
+    A failing task (or a broken pool) raises here; the tasks not yet started are cancelled.
+    """
+    items = iter(iterable)
+    pending = set()
+    try:
+        while True:
+            for item in items:
+                pending.add(pool.submit(fn, item))
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
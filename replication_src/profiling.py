@@ -0,0 +1,209 @@
+# replication_src/profiling.py
+
+import csv
+import functools
+import json
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Opt-in instrumentation of the extraction (find_*) and classification (classify_*) rules.
+# Every wrapped function records how often it is called, its cumulative time and how often
+# it returns something other than None. For classify_* functions the returned rule ID
+# (G1, DP1, COMIT00-22b, ...) is also counted per classification column.
+
+RULE_PREFIXES = ("find_", "classify_")
+
+
+class RuleProfiler:
+    def __init__(self, prefixes=RULE_PREFIXES):
+        self.prefixes = prefixes
+        self.calls = Counter()
+        self.hits = Counter()
+        self.seconds = Counter()
+        self.rule_hits = Counter()   # (column, rule_id) -> count
+
+    def wrap(self, func):
+        name = func.__name__
+        column = name[len("classify_"):] if name.startswith("classify_") else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.seconds[name] += time.perf_counter() - start
+            self.calls[name] += 1
+            if result is not None:
+                self.hits[name] += 1
+                if column is not None:
+                    self.rule_hits[(column, result)] += 1
+            return result
+
+        wrapper.__wrapped_rule__ = func
+        return wrapper
+
+    def instrument(self, namespace):
+        """Replace every rule function in `namespace` (e.g. globals()) with a counting wrapper."""
+        for name, obj in list(namespace.items()):
+            if (callable(obj) and name.startswith(self.prefixes)
+                    and not hasattr(obj, "__wrapped_rule__")):
+                namespace[name] = self.wrap(obj)
+
+    def summary_rows(self):
+        total = sum(self.seconds.values()) or 1.0
+        rows = []
+        for name in sorted(self.calls, key=lambda n: self.seconds[n], reverse=True):
+            calls = self.calls[name]
+            rows.append([
+                name,
+                calls,
+                self.hits[name],
+                round(self.hits[name] / calls, 6),
+                round(self.seconds[name], 6),
+                round(self.seconds[name] / calls * 1e6, 3),
+                round(self.seconds[name] / total * 100, 2),
+            ])
+        return rows
+
+    def rule_rows(self):
+        return [[column, rule_id, n] for (column, rule_id), n
+                in sorted(self.rule_hits.items(), key=lambda kv: (kv[0][0], -kv[1]))]
+
+    def write_summary(self, functions_csv, rules_csv):
+        with open(functions_csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["function", "calls", "hits", "hit_rate",
+                             "total_seconds", "mean_microseconds", "time_share_pct"])
+            writer.writerows(self.summary_rows())
+
+        with open(rules_csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["column", "rule_id", "hits"])
+            writer.writerows(self.rule_rows())
+
+
+# Lightweight stage timing for the scripts. `lap(name)` charges the time elapsed since the
+# previous lap to `name`, so a linear loop body can be split into stages without re-indenting.
+# Set STAGE_TIMINGS_DIR to make the scripts dump their timings as JSON (used by the benchmarks).
+
+class StageTimer:
+    def __init__(self):
+        self.seconds = Counter()
+        self.counts = Counter()
+        self._last = time.perf_counter()
+
+    def lap(self, name=None):
+        now = time.perf_counter()
+        if name is not None:
+            self.seconds[name] += now - self._last
+        self._last = now
+
+    def count(self, name, n=1):
+        self.counts[name] += n
+
+    def as_dict(self):
+        return {
+            "seconds": dict(self.seconds),
+            "counts": dict(self.counts),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    def merge(self, other):
+        self.seconds.update(other.seconds)
+        self.counts.update(other.counts)
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=4)
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def current_rss_mb():
+    """Current resident set size in MB, read from /proc on Linux (falls back to the peak)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * resource.getpagesize() / (1024 * 1024), 1)
+    except (OSError, AttributeError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+# Per-step instrumentation of the Transformer training loop (script 06). Every training or
+# evaluation step appends one JSON line to a step log: wall time split into data (waiting for
+# the loader and copying the batch to the device), forward, backward and optimizer, the batch
+# shape, samples/sec and memory. summarize_steps() aggregates a step log per phase, so that
+# loader stalls, padding and compute can be told apart.
+
+STEP_STAGES = ["data", "forward", "backward", "optimizer"]
+
+
+class StepLog:
+    def __init__(self, path, **context):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.context = context
+        self.file = open(self.path, "w", encoding="utf-8")
+
+    def write(self, **record):
+        record = dict(self.context, **record, rss_mb=current_rss_mb(), peak_rss_mb=peak_rss_mb())
+        self.file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def summarize_steps(path):
+    """One row per phase (train/val/test) of a step log: time per stage and its share, throughput, padding, memory."""
+    totals = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            key = (record.get("model"), record.get("fold"), record["phase"])
+            t = totals.setdefault(key, Counter())
+            t["steps"] += 1
+            t["samples"] += record["batch_size"]
+            t["tokens"] += record["tokens"]
+            t["padded_tokens"] += record["batch_size"] * record["seq_len"]
+            for stage in STEP_STAGES:
+                t[stage] += record.get(f"{stage}_s", 0.0)
+            t["peak_rss_mb"] = max(t["peak_rss_mb"], record["peak_rss_mb"] or 0)
+            t["cuda_peak_mb"] = max(t["cuda_peak_mb"], record.get("cuda_peak_mb") or 0)
+
+    rows = []
+    for (model, fold, phase), t in totals.items():
+        seconds = sum(t[stage] for stage in STEP_STAGES) or 1e-9
+        row = {"model": model, "fold": fold, "phase": phase, "steps": t["steps"], "samples": t["samples"],
+               "seconds": round(seconds, 3)}
+        for stage in STEP_STAGES:
+            row[f"{stage}_share_pct"] = round(t[stage] / seconds * 100, 2)
+        row.update({
+            "mean_step_ms": round(seconds / t["steps"] * 1000, 2),
+            "samples_per_sec": round(t["samples"] / seconds, 2),
+            "tokens_per_sec": round(t["tokens"] / seconds, 1),
+            "padding_share_pct": round((1 - t["tokens"] / max(1, t["padded_tokens"])) * 100, 2),
+            "peak_rss_mb": t["peak_rss_mb"],
+            "cuda_peak_mb": t["cuda_peak_mb"],
+        })
+        rows.append(row)
+    return rows
@@ -0,0 +1,263 @@
+# replication_src/regression.py
+
+import csv
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+from . import config
+
+
+# Golden-output regression checks for the preprocessing (01) and pipeline (05) scripts.
+# Both scripts are run end-to-end in an isolated working directory on the sample corpus,
+# and every output cell is compared with the stored golden files. The golden files are always
+# produced by the scripts of a fixed commit (the baseline, i.e. the root commit, by default),
+# checked out in a temporary git worktree, and golden.json records that commit and the
+# sha256 of every golden file, so a golden set cannot silently come from a modified pipeline.
+
+GOLDEN_DIR = config.REGRESSION_DIR / "golden"
+MANIFEST_FILE = "golden.json"
+
+SAMPLE_FILES = ["EurLex_sample.csv", "secondary_leg_def.csv"]
+SENTENCES_FILE = "EurLex_sentences.jsonl"
+ANNOTATED_FILE = "EURLEX_corpus_annotated.csv"
+
+PIPELINE_SCRIPTS = ["01_script_preprocess_eurlex.py", "05_script_pipeline_main.py"]
+
+
+def run_pipeline(work_dir, scripts=PIPELINE_SCRIPTS, extra_env=None, source_dir=None, root=config.ROOT):
+    """
+    Run the given scripts (from `root`/scripts) with all outputs redirected to `work_dir`.
+    Input is the sample corpus unless `source_dir` (EurLex*.csv + secondary_leg_def.csv) is given.
+    """
+    if source_dir is None:
+        source_dir = work_dir / "source_files"
+        source_dir.mkdir(parents=True, exist_ok=True)
+        for name in SAMPLE_FILES:
+            shutil.copy(config.SOURCE_TEXT_DIR / name, source_dir / name)
+
+    env = dict(os.environ)
+    env.update({
+        "SOURCE_TEXT_DIR": str(source_dir),
+        "CORPUS_DIR": str(work_dir / "corpus_files"),
+        "OUTPUT_FILES_DIR": str(work_dir / "output_files"),
+        "OUTPUT_TABLES_DIR": str(work_dir / "output_tables"),
+    })
+    env.update(extra_env or {})
+
+    for script in scripts:
+        print(f"\n▶ Running {script}")
+        subprocess.run([sys.executable, str(Path(root) / "scripts" / script)], env=env, cwd=root, check=True)
+
+    return {
+        SENTENCES_FILE: work_dir / "corpus_files" / SENTENCES_FILE,
+        ANNOTATED_FILE: work_dir / "output_files" / ANNOTATED_FILE,
+    }
+
+
+# --- LOADING ---
+# Rows are keyed by their id plus an occurrence counter, since one chunk can yield
+# several sentences sharing the same subsub_sentence_id.
+
+def _keyed(ids):
+    seen = Counter()
+    keys = []
+    for row_id in ids:
+        keys.append(f"{row_id}#{seen[row_id]}")
+        seen[row_id] += 1
+    return keys
+
+
+def load_sentences_jsonl(path):
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            item = json.loads(line)
+            row = {"text": item["text"]}
+            row.update({k: str(v) for k, v in item["metadata"].items()})
+            records.append(row)
+    columns = list(records[0]) if records else ["text"]
+    keys = _keyed(r.get("sub_sentence_id") for r in records)
+    return columns, dict(zip(keys, records))
+
+
+def load_annotated_csv(path):
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        records = list(reader)
+        columns = reader.fieldnames or []
+    keys = _keyed(r["subsub_sentence_id"] for r in records)
+    return columns, dict(zip(keys, records))
+
+
+LOADERS = {
+    SENTENCES_FILE: load_sentences_jsonl,
+    ANNOTATED_FILE: load_annotated_csv,
+}
+
+
+# --- COMPARISON ---
+def compare_tables(golden, new, max_examples=5):
+    """Compare two (columns, {key: row}) tables cell by cell; returns a result dict."""
+    golden_cols, golden_rows = golden
+    new_cols, new_rows = new
+
+    missing = [k for k in golden_rows if k not in new_rows]
+    extra = [k for k in new_rows if k not in golden_rows]
+    shared = [k for k in golden_rows if k in new_rows]
+
+    column_diffs = {}
+    for col in golden_cols:
+        if col not in new_cols:
+            continue
+        mismatches = [(k, golden_rows[k][col], new_rows[k][col])
+                      for k in shared if golden_rows[k][col] != new_rows[k][col]]
+        if mismatches:
+            column_diffs[col] = {"count": len(mismatches), "examples": mismatches[:max_examples]}
+
+    return {
+        "rows_golden": len(golden_rows),
+        "rows_new": len(new_rows),
+        "missing_columns": [c for c in golden_cols if c not in new_cols],
+        "extra_columns": [c for c in new_cols if c not in golden_cols],
+        "missing_rows": missing,
+        "extra_rows": extra,
+        "column_diffs": column_diffs,
+    }
+
+
+def is_identical(result):
+    return not (result["missing_columns"] or result["extra_columns"] or result["missing_rows"]
+                or result["extra_rows"] or result["column_diffs"])
+
+
+def format_report(name, result, max_rows=5):
+    lines = [f"=== {name} ===",
+             f"rows: golden {result['rows_golden']}, new {result['rows_new']}"]
+    if is_identical(result):
+        lines.append("✅ identical")
+        return "\n".join(lines)
+
+    for label in ["missing_columns", "extra_columns"]:
+        if result[label]:
+            lines.append(f"{label.replace('_', ' ')}: {', '.join(result[label])}")
+    for label in ["missing_rows", "extra_rows"]:
+        if result[label]:
+            shown = ", ".join(result[label][:max_rows])
+            more = len(result[label]) - max_rows
+            lines.append(f"{label.replace('_', ' ')} ({len(result[label])}): {shown}"
+                         + (f" ... (+{more})" if more > 0 else ""))
+    for col, diff in result["column_diffs"].items():
+        lines.append(f"❌ column '{col}': {diff['count']} cell(s) differ")
+        for key, old, new in diff["examples"]:
+            lines.append(f"     {key}: golden={old!r} new={new!r}")
+    return "\n".join(lines)
+
+
+def compare_outputs(outputs, golden_dir=GOLDEN_DIR):
+    """Compare freshly produced outputs with the golden files; returns (ok, report)."""
+    ok, header = check_manifest(golden_dir, list(outputs))
+    sections = [header]
+    for name, new_path in outputs.items():
+        golden_path = golden_dir / name
+        if not golden_path.exists():
+            sections.append(f"=== {name} ===\n⚠️ no golden file at {golden_path}")
+            ok = False
+            continue
+        load = LOADERS[name]
+        result = compare_tables(load(golden_path), load(new_path))
+        ok = ok and is_identical(result)
+        sections.append(format_report(name, result))
+    return ok, "\n\n".join(sections)
+
+
+# --- GOLDEN FILES ---
+def _git(*args, cwd=config.ROOT):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def baseline_commit():
+    """The root commit of the repository (the unmodified pipeline)."""
+    return _git("rev-list", "--max-parents=0", "HEAD").splitlines()[-1]
+
+
+def sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def golden_outputs(ref, ner_model, extra_env=None):
+    """
+    Run scripts 01 + 05 of commit `ref`, checked out in a temporary git worktree, on the sample
+    corpus; returns (commit, worktree, output paths). Remove the worktree with remove_worktree().
+    """
+    commit = _git("rev-parse", "--verify", f"{ref}^{{commit}}")
+    top = Path(_git("rev-parse", "--show-toplevel"))
+    worktree = Path(tempfile.mkdtemp(prefix="eurlex_golden_")) / "tree"
+    _git("worktree", "add", "--detach", str(worktree), commit)
+    root = worktree / config.ROOT.resolve().relative_to(top.resolve())
+
+    # older scripts load the institution NER from <root>/models_files/NER_institutions/model-last
+    model_link = root / "models_files" / "NER_institutions" / "model-last"
+    if not model_link.exists():
+        model_link.parent.mkdir(parents=True, exist_ok=True)
+        model_link.symlink_to(Path(ner_model).resolve(), target_is_directory=True)
+
+    env = dict(extra_env or {}, INSTITUTIONS_NER=str(ner_model))
+    try:
+        outputs = run_pipeline(root, extra_env=env, source_dir=_sample_dir(worktree.parent), root=root)
+    except BaseException:
+        remove_worktree(worktree)
+        raise
+    return commit, worktree, outputs
+
+
+def _sample_dir(parent):
+    source_dir = parent / "source_files"
+    source_dir.mkdir(parents=True, exist_ok=True)
+    for name in SAMPLE_FILES:
+        shutil.copy(config.SOURCE_TEXT_DIR / name, source_dir / name)
+    return source_dir
+
+
+def remove_worktree(worktree):
+    _git("worktree", "remove", "--force", str(worktree))
+    shutil.rmtree(worktree.parent, ignore_errors=True)
+
+
+def update_golden(outputs, commit, golden_dir=GOLDEN_DIR):
+    """Store the outputs of `commit` as golden files, with their checksums in golden.json."""
+    golden_dir.mkdir(parents=True, exist_ok=True)
+    for name, path in outputs.items():
+        shutil.copy(path, golden_dir / name)
+    manifest = {"commit": commit, "files": {name: sha256(golden_dir / name) for name in outputs}}
+    with open(golden_dir / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+
+
+def check_manifest(golden_dir, names):
+    """(ok, report line): golden files must match the checksums recorded when they were generated."""
+    manifest_file = golden_dir / MANIFEST_FILE
+    if not manifest_file.exists():
+        return False, f"⚠️ no {MANIFEST_FILE} in {golden_dir}: regenerate the golden files with UPDATE_GOLDEN=1"
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    changed = [name for name in names
+               if not (golden_dir / name).exists() or sha256(golden_dir / name) != manifest["files"].get(name)]
+    if changed:
+        return False, f"❌ golden file(s) changed since they were generated: {', '.join(changed)}"
+    try:
+        is_baseline = manifest["commit"] == baseline_commit()
+    except (OSError, subprocess.CalledProcessError):
+        is_baseline = None
+    note = {True: " (baseline)", False: " (not the baseline commit)", None: ""}[is_baseline]
+    return True, f"Golden files from commit {manifest['commit'][:12]}{note}"
@@ -0,0 +1,160 @@
+# replication_src/screening.py
+
+import csv
+import json
+import random
+from pathlib import Path
+
+import numpy as np
+
+
+# Screening model for the classification pipeline (script 05).
+# A spaCy textcat_multilabel (bag-of-words or small CNN) is trained to predict, from the raw
+# text of a record of EurLex_sentences.jsonl, which of the classification columns script 05
+# fills for any of its chunks (the labels are read from script 05's own output). The secondary
+# columns (del_ms2, ...) come from rules of their own, so they are labels too: a record with
+# only a secondary label is a positive. Only the
+# tokenizer and the text classifier run, so it is much cheaper than the parse + NER + rules.
+# The screening threshold is calibrated on the dev set so that at least TARGET_RECALL of the
+# records with a label keep a score (highest label probability) above it; records below the
+# threshold can skip the full pipeline (SCREEN_MODEL in script 05).
+
+PRIMARY_LABELS = [
+    "del_ms", "con_ms", "so_ms", "del_nca", "con_nca", "so_nca", "agenda",
+    "del_com", "si_com", "con_com", "del_age", "si_age", "con_age",
+]
+SECONDARY_LABELS = [
+    "del_ms2", "con_ms2", "so_ms2", "del_nca2", "con_nca2", "so_nca2",
+    "si_com2", "con_com2", "si_age2", "con_age2",
+]
+SCREEN_LABELS = PRIMARY_LABELS + SECONDARY_LABELS   # every classification column of script 05
+SCREEN_FILE = "screening.json"
+SCREENED_SUFFIX = ".screened.json"   # next to script 05's output when it ran with SCREEN_MODEL
+
+CNN_MODEL = {
+    "@architectures": "spacy.TextCatCNN.v2",
+    "exclusive_classes": False,
+    "nO": None,
+    "tok2vec": {
+        "@architectures": "spacy.HashEmbedCNN.v2",
+        "pretrained_vectors": None,
+        "width": 96,
+        "depth": 2,
+        "embed_size": 2000,
+        "window_size": 1,
+        "maxout_pieces": 3,
+        "subword_features": True,
+    },
+}
+
+
+# --- DATA ---
+def labels_by_record(annotated_csv):
+    """{sub_sentence_id: set of labels} of every record in script 05's output (a label = a non-empty cell)."""
+    labels = {}
+    with open(annotated_csv, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            found = labels.setdefault(str(row["sub_sentence_id"]), set())
+            found.update(label for label in SCREEN_LABELS if row[label])
+    return labels
+
+
+def iter_labeled_records(sentences_file, labels, exclude_celex=frozenset()):
+    """
+    (sub_sentence_id, text, set of labels) of the records of EurLex_sentences.jsonl that script 05
+    processed, without the acts in `exclude_celex` (held out for evaluation).
+    """
+    with open(sentences_file, "r", encoding="utf-8") as f:
+        for line in f:
+            item = json.loads(line)
+            record_id = str(item["metadata"]["sub_sentence_id"])
+            if record_id in labels and str(item["metadata"]["CELEX_number"]) not in exclude_celex:
+                yield record_id, item["text"], labels[record_id]
+
+
+def write_docbins(records, out_dir, dev_share=0.2, seed=42, limit=0):
+    """Write train.spacy / dev.spacy with one Doc per record and a 0/1 category per label."""
+    import spacy
+    from spacy.tokens import DocBin
+
+    nlp = spacy.blank("en")
+    records = list(records)
+    random.Random(seed).shuffle(records)
+    if limit:
+        records = records[:limit]
+    n_dev = int(len(records) * dev_share)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, part in [("dev", records[:n_dev]), ("train", records[n_dev:])]:
+        db = DocBin()
+        for _, text, labels in part:
+            doc = nlp.make_doc(text)
+            doc.cats = {label: float(label in labels) for label in SCREEN_LABELS}
+            db.add(doc)
+        db.to_disk(out_dir / f"{name}.spacy")
+    return len(records) - n_dev, n_dev
+
+
+def screen_config(out_path, arch="bow"):
+    """textcat_multilabel training config: spaCy's efficiency preset (bag-of-words) or a small CNN."""
+    from spacy.cli.init_config import init_config
+
+    cfg = init_config(lang="en", pipeline=["textcat_multilabel"], optimize="efficiency")
+    if arch == "cnn":
+        cfg["components"]["textcat_multilabel"]["model"] = CNN_MODEL
+    else:
+        cfg["components"]["textcat_multilabel"]["model"]["ngram_size"] = 2
+    cfg.to_disk(out_path)
+    return out_path
+
+
+# --- SCORING ---
+def screen_scores(nlp, texts, batch_size=256):
+    """Highest label probability of every text."""
+    return np.array([max(doc.cats.values()) for doc in nlp.pipe(texts, batch_size=batch_size)], dtype=np.float32)
+
+
+def calibrate_threshold(scores, positive, target_recall=0.99):
+    """Highest threshold keeping at least `target_recall` of the positive records (score >= threshold)."""
+    positive_scores = np.sort(scores[positive])
+    if len(positive_scores) == 0:
+        return 0.0
+    allowed_misses = int(np.floor((1 - target_recall) * len(positive_scores)))
+    return float(positive_scores[allowed_misses])
+
+
+def screened_marker(output_file):
+    return Path(output_file).with_name(Path(output_file).stem + SCREENED_SUFFIX)
+
+
+def mark_screened(output_file, model_dir, threshold, skipped):
+    """Record next to script 05's output that it was produced with a screening model (or remove a stale record)."""
+    marker = screened_marker(output_file)
+    if model_dir:
+        with open(marker, "w", encoding="utf-8") as f:
+            json.dump({"screen_model": str(model_dir), "threshold": threshold, "skipped_records": skipped}, f, indent=4)
+    elif marker.exists():
+        marker.unlink()
+
+
+def save_screening(model_dir, threshold, **stats):
+    with open(Path(model_dir) / SCREEN_FILE, "w", encoding="utf-8") as f:
+        json.dump(dict(stats, threshold=threshold), f, indent=4)
+
+
+def load_screen(model_dir):
+    """(nlp, threshold) of a calibrated screening model."""
+    import spacy
+
+    with open(Path(model_dir) / SCREEN_FILE, "r", encoding="utf-8") as f:
+        threshold = json.load(f)["threshold"]
+    return spacy.load(model_dir), threshold
+
+
+def screen_records(records, nlp, threshold, batch_size=256, skipped=None):
+    """Yield the records (dicts with a "text") scoring at or above `threshold`; counts skipped ones in `skipped`."""
+    stream = ((record["text"], record) for record in records)
+    for doc, record in nlp.pipe(stream, as_tuples=True, batch_size=batch_size):
+        if max(doc.cats.values()) >= threshold:
+            yield record
+        elif skipped is not None:
+            skipped["records"] = skipped.get("records", 0) + 1
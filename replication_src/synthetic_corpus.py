@@ -0,0 +1,101 @@
+# replication_src/synthetic_corpus.py
+
+import csv
+import random
+import re
+import sys
+
+from . import config
+from .text_utils import start_formulas, stop_formulas
+
+
+# Generator of EurLex-like CSV corpora at a controlled scale, for benchmarking.
+# Acts are assembled by recombining real sentences from authors_annotation.csv and from
+# the enacting terms of the acts in EurLex_sample.csv, wrapped in the same start/stop
+# formulas that 01_script_preprocess_eurlex.py trims on.
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.;:])\s+(?=[A-Z(])')
+
+
+def _set_csv_field_limit():
+    max_int = sys.maxsize
+    while True:
+        try:
+            csv.field_size_limit(max_int)
+            break
+        except OverflowError:
+            max_int = int(max_int / 10)
+
+
+def load_sentence_pool(source_dir=config.SOURCE_TEXT_DIR, min_length=40):
+    """Collect real provisions from the annotation set and the sample acts."""
+    _set_csv_field_limit()
+    pool = []
+
+    with open(source_dir / "authors_annotation.csv", "r", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            pool.append(row["text"])
+
+    with open(source_dir / "EurLex_sample.csv", "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            text = row["act_raw_text"]
+            for stop_formula in stop_formulas:
+                end_idx = text.find(stop_formula)
+                if end_idx != -1:
+                    text = text[:end_idx]
+                    break
+            for start_formula in start_formulas:
+                start_idx = text.find(start_formula)
+                if start_idx != -1:
+                    text = text[start_idx + len(start_formula):]
+                    break
+            pool.extend(s.strip() for s in SENTENCE_SPLIT.split(text))
+
+    return [s for s in pool if len(s) >= min_length]
+
+
+def synthetic_act(rng, pool, n_sentences, act_type):
+    header = "THE EUROPEAN PARLIAMENT AND THE COUNCIL OF THE EUROPEAN UNION,\n"
+    header += "Whereas this act is generated for benchmarking purposes.\n"
+    header += f"HAVE ADOPTED THIS {'DIRECTIVE' if act_type == 'L' else 'REGULATION'}:\n"
+
+    body = []
+    article = 1
+    for i in range(n_sentences):
+        if i % 4 == 0:
+            body.append(f"Article {article}")
+            article += 1
+        body.append(rng.choice(pool))
+
+    return header + "\n".join(body) + "\nDone at Brussels, 1 January 2000."
+
+
+def generate_eurlex_corpus(n_acts, out_dir, seed=42, sentences_per_act=(20, 60), pool=None):
+    """
+    Write a synthetic corpus of `n_acts` acts to `out_dir`:
+    - EurLex_synthetic.csv (CELEX, act_raw_text), streamed row by row
+    - secondary_leg_def.csv listing every synthetic CELEX number
+    Returns the paths of the two files.
+    """
+    rng = random.Random(seed)
+    pool = pool or load_sentence_pool()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    corpus_file = out_dir / "EurLex_synthetic.csv"
+    celex_file = out_dir / "secondary_leg_def.csv"
+
+    with open(corpus_file, "w", newline="", encoding="utf-8") as f_corpus, \
+         open(celex_file, "w", newline="", encoding="utf-8") as f_celex:
+        corpus_writer = csv.writer(f_corpus)
+        celex_writer = csv.writer(f_celex)
+        corpus_writer.writerow(["CELEX", "act_raw_text"])
+        celex_writer.writerow(["", "celex"])
+
+        for n in range(n_acts):
+            act_type = rng.choice("RL")
+            year = 1960 + n % 60
+            celex = f"3{year}{act_type}{n:06d}"
+            n_sentences = rng.randint(*sentences_per_act)
+            corpus_writer.writerow([celex, synthetic_act(rng, pool, n_sentences, act_type)])
+            celex_writer.writerow([n + 1, celex])
+
+    return corpus_file, celex_file
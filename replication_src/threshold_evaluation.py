@@ -0,0 +1,112 @@
+# replication_src/threshold_evaluation.py
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Threshold evaluation of the Transformer fold jobs (script 06) without retraining.
+# Every fold job stores its out-of-fold test probabilities next to its result file:
+#
+#   <sweep_dir>/<model>/fold_<k>_probs.npz   rows (annotation row indices), probs, trues, labels
+#
+# grid_metrics() binarises the probabilities at every threshold of a grid at once (a boolean
+# (thresholds, samples, labels) array) and derives precision, recall, F1 and MCC of all labels
+# from the confusion counts, as (thresholds, labels) arrays. Per-label thresholds are chosen on
+# the fold-averaged grid; tuned_table() reports them cross-fitted (each test fold evaluated at
+# the thresholds chosen on the other folds), so the tuned metrics are not fitted on their own fold.
+# Predictions are positive when prob > threshold, as in the 0.5 tables of script 06.
+
+METRICS = ["Precision", "Recall", "F1", "MCC"]
+
+
+def save_oof(path, rows, probs, trues, labels):
+    """Write the out-of-fold probabilities of a fold job through a temporary file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.stem}.tmp.npz")
+    np.savez(tmp, rows=np.asarray(rows), probs=np.asarray(probs, dtype=np.float32),
+             trues=np.asarray(trues, dtype=np.int8), labels=np.asarray(labels))
+    os.replace(tmp, path)
+
+
+def load_oof(path):
+    """(rows, probs, trues, labels) of a fold job."""
+    with np.load(path) as data:
+        return data["rows"], data["probs"], data["trues"].astype(bool), data["labels"].tolist()
+
+
+def threshold_grid(step=0.01):
+    return np.round(np.arange(step, 1, step), 6)
+
+
+def _ratio(num, den):
+    return np.divide(num, den, out=np.zeros_like(num, dtype=np.float64), where=den > 0)
+
+
+def grid_metrics(trues, probs, thresholds):
+    """Precision, recall, F1 and MCC of every label at every threshold: {metric: (thresholds, labels) array}."""
+    trues = np.asarray(trues, dtype=bool)
+    preds = np.asarray(probs)[None, :, :] > np.asarray(thresholds)[:, None, None]   # (thresholds, n, labels)
+    tp = (preds & trues).sum(axis=1).astype(np.float64)
+    fp = preds.sum(axis=1) - tp
+    fn = trues.sum(axis=0) - tp
+    tn = len(trues) - tp - fp - fn
+    return {
+        "Precision": _ratio(tp, tp + fp),
+        "Recall": _ratio(tp, tp + fn),
+        "F1": _ratio(2 * tp, 2 * tp + fp + fn),
+        "MCC": _ratio(tp * tn - fp * fn, np.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn))),
+    }
+
+
+def fold_grids(folds, thresholds):
+    """grid_metrics of every fold, stacked: {metric: (folds, thresholds, labels) array}."""
+    grids = [grid_metrics(trues, probs, thresholds) for _, probs, trues, _ in folds]
+    return {metric: np.stack([g[metric] for g in grids]) for metric in METRICS}
+
+
+def best_thresholds(grids, thresholds, metric="F1"):
+    """Per-label threshold maximising the fold-averaged `metric` (lowest threshold on ties)."""
+    return np.asarray(thresholds)[grids[metric].mean(axis=0).argmax(axis=0)]
+
+
+def _table(values, class_names, **extra):
+    """Fold-averaged per-label metrics in percent, sorted by label (as aggregate_folds)."""
+    table = pd.DataFrame({"Label": class_names, **extra,
+                          **{m: values[m].mean(axis=0) * 100 for m in METRICS}})
+    return table.sort_values("Label").reset_index(drop=True).round(2)
+
+
+def fixed_table(folds, class_names, threshold=0.5):
+    """The {model}_metrics.csv table at one threshold for all labels."""
+    grids = fold_grids(folds, [threshold])
+    return _table({m: grids[m][:, 0, :] for m in METRICS}, class_names)
+
+
+def tuned_table(grids, thresholds, class_names, metric="F1"):
+    """
+    {model}_metrics.csv table at per-label thresholds, cross-fitted over the folds; the
+    Threshold column is the one chosen on all folds (for use on new data).
+    """
+    thresholds = np.asarray(thresholds)
+    n_folds, _, n_labels = grids[metric].shape
+    labels = np.arange(n_labels)
+    values = {m: np.empty((n_folds, n_labels)) for m in METRICS}
+    for f in range(n_folds):
+        others = np.delete(grids[metric], f, axis=0) if n_folds > 1 else grids[metric]
+        chosen = others.mean(axis=0).argmax(axis=0)
+        for m in METRICS:
+            values[m][f] = grids[m][f, chosen, labels]
+    return _table(values, class_names, Threshold=best_thresholds(grids, thresholds, metric))
+
+
+def grid_table(grids, thresholds, class_names):
+    """Fold-averaged metrics of every (threshold, label), long format."""
+    n_thresholds, n_labels = len(thresholds), len(class_names)
+    table = pd.DataFrame({
+        "Threshold": np.repeat(thresholds, n_labels),
+        "Label": np.tile(class_names, n_thresholds),
+        **{m: grids[m].mean(axis=0).ravel() * 100 for m in METRICS},
+    })
+    return table.round(4)
@@ -0,0 +1,130 @@
+# replication_src/transformer_data.py
+
+import hashlib
+import json
+import random
+import re
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, Sampler
+
+
+# Tokenisation cache for the Transformer fine-tuning (script 06).
+# The annotation set is encoded once per tokenizer with the fast tokenizer's batch API into
+# contiguous int32 arrays, saved as .npy files and opened memory-mapped:
+#
+#   <cache_dir>/<model>_<max_len>_<texts hash>/ids.npy, mask.npy, token_type_ids.npy, lengths.npy
+#
+# Datasets are index views into these arrays, so no text is tokenised again in later epochs,
+# folds or runs. The texts hash invalidates the cache when the annotation file changes.
+#
+# Batching: LengthBucketSampler groups examples of similar token length into the same batch
+# and pad_collate cuts every batch to its longest example, so attention does not run over
+# MAX_LEN padding. Right padding with the attention mask leaves the model outputs unchanged.
+
+ARRAYS = ["ids", "mask", "token_type_ids"]
+
+
+def cache_key(model_path, max_len, texts):
+    digest = hashlib.sha1("\n".join(texts).encode("utf-8")).hexdigest()[:12]
+    return f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model_path)}_{max_len}_{digest}"
+
+
+def encode_to_cache(tokenizer, texts, max_len, out_dir, batch_size=1024):
+    """Batch-encode `texts` into memory-mapped .npy arrays of shape (len(texts), max_len)."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    arrays = {name: np.lib.format.open_memmap(out_dir / f"{name}.npy", mode="w+", dtype=np.int32,
+                                               shape=(len(texts), max_len))
+              for name in ARRAYS}
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        enc = tokenizer(batch, add_special_tokens=True, max_length=max_len, padding="max_length",
+                        truncation=True, return_token_type_ids=True, return_tensors="np")
+        arrays["ids"][start:start + len(batch)] = enc["input_ids"]
+        arrays["mask"][start:start + len(batch)] = enc["attention_mask"]
+        arrays["token_type_ids"][start:start + len(batch)] = enc.get(
+            "token_type_ids", np.zeros_like(enc["input_ids"]))
+    for array in arrays.values():
+        array.flush()
+    np.save(out_dir / "lengths.npy", arrays["mask"].sum(axis=1).astype(np.int32))
+    with open(out_dir / "meta.json", "w", encoding="utf-8") as f:
+        json.dump({"n_texts": len(texts), "max_len": max_len}, f)
+
+
+def load_token_cache(tokenizer, model_path, texts, max_len, cache_dir):
+    """Open the cached encodings of `texts` (encoding them first if needed); returns {name: memmap}."""
+    texts = [str(t) for t in texts]
+    out_dir = cache_dir / cache_key(model_path, max_len, texts)
+    if not (out_dir / "meta.json").exists():
+        print(f" Tokenising {len(texts):,} texts → {out_dir}")
+        encode_to_cache(tokenizer, texts, max_len, out_dir)
+    cache = {name: np.load(out_dir / f"{name}.npy", mmap_mode="r") for name in ARRAYS}
+    cache["lengths"] = np.load(out_dir / "lengths.npy")
+    return cache
+
+
+class CachedDataset(Dataset):
+    """Rows `indices` of a token cache, with their multilabel targets."""
+
+    def __init__(self, cache, indices, targets):
+        self.cache = cache
+        self.indices = np.asarray(indices)
+        self.targets = np.asarray(targets, dtype=np.float32)[self.indices]
+        self.lengths = np.asarray(cache["lengths"])[self.indices]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, idx):
+        row = self.indices[idx]
+        return {
+            "ids": torch.from_numpy(self.cache["ids"][row].astype(np.int64)),
+            "mask": torch.from_numpy(self.cache["mask"][row].astype(np.int64)),
+            "token_type_ids": torch.from_numpy(self.cache["token_type_ids"][row].astype(np.int64)),
+            "targets": torch.from_numpy(self.targets[idx]),
+            "length": int(self.lengths[idx]),
+        }
+
+
+class LengthBucketSampler(Sampler):
+    """
+    Batches of examples with similar token length. With shuffle, examples are shuffled, cut
+    into pools of `pool_batches` batches, sorted by length within each pool and the batches
+    are shuffled again; otherwise all examples are sorted by length.
+    """
+
+    def __init__(self, lengths, batch_size, shuffle=True, pool_batches=50, seed=0):
+        self.lengths = np.asarray(lengths)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.pool_size = batch_size * pool_batches
+        self.rng = random.Random(seed)
+
+    def __iter__(self):
+        order = list(range(len(self.lengths)))
+        if self.shuffle:
+            self.rng.shuffle(order)
+            pools = [order[i:i + self.pool_size] for i in range(0, len(order), self.pool_size)]
+        else:
+            pools = [order]
+        batches = []
+        for pool in pools:
+            pool = sorted(pool, key=lambda i: self.lengths[i])
+            batches.extend(pool[i:i + self.batch_size] for i in range(0, len(pool), self.batch_size))
+        if self.shuffle:
+            self.rng.shuffle(batches)
+        return iter(batches)
+
+    def __len__(self):
+        return (len(self.lengths) + self.batch_size - 1) // self.batch_size
+
+
+def pad_collate(batch, dynamic=True):
+    """Stack a batch; with `dynamic`, cut the padding to the longest example of the batch."""
+    out = {key: torch.stack([item[key] for item in batch]) for key in ARRAYS + ["targets"]}
+    if dynamic:
+        width = max(item["length"] for item in batch)
+        for key in ARRAYS:
+            out[key] = out[key][:, :width]
+    return out
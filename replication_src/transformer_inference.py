@@ -0,0 +1,216 @@
+# replication_src/transformer_inference.py
+
+import glob
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from parallel import bounded_map
+
+
+# Corpus-scale inference with a final Transformer classifier (script 06, FINAL_MODELS).
+# A saved classifier is a directory with
+#   model.pt          state dict of the TransformerClassifier
+#   tokenizer/        its tokenizer
+#   classifier.json   base model, label names and MAX_LEN
+# Sentences are streamed from (sharded) EurLex_sentences*.jsonl files in chunks to a pool of
+# spawned CPU workers. Each worker tokenises its chunk once, sorts it by token length, runs
+# the classifier under torch.inference_mode on batches padded to their longest sentence and
+# writes the 13 label probabilities of the chunk to parts/part_<n>.npz. Finished parts are
+# skipped on restart. The parts are finally merged, in corpus order, into one .npz with a
+# sub_sentence_id column and one float32 column per label. The workers run the PyTorch model
+# or its ONNX export (backend "onnx" / "onnx-int8", see transformer_onnx.py).
+
+META_FILE = "classifier.json"
+WEIGHTS_FILE = "model.pt"
+PARTS_DIR = "parts"
+
+
+# --- CLASSIFIER ---
+def save_classifier(model, tokenizer, labels, max_len, out_dir):
+    import torch
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    torch.save({k: v.cpu() for k, v in model.state_dict().items()}, out_dir / WEIGHTS_FILE)
+    tokenizer.save_pretrained(out_dir / "tokenizer")
+    with open(out_dir / META_FILE, "w", encoding="utf-8") as f:
+        json.dump({"model_path": model.model_name, "labels": labels, "max_len": max_len}, f, indent=4)
+    print(f"✅ Saved classifier → {out_dir}")
+
+
+def load_tokenizer(model_dir):
+    """(tokenizer, meta) of a classifier saved by save_classifier, without loading the model."""
+    from transformers import AutoTokenizer
+
+    model_dir = Path(model_dir)
+    with open(model_dir / META_FILE, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    return AutoTokenizer.from_pretrained(model_dir / "tokenizer"), meta
+
+
+def load_classifier(model_dir):
+    """(model in eval mode on CPU, tokenizer, meta) of a classifier saved by save_classifier."""
+    import torch
+    from transformer_training import TransformerClassifier
+
+    tokenizer, meta = load_tokenizer(model_dir)
+    model = TransformerClassifier(meta["model_path"], len(meta["labels"]))
+    model.load_state_dict(torch.load(Path(model_dir) / WEIGHTS_FILE, map_location="cpu", weights_only=True))
+    model.eval()
+    return model, tokenizer, meta
+
+
+# --- INPUT ---
+def shard_paths(pattern):
+    paths = sorted(glob.glob(str(pattern)))
+    if not paths:
+        raise FileNotFoundError(f"No input shards match {pattern}")
+    return paths
+
+
+def iter_sentence_chunks(paths, chunk_size):
+    """Yield (chunk number, [(sub_sentence_id, text), ...]) over all shards, in order."""
+    chunk, n = [], 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                chunk.append((str(item["metadata"].get("sub_sentence_id")), item["text"]))
+                if len(chunk) == chunk_size:
+                    yield n, chunk
+                    chunk, n = [], n + 1
+    if chunk:
+        yield n, chunk
+
+
+def tokenize_sorted(tokenizer, texts, max_len):
+    """Token ids of `texts` (no padding) and the order of the texts by token length."""
+    enc = tokenizer(texts, add_special_tokens=True, max_length=max_len, truncation=True,
+                    return_token_type_ids=True)
+    lengths = np.array([len(ids) for ids in enc["input_ids"]])
+    return enc, np.argsort(lengths, kind="stable")
+
+
+def pad_batch(enc, rows, pad_id):
+    """(ids, mask, token_type_ids) int64 tensors of `rows`, padded to the longest of them."""
+    import torch
+
+    width = max(len(enc["input_ids"][i]) for i in rows)
+    ids = torch.full((len(rows), width), pad_id, dtype=torch.long)
+    mask = torch.zeros((len(rows), width), dtype=torch.long)
+    token_type_ids = torch.zeros((len(rows), width), dtype=torch.long)
+    for r, i in enumerate(rows):
+        n = len(enc["input_ids"][i])
+        ids[r, :n] = torch.tensor(enc["input_ids"][i])
+        mask[r, :n] = 1
+        if "token_type_ids" in enc:
+            token_type_ids[r, :n] = torch.tensor(enc["token_type_ids"][i])
+    return ids, mask, token_type_ids
+
+
+def predict_texts(model, tokenizer, texts, max_len, batch_size=64):
+    """Label probabilities (len(texts) x n_labels, float32) in the order of `texts`."""
+    import torch
+
+    enc, order = tokenize_sorted(tokenizer, texts, max_len)
+    probs = None
+    with torch.inference_mode():
+        for start in range(0, len(order), batch_size):
+            rows = order[start:start + batch_size]
+            logits = model(*pad_batch(enc, rows, tokenizer.pad_token_id or 0))
+            batch_probs = torch.sigmoid(logits.float()).numpy()
+            if probs is None:
+                probs = np.empty((len(texts), batch_probs.shape[1]), dtype=np.float32)
+            probs[rows] = batch_probs
+    return probs
+
+
+# --- WORKERS ---
+_worker = {}
+
+
+def init_worker(model_dir, parts_dir, batch_size, threads, backend):
+    import torch
+    from transformer_onnx import load_backend
+
+    torch.set_num_threads(threads)
+    model, tokenizer, meta = load_backend(model_dir, backend, threads)
+    _worker.update(model=model, tokenizer=tokenizer, max_len=meta["max_len"], parts_dir=Path(parts_dir),
+                   batch_size=batch_size)
+
+
+def part_path(parts_dir, n):
+    return Path(parts_dir) / f"part_{n:06d}.npz"
+
+
+def infer_chunk(task):
+    """Predict one chunk and write it to its part file; returns the number of sentences."""
+    n, chunk = task
+    ids = [row_id for row_id, _ in chunk]
+    probs = predict_texts(_worker["model"], _worker["tokenizer"], [text for _, text in chunk],
+                          _worker["max_len"], _worker["batch_size"])
+    out = part_path(_worker["parts_dir"], n)
+    tmp = out.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, sub_sentence_id=np.array(ids), probs=probs)
+    os.replace(tmp, out)
+    return len(chunk)
+
+
+def check_chunking(parts_dir, chunking):
+    """Part files are only reused for the same model, inputs and chunk size."""
+    chunking_file = parts_dir / "chunking.json"
+    if chunking_file.exists():
+        with open(chunking_file, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        if previous != chunking:
+            raise ValueError(f"{parts_dir} holds parts of another run ({previous}); remove it to start over")
+    else:
+        with open(chunking_file, "w", encoding="utf-8") as f:
+            json.dump(chunking, f, indent=4)
+
+
+def run_inference(model_dir, paths, out_dir, n_workers=1, threads_per_worker=1, chunk_size=5000,
+                  batch_size=64, max_in_flight=None, backend="torch"):
+    """Predict every sentence of `paths` into part files under `out_dir`; returns (sentences, seconds)."""
+    parts_dir = Path(out_dir) / PARTS_DIR
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    check_chunking(parts_dir, {"model_dir": str(model_dir), "backend": backend,
+                               "inputs": [str(p) for p in paths], "chunk_size": chunk_size})
+    pending = (task for task in iter_sentence_chunks(paths, chunk_size) if not part_path(parts_dir, task[0]).exists())
+
+    n_sentences = 0
+    start = time.perf_counter()
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx, initializer=init_worker,
+                             initargs=(str(model_dir), str(parts_dir), batch_size, threads_per_worker,
+                                       backend)) as pool:
+        results = bounded_map(pool, infer_chunk, pending, max_in_flight or 2 * n_workers)
+        for n_done, n in enumerate(results, start=1):
+            n_sentences += n
+            if n_done % 20 == 0:
+                seconds = time.perf_counter() - start
+                print(f"   {n_sentences:,} sentences | {n_sentences / seconds:,.0f} sentences/sec")
+    return n_sentences, time.perf_counter() - start
+
+
+def merge_parts(out_dir, labels, out_file):
+    """Merge the part files, in corpus order, into one columnar .npz (sub_sentence_id + one column per label)."""
+    parts = sorted((Path(out_dir) / PARTS_DIR).glob("part_*.npz"))
+    ids, probs = [], []
+    for part in parts:
+        with np.load(part) as data:
+            ids.append(data["sub_sentence_id"])
+            probs.append(data["probs"])
+    probs = np.concatenate(probs) if probs else np.empty((0, len(labels)), dtype=np.float32)
+    columns = {label: np.ascontiguousarray(probs[:, j]) for j, label in enumerate(labels)}
+    np.savez(out_file, sub_sentence_id=np.concatenate(ids) if ids else np.array([], dtype=str), **columns)
+    return len(probs)
@@ -0,0 +1,117 @@
+# replication_src/transformer_onnx.py
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+# ONNX export of a saved Transformer classifier (transformer_inference.save_classifier).
+#   model.onnx        fp32 graph of TransformerClassifier.forward, dynamic batch and sequence axes
+#   model.int8.onnx   the same graph with int8 dynamic quantisation of the weights (MatMul/Gemm)
+# OnnxClassifier runs either file with ONNX Runtime behind the call interface of
+# TransformerClassifier, model(ids, mask, token_type_ids) -> logits, so predict_texts and the
+# inference workers use it unchanged. The DistilBERT branch of forward() does not use
+# token_type_ids; the exporter drops that input from the graph and the session is fed only
+# the inputs its graph declares.
+
+INPUT_NAMES = ["ids", "mask", "token_type_ids"]
+BACKEND_FILES = {"onnx": "model.onnx", "onnx-int8": "model.int8.onnx"}
+
+
+def export_onnx(model, out_path, opset=17):
+    import torch
+
+    model.eval()
+    dummy = (torch.ones((2, 16), dtype=torch.long), torch.ones((2, 16), dtype=torch.long),
+             torch.zeros((2, 16), dtype=torch.long))
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in INPUT_NAMES}
+    dynamic_axes["logits"] = {0: "batch"}
+    with torch.no_grad():
+        torch.onnx.export(model, dummy, str(out_path), input_names=INPUT_NAMES, output_names=["logits"],
+                          dynamic_axes=dynamic_axes, opset_version=opset, do_constant_folding=True)
+    return out_path
+
+
+def quantize_int8(onnx_path, out_path):
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    quantize_dynamic(str(onnx_path), str(out_path), weight_type=QuantType.QInt8)
+    return out_path
+
+
+class OnnxClassifier:
+    """ONNX Runtime session with the call interface of TransformerClassifier."""
+
+    def __init__(self, onnx_path, threads=None):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def eval(self):
+        return self
+
+    def __call__(self, ids, mask, token_type_ids):
+        import torch
+
+        feed = dict(zip(INPUT_NAMES, (ids, mask, token_type_ids)))
+        logits = self.session.run(["logits"], {name: feed[name].numpy() for name in self.input_names})[0]
+        return torch.from_numpy(logits)
+
+
+def load_backend(model_dir, backend="torch", threads=None):
+    """
+    (model, tokenizer, meta) of a saved classifier, run with PyTorch or an exported ONNX graph;
+    the ONNX backends load only the tokenizer and classifier.json besides the graph.
+    """
+    from transformer_inference import load_classifier, load_tokenizer
+
+    if backend == "torch":
+        return load_classifier(model_dir)
+    onnx_path = Path(model_dir) / BACKEND_FILES[backend]
+    if not onnx_path.exists():
+        raise FileNotFoundError(f"{onnx_path} not found; export it with scripts/script_export_onnx.py")
+    tokenizer, meta = load_tokenizer(model_dir)
+    return OnnxClassifier(onnx_path, threads), tokenizer, meta
+
+
+# --- PARITY / SPEED ---
+def label_scores(trues, probs, threshold=0.5):
+    """Per-label F1 and MCC at `threshold`."""
+    from sklearn.metrics import f1_score, matthews_corrcoef
+
+    preds = (probs > threshold).astype(int)
+    f1 = f1_score(trues, preds, average=None, zero_division=0)
+    mcc = np.array([matthews_corrcoef(trues[:, i], preds[:, i]) for i in range(trues.shape[1])])
+    return f1, mcc
+
+
+def latency(model, tokenizer, texts, max_len):
+    """Mean and 95th-percentile milliseconds of single-sentence calls."""
+    from transformer_inference import tokenize_sorted, pad_batch
+    import torch
+
+    enc, _ = tokenize_sorted(tokenizer, texts, max_len)
+    times = []
+    with torch.inference_mode():
+        for i in range(len(texts)):
+            batch = pad_batch(enc, [i], tokenizer.pad_token_id or 0)
+            start = time.perf_counter()
+            model(*batch)
+            times.append((time.perf_counter() - start) * 1000)
+    return float(np.mean(times)), float(np.percentile(times, 95))
+
+
+def throughput(model, tokenizer, texts, max_len, batch_size=64):
+    """Sentences/sec of predict_texts (tokenisation included); returns (sentences/sec, probabilities)."""
+    from transformer_inference import predict_texts
+
+    start = time.perf_counter()
+    probs = predict_texts(model, tokenizer, texts, max_len, batch_size)
+    return len(texts) / (time.perf_counter() - start), probs
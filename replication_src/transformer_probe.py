@@ -0,0 +1,141 @@
+# replication_src/transformer_probe.py
+
+import json
+import time
+from functools import partial
+
+import numpy as np
+import pandas as pd
+import torch
+from torch.utils.data import DataLoader
+
+from transformer_data import load_token_cache, CachedDataset, LengthBucketSampler, pad_collate, cache_key
+
+
+# Linear-probe screening of the encoders of script 06 (LINEAR_PROBE=1).
+# Each encoder runs once, frozen, over authors_annotation.csv. Its pooled output (the input
+# of TransformerClassifier's linear layer: the pooler output, or the [CLS] state for
+# DistilBERT) is cached as a float32 memmap:
+#
+#   <cache_dir>/<model>_<max_len>_<texts hash>/embeddings.npy
+#
+# Only the linear multilabel head is then trained, for all folds at once: one weight tensor
+# of shape (folds, hidden, labels), full-batch Adam on the fold-masked BCE loss, features
+# standardised per fold, and early stopping per fold on its validation split. The folds are
+# the (train, val, test) splits of the fine-tuning sweep.
+
+EMBEDDINGS_FILE = "embeddings.npy"
+
+
+def embed_to_cache(model_path, tokenizer, texts, max_len, cache_dir, token_cache_dir, batch_size=64):
+    """Pooled encoder outputs of `texts` as a (len(texts), hidden) memmap, computed once per model."""
+    from transformers import AutoModel
+
+    out_dir = cache_dir / cache_key(model_path, max_len, texts)
+    out_file = out_dir / EMBEDDINGS_FILE
+    if (out_dir / "embeddings.json").exists():
+        return np.load(out_file, mmap_mode="r")
+    print(f" Embedding {len(texts):,} texts → {out_dir}")
+
+    token_cache = load_token_cache(tokenizer, model_path, texts, max_len, token_cache_dir)
+    encoder = AutoModel.from_pretrained(model_path).eval()
+    dataset = CachedDataset(token_cache, np.arange(len(texts)), np.zeros((len(texts), 1)))
+    loader = DataLoader(dataset, batch_sampler=LengthBucketSampler(dataset.lengths, batch_size, shuffle=False),
+                        collate_fn=partial(pad_collate, dynamic=True))
+    distilbert = "distilbert" in model_path.lower()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    embeddings = np.lib.format.open_memmap(out_file, mode="w+", dtype=np.float32,
+                                           shape=(len(texts), encoder.config.hidden_size))
+    start = time.perf_counter()
+    with torch.inference_mode():
+        for rows, data in zip(loader.batch_sampler, loader):
+            if distilbert:
+                outputs = encoder(data["ids"], attention_mask=data["mask"], return_dict=False)
+            else:
+                outputs = encoder(data["ids"], attention_mask=data["mask"], token_type_ids=data["token_type_ids"],
+                                  return_dict=False)
+            pooled = outputs[1] if len(outputs) > 1 else outputs[0][:, 0, :]
+            embeddings[rows] = pooled.float().numpy()
+    embeddings.flush()
+    with open(out_dir / "embeddings.json", "w", encoding="utf-8") as f:
+        json.dump({"n_texts": len(texts), "hidden_size": encoder.config.hidden_size,
+                   "seconds": time.perf_counter() - start}, f)
+    return np.load(out_file, mmap_mode="r")
+
+
+def fold_masks(splits, n):
+    """Boolean (folds, n) masks of the train, val and test rows of every fold."""
+    masks = np.zeros((3, len(splits), n), dtype=bool)
+    for f, split in enumerate(splits):
+        for part, rows in enumerate(split):
+            masks[part, f, rows] = True
+    return [torch.from_numpy(m) for m in masks]
+
+
+def train_linear_heads(X, Y, splits, max_epochs=2000, lr=1e-2, weight_decay=1e-4, patience=50):
+    """
+    Train one linear multilabel head per fold, all folds at once; returns the test-fold
+    probabilities as a (folds, n, labels) array (rows outside a fold's test split are unused).
+    """
+    X = torch.as_tensor(np.asarray(X), dtype=torch.float32)
+    Y = torch.as_tensor(np.asarray(Y), dtype=torch.float32)
+    train, val, _ = fold_masks(splits, len(X))
+    n_folds, hidden, n_labels = len(splits), X.shape[1], Y.shape[1]
+
+    # standardise with the statistics of each fold's training rows
+    w = train.float() / train.sum(dim=1, keepdim=True)
+    mean = w @ X
+    std = (w @ X ** 2 - mean ** 2).clamp_min(1e-6).sqrt()
+    Xf = (X.unsqueeze(0) - mean.unsqueeze(1)) / std.unsqueeze(1)          # (folds, n, hidden)
+
+    weights = torch.zeros((n_folds, hidden, n_labels), requires_grad=True)
+    bias = torch.zeros((n_folds, 1, n_labels), requires_grad=True)
+    optimizer = torch.optim.Adam([weights, bias], lr=lr, weight_decay=weight_decay)
+    loss_fn = torch.nn.BCEWithLogitsLoss(reduction="none")
+
+    best_val = torch.full((n_folds,), float("inf"))
+    best_weights, best_bias = weights.detach().clone(), bias.detach().clone()
+    since_best = torch.zeros(n_folds, dtype=torch.long)
+    for _ in range(max_epochs):
+        optimizer.zero_grad()
+        losses = loss_fn(torch.bmm(Xf, weights) + bias, Y.expand(n_folds, -1, -1)).mean(dim=2)   # (folds, n)
+
+        # the validation loss is that of the current weights: snapshot them before the step
+        with torch.no_grad():
+            val_loss = (losses.detach() * val).sum(dim=1) / val.sum(dim=1)
+            improved = val_loss < best_val
+            best_val = torch.where(improved, val_loss, best_val)
+            best_weights[improved] = weights.detach()[improved]
+            best_bias[improved] = bias.detach()[improved]
+            since_best = torch.where(improved, torch.zeros_like(since_best), since_best + 1)
+        if bool((since_best >= patience).all()):
+            break
+
+        train_loss = (losses * train).sum(dim=1) / train.sum(dim=1)
+        train_loss.sum().backward()
+        optimizer.step()
+
+    with torch.no_grad():
+        return torch.sigmoid(torch.bmm(Xf, best_weights) + best_bias).numpy()
+
+
+def probe_metrics(probs, Y, splits, class_names, threshold=0.5):
+    """Per-label precision/recall/F1/MCC averaged over the test folds, in percent (as {model}_metrics.csv)."""
+    from sklearn.metrics import precision_score, recall_score, f1_score, matthews_corrcoef
+
+    Y = np.asarray(Y, dtype=int)
+    fold_metrics = []
+    for f, (_, _, test_idx) in enumerate(splits):
+        trues = Y[test_idx]
+        preds = (probs[f, test_idx] > threshold).astype(int)
+        fold_metrics.append(pd.DataFrame({
+            "Label": class_names,
+            "Precision": precision_score(trues, preds, average=None, zero_division=0),
+            "Recall": recall_score(trues, preds, average=None, zero_division=0),
+            "F1": f1_score(trues, preds, average=None, zero_division=0),
+            "MCC": [matthews_corrcoef(trues[:, i], preds[:, i]) for i in range(len(class_names))],
+        }))
+    all_metrics = pd.concat(fold_metrics).groupby("Label").mean().reset_index()
+    all_metrics[["Precision", "Recall", "F1", "MCC"]] *= 100
+    return all_metrics.round(2)
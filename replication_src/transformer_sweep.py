@@ -0,0 +1,243 @@
+# replication_src/transformer_sweep.py
+
+import os
+import random
+import time
+from functools import partial
+from pathlib import Path
+
+from profiling import StepLog
+
+# Model x fold sweep of the Transformer fine-tuning (script 06).
+# Every (model, fold) is an independent job: it rebuilds its fold split (same KFold seed for
+# all jobs), trains, evaluates on the test fold and writes the per-label metrics to
+#   <sweep_dir>/<model>/fold_<k>.csv
+# through a temporary file, so a result file is either complete or absent. Jobs with a result
+# file are skipped, so an interrupted sweep resumes where it stopped, and the metrics tables
+# are aggregated from the result files. Jobs run in-process or, with several workers, in
+# spawned processes (ner_training.run_jobs), each worker pinned to its own set of CPU cores.
+# Every job also writes its per-step timings to <sweep_dir>/<model>/fold_<k>_steps.jsonl and
+# its test probabilities to fold_<k>_probs.npz (threshold tuning without retraining).
+# torch, numpy, pandas and sklearn are imported inside the job functions, so a spawned worker is
+# pinned to its cores (pin_worker) before torch starts its thread pools.
+
+RESULT_COLUMNS = ["Label", "Precision", "Recall", "F1", "MCC"]
+
+
+def fold_result_path(sweep_dir, model_name, fold):
+    return Path(sweep_dir) / model_name / f"fold_{fold}.csv"
+
+
+def step_log_path(result_path):
+    """Per-step timings of a fold job (profiling.StepLog), next to its result file."""
+    return result_path.with_name(f"{result_path.stem}_steps.jsonl")
+
+
+def oof_path(result_path):
+    """Test-fold probabilities of a fold job (threshold_evaluation.save_oof), next to its result file."""
+    return result_path.with_name(f"{result_path.stem}_probs.npz")
+
+
+# --- CORE PARTITIONING ---
+def core_slots(n_workers):
+    """Split the CPU cores available to this process into `n_workers` disjoint sets."""
+    cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count() or 1))
+    per_worker = max(1, len(cores) // n_workers)
+    return [cores[i * per_worker:(i + 1) * per_worker] or cores for i in range(n_workers)]
+
+
+def pin_worker(slots):
+    """Pool initializer: take one core set from the `slots` queue and pin this worker to it."""
+    cores = slots.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+
+
+def run_sweep(jobs, n_workers):
+    """Run the fold jobs in `n_workers` spawned processes, one core set per worker."""
+    import multiprocessing
+    from ner_training import run_jobs
+
+    slots = core_slots(n_workers)
+    queue = multiprocessing.get_context("spawn").Queue()
+    for cores in slots:
+        queue.put(cores)
+    threads = len(slots[0])
+    for kwargs in jobs.values():
+        kwargs["settings"] = dict(kwargs["settings"], profile=dict(kwargs["settings"]["profile"], num_threads=threads))
+    print(f" {len(jobs)} fold job(s) on {n_workers} worker(s) × {threads} core(s)")
+    return run_jobs(jobs, n_workers, threads, target=fold_job, initializer=pin_worker, initargs=(queue,))
+
+
+# --- DATA ---
+def load_annotations(annotation_file, quick_test=False, seed=42):
+    """authors_annotation.csv as (texts, binary targets, class names)."""
+    import pandas as pd
+
+    df = pd.read_csv(annotation_file)
+    class_names = df.columns.tolist()[2:]
+    if quick_test:
+        df = df.sample(100, random_state=seed).reset_index(drop=True)
+    targets = (df.iloc[:, 2:] > 0).astype(int).values.tolist()  # binarize any non-zero to 1
+    return df["text"].astype(str).tolist(), targets, class_names
+
+
+def make_loader(dataset, batch_size, shuffle, settings):
+    from torch.utils.data import DataLoader
+    from transformer_data import LengthBucketSampler, pad_collate
+
+    collate = partial(pad_collate, dynamic=settings["dynamic_padding"])
+    if settings["length_bucketing"]:
+        sampler = LengthBucketSampler(dataset.lengths, batch_size, shuffle=shuffle, seed=settings["seed"])
+        return DataLoader(dataset, batch_sampler=sampler, collate_fn=collate)
+    return DataLoader(dataset, batch_size=batch_size, shuffle=shuffle, collate_fn=collate)
+
+
+def fold_splits(n_texts, num_folds, seed):
+    """(train, val, test) row indices of every fold, as in the original script 06 loop."""
+    import numpy as np
+    from sklearn.model_selection import KFold, train_test_split
+
+    kf = KFold(n_splits=num_folds, shuffle=True, random_state=seed)
+    splits = []
+    for train_idx, test_idx in kf.split(np.arange(n_texts)):
+        train_idx, val_idx = train_test_split(train_idx, test_size=0.2, random_state=seed)
+        splits.append((train_idx, val_idx, test_idx))
+    return splits
+
+
+def final_split(n_texts, seed):
+    """(train, val) row indices of the final model; val (20%) is only used for early stopping."""
+    from sklearn.model_selection import train_test_split
+
+    return train_test_split(list(range(n_texts)), test_size=0.2, random_state=seed)
+
+
+# --- TRAINING ---
+def seed_everything(seed):
+    import numpy as np
+    import torch
+
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+
+def fit(model_path, num_labels, train_loader, val_loader, settings, label, step_log=None):
+    """Train a TransformerClassifier with early stopping on the validation loss; returns (model, train_model)."""
+    import torch
+    from transformer_training import TransformerClassifier, train_one_epoch, validate, prepare_model
+
+    profile = settings["profile"]
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = TransformerClassifier(model_path, num_labels).to(device)
+    optimizer = torch.optim.Adam(model.parameters(), lr=settings["learning_rate"])
+    train_model = prepare_model(model, profile)
+
+    best_val_loss = float("inf")
+    patience, counter = 2, 0
+    epochs = settings["epochs"]
+    for epoch in range(epochs):
+        train_loss, tokens_per_sec = train_one_epoch(train_model, train_loader, optimizer, device, profile,
+                                                     step_log=step_log, epoch=epoch + 1)
+        val_loss, _, _ = validate(train_model, val_loader, device, profile, step_log=step_log, epoch=epoch + 1)
+        print(f"{label} | Epoch {epoch+1}/{epochs} | Train {train_loss:.4f} | "
+              f"Val {val_loss:.4f} | {tokens_per_sec:.0f} tokens/s")
+
+        if val_loss < best_val_loss:
+            best_val_loss = val_loss
+            counter = 0
+        else:
+            counter += 1
+        if counter >= patience:
+            print("Early stopping.")
+            break
+    return model, train_model
+
+
+def fold_job(model_name, model_path, fold, settings, result_path):
+    """Train and evaluate one (model, fold); writes its per-label metrics to `result_path`."""
+    import numpy as np
+    import pandas as pd
+    import torch
+    from transformers import AutoTokenizer
+    from transformer_data import load_token_cache, CachedDataset
+    from transformer_training import validate, apply_threads
+    from threshold_evaluation import grid_metrics, save_oof
+
+    start = time.perf_counter()
+    profile = settings["profile"]
+    apply_threads(profile)
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    seed_everything(settings["seed"])
+
+    texts, targets, class_names = load_annotations(settings["annotation_file"], settings["quick_test"],
+                                                   settings["seed"])
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    token_cache = load_token_cache(tokenizer, model_path, texts, settings["max_len"], settings["token_cache_dir"])
+    train_idx, val_idx, test_idx = fold_splits(len(texts), settings["num_folds"], settings["seed"])[fold - 1]
+
+    train_loader = make_loader(CachedDataset(token_cache, train_idx, targets), settings["train_batch_size"],
+                               True, settings)
+    val_loader = make_loader(CachedDataset(token_cache, val_idx, targets), settings["valid_batch_size"],
+                             False, settings)
+    test_loader = make_loader(CachedDataset(token_cache, test_idx, targets), settings["valid_batch_size"],
+                              False, settings)
+
+    with StepLog(step_log_path(result_path), model=model_name, fold=fold) as step_log:
+        _, train_model = fit(model_path, len(class_names), train_loader, val_loader, settings,
+                             f"{model_name} fold {fold}", step_log)
+        test_loss, preds, trues = validate(train_model, test_loader, device, profile, step_log=step_log,
+                                           phase="test")
+    # test rows in the order the loader yielded them (length bucketing sorts them)
+    rows = test_idx[np.concatenate([list(batch) for batch in test_loader.batch_sampler])]
+    save_oof(oof_path(result_path), rows, preds, trues, class_names)
+
+    metrics = grid_metrics(trues, preds, [0.5])
+    fold_metrics = pd.DataFrame({"Label": class_names, **{m: metrics[m][0] for m in RESULT_COLUMNS[1:]}})
+    result_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = result_path.with_suffix(".tmp")
+    fold_metrics.to_csv(tmp, index=False)
+    os.replace(tmp, result_path)
+    return time.perf_counter() - start
+
+
+def final_job(model_name, model_path, settings, out_dir):
+    """
+    Train the final classifier on all annotations (20% held out for early stopping, as in the
+    folds) and save it to `out_dir` (see transformer_inference.save_classifier).
+    """
+    from transformers import AutoTokenizer
+    from transformer_data import load_token_cache, CachedDataset
+    from transformer_training import apply_threads
+    from transformer_inference import save_classifier
+
+    start = time.perf_counter()
+    apply_threads(settings["profile"])
+    seed_everything(settings["seed"])
+
+    texts, targets, class_names = load_annotations(settings["annotation_file"], settings["quick_test"],
+                                                   settings["seed"])
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    token_cache = load_token_cache(tokenizer, model_path, texts, settings["max_len"], settings["token_cache_dir"])
+    train_idx, val_idx = final_split(len(texts), settings["seed"])
+
+    train_loader = make_loader(CachedDataset(token_cache, train_idx, targets), settings["train_batch_size"],
+                               True, settings)
+    val_loader = make_loader(CachedDataset(token_cache, val_idx, targets), settings["valid_batch_size"],
+                             False, settings)
+    with StepLog(Path(out_dir) / "steps.jsonl", model=model_name, fold="final") as step_log:
+        model, _ = fit(model_path, len(class_names), train_loader, val_loader, settings, f"{model_name} final",
+                       step_log)
+    save_classifier(model, tokenizer, class_names, settings["max_len"], out_dir)
+    return time.perf_counter() - start
+
+
+# --- AGGREGATION ---
+def aggregate_folds(result_paths):
+    """Mean per-label metrics over the folds, in percent (the {model}_metrics.csv table)."""
+    import pandas as pd
+
+    all_metrics = pd.concat(pd.read_csv(p) for p in result_paths).groupby("Label").mean().reset_index()
+    all_metrics[RESULT_COLUMNS[1:]] *= 100
+    return all_metrics.round(2)
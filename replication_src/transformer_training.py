@@ -0,0 +1,189 @@
+# replication_src/transformer_training.py
+
+import os
+import time
+from contextlib import nullcontext
+
+import numpy as np
+import torch
+from torch import nn
+from transformers import AutoModel
+
+
+# Transformer classifier and training loop of script 06, with a CPU training profile.
+# The profile is read from the environment (all off by default, i.e. the original fp32 loop):
+#   NUM_THREADS / INTEROP_THREADS   torch intra-/inter-op threads (0 = torch default)
+#   BF16                            bfloat16 autocast on CPU: 1, 0 or "auto" (only where the
+#                                   CPU has native bf16 instructions, avx512_bf16 or amx_bf16)
+#   GRAD_ACCUM_STEPS                optimizer step every n batches (effective batch = n x batch size)
+#   TORCH_COMPILE                   torch.compile the model (dynamic shapes, for dynamic padding)
+
+
+class TransformerClassifier(nn.Module):
+    def __init__(self, model_name, num_labels):
+        super().__init__()
+        self.model_name = model_name
+        self.transformer = AutoModel.from_pretrained(model_name)
+        self.dropout = nn.Dropout(0.3)
+        hidden_size = self.transformer.config.hidden_size
+        self.classifier = nn.Linear(hidden_size, num_labels)
+
+    def forward(self, ids, mask, token_type_ids):
+        if "distilbert" in self.model_name.lower():
+            outputs = self.transformer(ids, attention_mask=mask, return_dict=False)
+        else:
+            outputs = self.transformer(ids, attention_mask=mask, token_type_ids=token_type_ids, return_dict=False)
+        pooled_output = outputs[1] if len(outputs) > 1 else outputs[0][:, 0, :]
+        output = self.dropout(pooled_output)
+        return self.classifier(output)
+
+
+def loss_fn(outputs, targets):
+    return nn.BCEWithLogitsLoss()(outputs, targets)
+
+
+# --- CPU PROFILE ---
+def bf16_supported():
+    """True when the CPU has native bfloat16 instructions (Linux /proc/cpuinfo flags)."""
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
+
+
+def cpu_profile_settings():
+    """CPU training profile from the environment."""
+    bf16 = os.getenv("BF16", "0")
+    return {
+        "num_threads": int(os.getenv("NUM_THREADS", 0)),
+        "interop_threads": int(os.getenv("INTEROP_THREADS", 0)),
+        "bf16": bf16_supported() if bf16 == "auto" else bf16 == "1",
+        "grad_accum": max(1, int(os.getenv("GRAD_ACCUM_STEPS", 1))),
+        "compile": os.getenv("TORCH_COMPILE", "0") == "1",
+    }
+
+
+def apply_threads(profile):
+    """Set torch's thread pools; call before any model is built (inter-op threads can be set only once)."""
+    if profile["num_threads"]:
+        torch.set_num_threads(profile["num_threads"])
+    if profile["interop_threads"] and profile["interop_threads"] != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(profile["interop_threads"])
+        except RuntimeError:
+            print(f"⚠️ Inter-op threads already fixed at {torch.get_num_interop_threads()}")
+
+
+def autocast(profile, device):
+    if profile["bf16"] and device == "cpu":
+        return torch.autocast("cpu", dtype=torch.bfloat16)
+    return nullcontext()
+
+
+def prepare_model(model, profile):
+    """The model to call in the training loop (compiled when TORCH_COMPILE is on)."""
+    if profile["compile"]:
+        return torch.compile(model, dynamic=True)
+    return model
+
+
+def describe(profile):
+    return (f"threads {profile['num_threads'] or torch.get_num_threads()} | "
+            f"bf16 {'on' if profile['bf16'] else 'off'} | grad accum {profile['grad_accum']} | "
+            f"compile {'on' if profile['compile'] else 'off'}")
+
+
+# --- TRAINING LOOP ---
+def sync(device):
+    """Wait for queued CUDA kernels, so that step timings are not charged to the wrong stage."""
+    if device == "cuda":
+        torch.cuda.synchronize()
+
+
+def cuda_peak_mb(device):
+    return round(torch.cuda.max_memory_allocated() / (1024 * 1024), 1) if device == "cuda" else None
+
+
+def train_one_epoch(model, loader, optimizer, device, profile, max_steps=None, step_log=None, epoch=None):
+    """
+    Returns the mean loss and the effective (non-padding) tokens/sec of the epoch. With a
+    `step_log` (profiling.StepLog), every step is logged with its data/forward/backward/optimizer time.
+    """
+    model.train()
+    total_loss = 0
+    n_tokens = 0
+    n_batches = min(len(loader), max_steps or len(loader))
+    accum = profile["grad_accum"]
+    start = last = time.perf_counter()
+    optimizer.zero_grad()
+    for step, data in enumerate(loader, 1):
+        ids = data["ids"].to(device)
+        mask = data["mask"].to(device)
+        token_type_ids = data["token_type_ids"].to(device)
+        targets = data["targets"].to(device)
+        sync(device)
+        t_data = time.perf_counter()
+
+        with autocast(profile, device):
+            outputs = model(ids, mask, token_type_ids)
+        loss = loss_fn(outputs.float(), targets)
+        sync(device)
+        t_forward = time.perf_counter()
+
+        (loss / accum).backward()
+        sync(device)
+        t_backward = time.perf_counter()
+
+        if step % accum == 0 or step == n_batches:
+            optimizer.step()
+            optimizer.zero_grad()
+        sync(device)
+        t_optimizer = time.perf_counter()
+
+        total_loss += loss.item()
+        tokens = int(data["mask"].sum())
+        n_tokens += tokens
+        if step_log is not None:
+            step_log.write(phase="train", epoch=epoch, step=step, batch_size=len(ids), seq_len=ids.shape[1],
+                           tokens=tokens, data_s=t_data - last, forward_s=t_forward - t_data,
+                           backward_s=t_backward - t_forward, optimizer_s=t_optimizer - t_backward,
+                           samples_per_sec=len(ids) / (t_optimizer - last), loss=loss.item(),
+                           cuda_peak_mb=cuda_peak_mb(device))
+        last = time.perf_counter()
+        if step == n_batches:
+            break
+    return total_loss / n_batches, n_tokens / (time.perf_counter() - start)
+
+
+def validate(model, loader, device, profile, step_log=None, phase="val", epoch=None):
+    model.eval()
+    total_loss = 0
+    preds, trues = [], []
+    last = time.perf_counter()
+    with torch.no_grad():
+        for step, data in enumerate(loader, 1):
+            ids = data["ids"].to(device)
+            mask = data["mask"].to(device)
+            token_type_ids = data["token_type_ids"].to(device)
+            targets = data["targets"].to(device)
+            sync(device)
+            t_data = time.perf_counter()
+
+            with autocast(profile, device):
+                outputs = model(ids, mask, token_type_ids)
+            outputs = outputs.float()
+            loss = loss_fn(outputs, targets)
+            total_loss += loss.item()
+            preds.append(torch.sigmoid(outputs).cpu().numpy())
+            trues.append(targets.cpu().numpy())
+            t_forward = time.perf_counter()
+
+            if step_log is not None:
+                step_log.write(phase=phase, epoch=epoch, step=step, batch_size=len(ids), seq_len=ids.shape[1],
+                               tokens=int(data["mask"].sum()), data_s=t_data - last, forward_s=t_forward - t_data,
+                               samples_per_sec=len(ids) / (t_forward - last), loss=loss.item(),
+                               cuda_peak_mb=cuda_peak_mb(device))
+            last = time.perf_counter()
+    return total_loss / len(loader), np.vstack(preds), np.vstack(trues)
@@ -8,6 +8,7 @@ from tqdm import tqdm
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
 import config
 from text_utils import *
+from profiling import StageTimer
 
 # safely increase CSV field size limit (Windows fix)
 max_int = sys.maxsize
@@ -21,6 +22,9 @@ while True:
 nlp = spacy.load("en_core_web_lg")
 nlp.max_length = 2_000_000
 
+# stage timings are written only when STAGE_TIMINGS_DIR is set (see script_benchmark.py)
+timer = StageTimer()
+
 print("✅ Environment ready")
 print("ROOT:", config.ROOT)
 print("SOURCE_TEXT_DIR:", config.SOURCE_TEXT_DIR)
@@ -42,8 +46,10 @@ for f in csv_files:
     print("   -", f)
 
 # merge into one DataFrame
+timer.lap()
 df_list = [pd.read_csv(f) for f in csv_files]
 eurlex_df = pd.concat(df_list, ignore_index=True)
+timer.lap("io")
 
 print("✅ Merged DataFrame shape:", eurlex_df.shape)
 print("✅ Columns:", list(eurlex_df.columns))
@@ -72,6 +78,7 @@ output_file = config.CORPUS_DIR / "EurLex_sentences.jsonl"
 sentences = []
 
 print(f"\n⏳ Processing {len(eurlex_df)} texts with spaCy...")
+timer.lap()
 
 for idx, row in tqdm(eurlex_df.iterrows(), total=len(eurlex_df)):
     celex = str(row["CELEX"])
@@ -80,6 +87,7 @@ for idx, row in tqdm(eurlex_df.iterrows(), total=len(eurlex_df)):
     # process only CELEX numbers that belong to secondary legislation
     if celex not in celex_numbers_secondary_leg:
         continue
+    timer.count("acts")
 
     # --- trim text after stop formulas ---
     for stop_formula in stop_formulas:
@@ -159,6 +167,9 @@ for idx, row in tqdm(eurlex_df.iterrows(), total=len(eurlex_df)):
         else:
             continue
 
+timer.lap("preprocessing")
+timer.count("sentences", len(sentences))
+
 # --- write output ---
 if sentences:
     with jsonlines.open(output_file, "w") as writer:
@@ -166,3 +177,7 @@ if sentences:
     print(f"✅ Wrote {len(sentences)} sentences to {output_file}")
 else:
     print("⚠️ No sentences extracted.")
+timer.lap("io")
+
+if os.getenv("STAGE_TIMINGS_DIR"):
+    timer.write_json(Path(os.getenv("STAGE_TIMINGS_DIR")) / "01_script_preprocess_eurlex.json")
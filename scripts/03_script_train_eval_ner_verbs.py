@@ -1,14 +1,14 @@
 # scripts/03_script_train_eval_ner_verbs.py
-import sys, os, json, csv, spacy
+import sys, os, json, csv
 from pathlib import Path
-from spacy.training import Example
-from spacy.cli.train import train as spacy_train
-from spacy.scorer import Scorer
 from tabulate import tabulate
 
 # --- LOCAL IMPORTS ---
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
 import config
+from ner_evaluation import evaluate_ner
+from ner_training import train_job
+from ner_driver import driver_settings
 
 # === PARAMETERS ===
 base_path = config.MODELS_DIR / "NER_validation" / "NER_verbs"
@@ -22,6 +22,14 @@ output_dir = base_path
 all_scores_path = base_path / "scores"
 all_scores_path.mkdir(parents=True, exist_ok=True)
 
+# evaluation batches for nlp.pipe
+EVAL_BATCH_SIZE = int(os.getenv("EVAL_BATCH_SIZE", 256))
+EVAL_PROCESSES = int(os.getenv("EVAL_PROCESSES", 1))
+EVAL_SOURCE = os.getenv("EVAL_SOURCE", "jsonl")   # "jsonl" or "docbin" (dev.spacy)
+
+# TRAIN_DRIVER=1: checkpoints, resume, plateau early stopping and time budget (ner_driver.py)
+DRIVER = driver_settings()
+
 # === TRAIN MODEL ===
 def train_model():
     overrides = {
@@ -30,41 +38,16 @@ def train_model():
     }
 
     print("\n Training NER_verbs model ...")
-    spacy_train(config_path=str(cfg_path), output_path=str(output_dir), overrides=overrides)
+    train_job(cfg_path, output_dir, overrides, driver=DRIVER)
     print("✅ Training complete for NER_verbs")
 
 # === EVALUATE MODEL ===
 def evaluate_model():
     model_dir = output_dir / "model-last"
-    jsonl_file = next(base_path.glob("verbs_annotated_20_perc.jsonl"))
-    print(f"Evaluating model on {jsonl_file.name}")
-
-    # Load JSONL evaluation data
-    TEST_DATA = []
-    with open(jsonl_file, "r", encoding="utf-8") as f:
-        for line in f:
-            data = json.loads(line)
-            text = data["text"]
-            spans = data["spans"]
-            entities = [(s["start"], s["end"], s["label"]) for s in spans]
-            TEST_DATA.append((text, {"entities": entities}))
+    gold_file = dev_file if EVAL_SOURCE == "docbin" else next(base_path.glob("verbs_annotated_20_perc.jsonl"))
+    print(f"Evaluating model on {gold_file.name}")
 
-    # Evaluate
-    nlp = spacy.load(model_dir)
-    scorer = Scorer()
-    examples = []
-    for text, annotations in TEST_DATA:
-        doc_pred = nlp(text)
-        example = Example.from_dict(doc_pred, annotations)
-        examples.append(example)
-
-    scores = scorer.score_spans(examples, "ents")
-    overall = {
-        "ents_p": scores["ents_p"],
-        "ents_r": scores["ents_r"],
-        "ents_f": scores["ents_f"],
-    }
-    per_label = scores["ents_per_type"]
+    overall, per_label = evaluate_ner(model_dir, gold_file, EVAL_BATCH_SIZE, EVAL_PROCESSES)
 
     # Save results
     out_file = all_scores_path / "validation_scores.json"
@@ -7,14 +7,27 @@ Train two Named Entity Recognition (NER) models:
 Each model is trained using its own config, train, and dev files,
 and saved in the specified output directory.
 
-Note:  the script uses spaCy's internal train() function
+The two models are independent and are trained concurrently on CPU, each in its own
+process with half of the cores (see replication_src/ner_training.py). Models that already
+finished training (model-last saved) are not retrained unless RETRAIN=1, so an interrupted
+run only repeats the unfinished model. A combined summary with training time and final dev
+scores is printed and saved to training_summary.json.
+
+Note:  the script uses spaCy's internal train() function, or the resumable training
+       driver of replication_src/ner_driver.py with TRAIN_DRIVER=1
 
 """
 
 import os
-import spacy
-from spacy.cli.train import train as spacy_train
+import sys
+import json
 from pathlib import Path
+from tabulate import tabulate
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+from ner_training import run_jobs, thread_budget
+from ner_driver import driver_settings
 
 
 # ============================================================
@@ -38,34 +51,47 @@ MODELS = {
     },
 }
 
+RETRAIN = os.getenv("RETRAIN", "0") == "1"          # retrain models that already finished
+TRAIN_WORKERS = int(os.getenv("TRAIN_WORKERS", len(MODELS)))
+THREADS_PER_WORKER = int(os.getenv("THREADS_PER_WORKER", thread_budget(TRAIN_WORKERS)))
+SUMMARY_FILE = MODELS_DIR / "training_summary.json"
+
+# TRAIN_DRIVER=1: step checkpoints, resume from the last checkpoint, plateau early stopping
+# and a time budget per model (see replication_src/ner_driver.py)
+DRIVER = driver_settings()
+if DRIVER and RETRAIN:
+    DRIVER["resume"] = False
+
 
 # ============================================================
-# -------------------- TRAIN FUNCTION -------------------------
+# -------------------- TRAINING JOBS --------------------------
 # ============================================================
-def train_spacy_model(name: str, cfg_path: Path, train_path: Path, dev_path: Path, output_path: Path, use_gpu: bool = True):
-    """Train a spaCy NER model using spaCy's internal CLI API (safe for 'My Drive')."""
-    print(f"\n Training {name} ...")
-
-    overrides = {
-        "paths.train": str(train_path.resolve()),
-        "paths.dev": str(dev_path.resolve()),
+def is_trained(output_path: Path):
+    return (output_path / "model-last" / "meta.json").exists()
+
+
+def training_job(paths: dict):
+    paths["output"].mkdir(parents=True, exist_ok=True)
+    return {
+        "cfg_path": paths["config"].resolve(),
+        "output_path": paths["output"].resolve(),
+        "overrides": {
+            "paths.train": str(paths["train"].resolve()),
+            "paths.dev": str(paths["dev"].resolve()),
+        },
+        "log_path": paths["output"] / "training.log",
+        "driver": DRIVER,
     }
 
-    if use_gpu and spacy.prefer_gpu():
-        overrides["gpu_id"] = 0
-        print(" Using GPU (if available).")
-    else:
-        print(" Training on CPU.")
 
-    try:
-        spacy_train(
-            config_path=str(cfg_path.resolve()),
-            output_path=str(output_path.resolve()),
-            overrides=overrides,
-        )
-        print(f"✅ {name} training complete.\n→ Saved to: {output_path}")
-    except Exception as e:
-        print(f"❌ Training failed for {name}: {e}")
+def dev_scores(output_path: Path):
+    """Final dev scores recorded by spaCy in the meta.json of the best model."""
+    meta_file = output_path / "model-best" / "meta.json"
+    if not meta_file.exists():
+        return {}
+    with open(meta_file, "r", encoding="utf-8") as f:
+        performance = json.load(f).get("performance", {})
+    return {k: performance.get(k) for k in ["ents_p", "ents_r", "ents_f"]}
 
 
 # ============================================================
@@ -74,14 +100,41 @@ def train_spacy_model(name: str, cfg_path: Path, train_path: Path, dev_path: Pat
 if __name__ == "__main__":
     print("\n=== NER Model Training Script ===")
 
-    for model_name, paths in MODELS.items():
-        train_spacy_model(
-            name=model_name,
-            cfg_path=paths["config"],
-            train_path=paths["train"],
-            dev_path=paths["dev"],
-            output_path=paths["output"],
-            use_gpu=True,
-        )
-
+    # with the driver, every model is submitted: it resumes from its checkpoint or returns if finished
+    jobs = {name: training_job(paths) for name, paths in MODELS.items()
+            if RETRAIN or DRIVER or not is_trained(paths["output"])}
+    for name in MODELS:
+        if name not in jobs:
+            print(f"✅ {name} already trained → {MODELS[name]['output']} (set RETRAIN=1 to retrain)")
+
+    results = {}
+    if jobs:
+        print(f"\n Training {', '.join(jobs)} on CPU with {TRAIN_WORKERS} worker(s) x {THREADS_PER_WORKER} thread(s)")
+        print(" Training logs: <model output>/training.log")
+        results = run_jobs(jobs, TRAIN_WORKERS, THREADS_PER_WORKER)
+
+    summary = {}
+    for name, paths in MODELS.items():
+        result = results.get(name, {"seconds": None, "error": None})
+        summary[name] = {
+            "status": "failed" if result["error"] else ("trained" if name in jobs else "skipped"),
+            "seconds": result["seconds"],
+            "error": result["error"],
+            "output": str(paths["output"]),
+            **dev_scores(paths["output"]),
+        }
+
+    headers = ["Model", "Status", "Seconds", "Precision", "Recall", "F-score"]
+    table = [[name, s["status"], s["seconds"], s.get("ents_p"), s.get("ents_r"), s.get("ents_f")]
+             for name, s in summary.items()]
+    print("\n Training Summary (dev scores of model-best)")
+    print(tabulate(table, headers=headers, tablefmt="pipe", floatfmt=".3f"))
+
+    with open(SUMMARY_FILE, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=4)
+    print(f"\n✅ Summary saved → {SUMMARY_FILE}")
+
+    failed = [name for name, s in summary.items() if s["status"] == "failed"]
+    if failed:
+        raise RuntimeError(f"Training failed for {', '.join(failed)} (see training.log in each output directory)")
     print("\n All NER models trained successfully.")
@@ -5,18 +5,18 @@ on multilabel annotations over 13 categories using 5-fold cross-validation.
 
 """
 
-import os, sys, random, numpy as np, pandas as pd, torch
+import os, sys, time, pandas as pd, torch
 from pathlib import Path
-from sklearn.model_selection import KFold, train_test_split
-from sklearn.metrics import precision_score, recall_score, f1_score, matthews_corrcoef
-from torch.utils.data import Dataset, DataLoader
-from torch import nn
-from tqdm import tqdm
-from transformers import AutoTokenizer, AutoModel
+from transformers import AutoTokenizer
 
 # Local imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "replication_src")))
 import config
+from transformer_data import load_token_cache
+from transformer_training import cpu_profile_settings, describe
+from transformer_sweep import (fold_job, final_job, fold_result_path, step_log_path, fold_splits,
+                               load_annotations, aggregate_folds, run_sweep)
+from profiling import summarize_steps
 
 
 # ============================================================
@@ -26,11 +26,24 @@ QUICK_TEST = False  # ⚡ Set to True for fast local run
 NUM_FOLDS = 5
 EPOCHS = 1 if QUICK_TEST else 10
 MAX_LEN = 64 if QUICK_TEST else 200
-TRAIN_BATCH_SIZE = 4
+TRAIN_BATCH_SIZE = int(os.getenv("TRAIN_BATCH_SIZE", 4))
 VALID_BATCH_SIZE = 4
 LEARNING_RATE = 1e-5
 SEED = 42
 
+# encodings of authors_annotation.csv, computed once per tokenizer and reused by all folds
+TOKEN_CACHE_DIR = Path(os.getenv("TOKEN_CACHE_DIR", config.MODELS_DIR / "token_cache"))
+
+# opt-in speed-ups: pad each batch only to its longest example, and batch examples of similar
+# length together (off by default: fixed MAX_LEN padding and plain shuffled batches, as for the
+# published Tables A7-A10)
+DYNAMIC_PADDING = os.getenv("DYNAMIC_PADDING", "0") == "1"
+LENGTH_BUCKETING = os.getenv("LENGTH_BUCKETING", "0") == "1"
+
+# CPU training profile: NUM_THREADS, INTEROP_THREADS, BF16, GRAD_ACCUM_STEPS, TORCH_COMPILE
+# (see replication_src/transformer_training.py; benchmark with scripts/script_benchmark_transformers.py)
+PROFILE = cpu_profile_settings()
+
 MODELS = {
     "BERT": "bert-base-uncased",
     "RoBERTa": "roberta-base",
@@ -38,208 +51,81 @@ MODELS = {
     "LegalBERT_EU": "nlpaueb/bert-base-uncased-eurlex"
     }
 
+# every (model, fold) is an independent job; its metrics are stored in SWEEP_DIR/<model>/fold_<k>.csv
+# and finished jobs are skipped on the next run (RESUME=0 recomputes everything); the test-fold
+# probabilities go to fold_<k>_probs.npz for threshold tuning (scripts/script_tune_thresholds.py)
+SWEEP_DIR = Path(os.getenv("SWEEP_DIR", config.MODELS_DIR / ("transformer_sweep_quick" if QUICK_TEST
+                                                              else "transformer_sweep")))
+SWEEP_WORKERS = int(os.getenv("SWEEP_WORKERS", 1))  # >1: fold jobs in parallel processes on disjoint cores
+RESUME = os.getenv("RESUME", "1") == "1"
+
+# models to train once more on all annotations and save for corpus inference
+# (e.g. FINAL_MODELS=LegalBERT_EU; see scripts/script_transformer_inference.py)
+FINAL_MODELS = [m for m in os.getenv("FINAL_MODELS", "").split(",") if m]
+FINAL_DIR = config.MODELS_DIR / "transformer_final"
+
+# screening mode: encoders frozen, pooled embeddings cached once per model, only the linear head is
+# trained on the same folds ({model}_probe_metrics.csv and probe_summary.csv instead of the fine-tuning)
+LINEAR_PROBE = os.getenv("LINEAR_PROBE", "0") == "1"
+EMBEDDING_CACHE_DIR = Path(os.getenv("EMBEDDING_CACHE_DIR", config.MODELS_DIR / "embedding_cache"))
+
+ANNOTATION_FILE = config.SOURCE_TEXT_DIR / "authors_annotation.csv"
+SETTINGS = {
+    "annotation_file": ANNOTATION_FILE,
+    "quick_test": QUICK_TEST,
+    "num_folds": NUM_FOLDS,
+    "epochs": EPOCHS,
+    "max_len": MAX_LEN,
+    "train_batch_size": TRAIN_BATCH_SIZE,
+    "valid_batch_size": VALID_BATCH_SIZE,
+    "learning_rate": LEARNING_RATE,
+    "seed": SEED,
+    "token_cache_dir": TOKEN_CACHE_DIR,
+    "dynamic_padding": DYNAMIC_PADDING,
+    "length_bucketing": LENGTH_BUCKETING,
+    "profile": PROFILE,
+}
+
 device = "cuda" if torch.cuda.is_available() else "cpu"
 print(f"🧠 Using device: {device.upper()}")
-
-random.seed(SEED)
-np.random.seed(SEED)
-torch.manual_seed(SEED)
-
-
-# ============================================================
-# ------------------------ DATASET ----------------------------
-# ============================================================
-class CustomDataset(Dataset):
-    def __init__(self, df, tokenizer, max_len):
-        self.texts = df["comment_text"].tolist()
-        self.targets = df["list"].tolist()
-        self.tokenizer = tokenizer
-        self.max_len = max_len
-
-    def __len__(self):
-        return len(self.texts)
-
-    def __getitem__(self, idx):
-        text = str(self.texts[idx])
-        inputs = self.tokenizer.encode_plus(
-            text,
-            None,
-            add_special_tokens=True,
-            max_length=self.max_len,
-            padding="max_length",
-            truncation=True,
-            return_token_type_ids=True,
-        )
-        return {
-            "ids": torch.tensor(inputs["input_ids"], dtype=torch.long),
-            "mask": torch.tensor(inputs["attention_mask"], dtype=torch.long),
-            "token_type_ids": torch.tensor(inputs.get("token_type_ids", [0]*self.max_len), dtype=torch.long),
-            "targets": torch.tensor(self.targets[idx], dtype=torch.float),
-        }
-
-
-# ============================================================
-# ------------------------- MODEL -----------------------------
-# ============================================================
-class TransformerClassifier(nn.Module):
-    def __init__(self, model_name, num_labels):
-        super().__init__()
-        self.model_name = model_name 
-        self.transformer = AutoModel.from_pretrained(model_name)
-        self.dropout = nn.Dropout(0.3)
-        hidden_size = self.transformer.config.hidden_size
-        self.classifier = nn.Linear(hidden_size, num_labels)
-
-    def forward(self, ids, mask, token_type_ids):
-        if "distilbert" in self.model_name.lower():
-            outputs = self.transformer(ids, attention_mask=mask, return_dict=False)
-        else:
-            outputs = self.transformer(ids, attention_mask=mask, token_type_ids=token_type_ids, return_dict=False)
-        pooled_output = outputs[1] if len(outputs) > 1 else outputs[0][:, 0, :]
-        output = self.dropout(pooled_output)
-        return self.classifier(output)
-
-
-# ============================================================
-# ---------------------- TRAINING LOOP ------------------------
-# ============================================================
-def loss_fn(outputs, targets):
-    return nn.BCEWithLogitsLoss()(outputs, targets)
-
-
-def train_one_epoch(model, loader, optimizer):
-    model.train()
-    total_loss = 0
-    for data in loader:
-        ids = data["ids"].to(device)
-        mask = data["mask"].to(device)
-        token_type_ids = data["token_type_ids"].to(device)
-        targets = data["targets"].to(device)
-
-        optimizer.zero_grad()
-        outputs = model(ids, mask, token_type_ids)
-        loss = loss_fn(outputs, targets)
-        loss.backward()
-        optimizer.step()
-        total_loss += loss.item()
-    return total_loss / len(loader)
-
-
-def validate(model, loader):
-    model.eval()
-    total_loss = 0
-    preds, trues = [], []
-    with torch.no_grad():
-        for data in loader:
-            ids = data["ids"].to(device)
-            mask = data["mask"].to(device)
-            token_type_ids = data["token_type_ids"].to(device)
-            targets = data["targets"].to(device)
-            outputs = model(ids, mask, token_type_ids)
-            loss = loss_fn(outputs, targets)
-            total_loss += loss.item()
-            preds.append(torch.sigmoid(outputs).cpu().numpy())
-            trues.append(targets.cpu().numpy())
-    return total_loss / len(loader), np.vstack(preds), np.vstack(trues)
+print(f"   {describe(PROFILE)}")
 
 
 # ============================================================
 # ------------------------ PIPELINE ---------------------------
 # ============================================================
-def run_model(model_name, model_path):
-    print(f"\n🔹 Running {model_name} ({model_path})")
-
-    # Load and prepare data
-    df = pd.read_csv(config.SOURCE_TEXT_DIR / "authors_annotation.csv")
-    df = df.rename(columns={"text": "comment_text"})
-    df.iloc[:, 2:] = (df.iloc[:, 2:] > 0).astype(int)  # binarize any non-zero to 1
-    df["list"] = df.iloc[:, 2:].values.tolist()
-    df = df[["comment_text", "list"]]
-
-    if QUICK_TEST:
-        df = df.sample(100, random_state=SEED).reset_index(drop=True)
-
-    num_labels = len(df["list"][0])
-
-    # preserve original class names (columns after 'text')
-    class_names = pd.read_csv(config.SOURCE_TEXT_DIR / "authors_annotation.csv").columns.tolist()[2:]  
-    tokenizer = AutoTokenizer.from_pretrained(model_path)
-    
-    # === initialize containers for all folds ===
-    accuracy_all_folds = []
-    precision_all_folds = []
-    recall_all_folds = []
-    f1_all_folds = []
-    mcc_all_folds = []
-
-    kf = KFold(n_splits=NUM_FOLDS, shuffle=True, random_state=SEED)
-    metrics_list = []
-
-    for fold, (train_idx, test_idx) in enumerate(kf.split(df), 1):
-        print(f"\n🧩 Fold {fold}/{NUM_FOLDS}")
-        train_df, test_df = df.iloc[train_idx], df.iloc[test_idx]
-        train_df, val_df = train_test_split(train_df, test_size=0.2, random_state=SEED)
-
-        train_ds = CustomDataset(train_df, tokenizer, MAX_LEN)
-        val_ds = CustomDataset(val_df, tokenizer, MAX_LEN)
-        test_ds = CustomDataset(test_df, tokenizer, MAX_LEN)
-
-        train_loader = DataLoader(train_ds, batch_size=TRAIN_BATCH_SIZE, shuffle=True)
-        val_loader = DataLoader(val_ds, batch_size=VALID_BATCH_SIZE, shuffle=False)
-        test_loader = DataLoader(test_ds, batch_size=VALID_BATCH_SIZE, shuffle=False)
-
-        model = TransformerClassifier(model_path, num_labels).to(device)
-        optimizer = torch.optim.Adam(model.parameters(), lr=LEARNING_RATE)
-
-        best_val_loss = float("inf")
-        patience, counter = 2, 0
-
-        for epoch in range(EPOCHS):
-            train_loss = train_one_epoch(model, train_loader, optimizer)
-            val_loss, _, _ = validate(model, val_loader)
-            print(f"Epoch {epoch+1}/{EPOCHS} | Train {train_loss:.4f} | Val {val_loss:.4f}")
-
-            if val_loss < best_val_loss:
-                best_val_loss = val_loss
-                counter = 0
-            else:
-                counter += 1
-            if counter >= patience:
-                print("Early stopping.")
-                break
-
-        test_loss, preds, trues = validate(model, test_loader)
-        preds_bin = (preds > 0.5).astype(int)
-
-        print("\n[DEBUG] trues type:", type(trues))
-
-         
-        trues = np.asarray(trues, dtype=int)
-        preds_bin = np.asarray(preds_bin, dtype=int)
-
-        print("[DEBUG] unique values in trues:", np.unique(trues))
-        print("[DEBUG] unique values in preds_bin:", np.unique(preds_bin))
- 
-        precision = precision_score(trues, preds_bin, average=None, zero_division=0)
-        recall = recall_score(trues, preds_bin, average=None, zero_division=0)
-        f1 = f1_score(trues, preds_bin, average=None, zero_division=0)
-        mcc = [matthews_corrcoef(trues[:, i], preds_bin[:, i]) for i in range(num_labels)]
-
-        fold_metrics = pd.DataFrame({
-            "Label": class_names,   # use the real names
-            "Precision": precision,
-            "Recall": recall,
-            "F1": f1,
-            "MCC": mcc,
-        })
-        metrics_list.append(fold_metrics)
-
-    # === Aggregate results across folds ===
-    all_metrics = pd.concat(metrics_list).groupby("Label").mean().reset_index()
-    all_metrics[["Precision", "Recall", "F1", "MCC"]] *= 100
-    all_metrics = all_metrics.round(2)
-
-    print("\n✅ Final average metrics across folds:")
+def fold_jobs():
+    """Jobs of the (model, fold) pairs without a result file yet (all of them when RESUME=0)."""
+    jobs = {}
+    for model_name, model_path in MODELS.items():
+        for fold in range(1, NUM_FOLDS + 1):
+            result_path = fold_result_path(SWEEP_DIR, model_name, fold)
+            if RESUME and result_path.exists():
+                print(f"✅ {model_name} fold {fold} already done → {result_path}")
+                continue
+            jobs[f"{model_name} fold {fold}"] = {
+                "model_name": model_name,
+                "model_path": model_path,
+                "fold": fold,
+                "settings": SETTINGS,
+                "result_path": result_path,
+            }
+    return jobs
+
+
+def build_token_caches(jobs):
+    """Tokenise once per model in this process, so that concurrent fold jobs only read the cache."""
+    texts, _, _ = load_annotations(ANNOTATION_FILE, QUICK_TEST, SEED)
+    for model_path in sorted({job["model_path"] for job in jobs.values()}):
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        load_token_cache(tokenizer, model_path, texts, MAX_LEN, TOKEN_CACHE_DIR)
+
+
+def save_model_metrics(model_name):
+    all_metrics = aggregate_folds([fold_result_path(SWEEP_DIR, model_name, fold)
+                                   for fold in range(1, NUM_FOLDS + 1)])
+
+    print(f"\n✅ {model_name}: final average metrics across folds:")
     print(all_metrics)
 
     # Save results to /output_tables
@@ -248,12 +134,82 @@ def run_model(model_name, model_path):
     print(f"\n Saved metrics to: {output_path}")
 
 
+def save_step_summary():
+    """Step timings of all fold jobs per phase (see profiling.summarize_steps) → SWEEP_DIR/step_summary.csv."""
+    rows = []
+    for model_name in MODELS:
+        for fold in range(1, NUM_FOLDS + 1):
+            step_log = step_log_path(fold_result_path(SWEEP_DIR, model_name, fold))
+            if step_log.exists():
+                rows.extend(summarize_steps(step_log))
+    if not rows:
+        return
+    summary = pd.DataFrame(rows)
+    print("\n Step timings (share of step time per stage, %):")
+    print(summary[["model", "fold", "phase", "mean_step_ms", "data_share_pct", "forward_share_pct",
+                   "backward_share_pct", "optimizer_share_pct", "samples_per_sec", "padding_share_pct"]])
+    output_path = SWEEP_DIR / "step_summary.csv"
+    summary.to_csv(output_path, index=False)
+    print(f"\n Saved step timings to: {output_path}")
+
+
+def linear_probe():
+    """Screening: frozen encoders with a linear head per fold (no fine-tuning); see transformer_probe.py."""
+    from transformer_probe import embed_to_cache, train_linear_heads, probe_metrics
+
+    texts, targets, class_names = load_annotations(ANNOTATION_FILE, QUICK_TEST, SEED)
+    splits = fold_splits(len(texts), NUM_FOLDS, SEED)
+    summary = []
+    for model_name, model_path in MODELS.items():
+        print(f"\n🔹 {model_name} ({model_path})")
+        start = time.perf_counter()
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        embeddings = embed_to_cache(model_path, tokenizer, texts, MAX_LEN, EMBEDDING_CACHE_DIR, TOKEN_CACHE_DIR)
+        probs = train_linear_heads(embeddings, targets, splits)
+        metrics = probe_metrics(probs, targets, splits, class_names)
+        print(metrics)
+
+        output_path = config.OUTPUT_TABLES_DIR / f"{model_name}_probe_metrics.csv"
+        metrics.to_csv(output_path, index=False)
+        summary.append({"Model": model_name, "Mean F1": metrics["F1"].mean(), "Mean MCC": metrics["MCC"].mean(),
+                        "Seconds": time.perf_counter() - start})
+
+    summary = pd.DataFrame(summary).round(2)
+    print("\n✅ Linear-probe comparison (mean over labels):")
+    print(summary)
+    output_path = config.OUTPUT_TABLES_DIR / "probe_summary.csv"
+    summary.to_csv(output_path, index=False)
+    print(f"\n Saved metrics to: {output_path}")
+
 
 # ============================================================
 # ------------------------- MAIN ------------------------------
 # ============================================================
 if __name__ == "__main__":
+    if LINEAR_PROBE:
+        print("\n=== Transformer Linear-Probe Screening ===")
+        linear_probe()
+        sys.exit(0)
+
     print("\n=== Transformer Fine-Tuning Script ===")
-    for model_name, model_path in MODELS.items():
-        run_model(model_name, model_path)
+    jobs = fold_jobs()
+    if jobs:
+        build_token_caches(jobs)
+    if SWEEP_WORKERS > 1 and len(jobs) > 1:
+        results = run_sweep(jobs, min(SWEEP_WORKERS, len(jobs)))
+        failed = [name for name, r in results.items() if r["error"] is not None]
+        if failed:
+            raise RuntimeError(f"Fold jobs failed: {', '.join(failed)} (rerun to resume the sweep)")
+    else:
+        for name, kwargs in jobs.items():
+            print(f"\n🧩 {name}")
+            fold_job(**kwargs)
+
+    for model_name in MODELS:
+        save_model_metrics(model_name)
+    save_step_summary()
+
+    for model_name in FINAL_MODELS:
+        print(f"\n🔹 Training final {model_name} on all annotations")
+        final_job(model_name, MODELS[model_name], SETTINGS, FINAL_DIR / model_name)
     print("\n All models completed successfully.")
@@ -0,0 +1,112 @@
+# scripts/script_benchmark.py
+"""
+Benchmark suite for the preprocessing (01) and classification pipeline (05) scripts.
+
+For each corpus scale, a synthetic EurLex-like corpus is generated by recombining real
+sentences (see replication_src/synthetic_corpus.py), both scripts are run end-to-end in
+a temporary directory, and the per-stage timings they report are collected:
+
+    01: io, preprocessing
+    05: io, annotation (spaCy), features (find_*), classification (classify_*)
+
+Sentences/sec per stage and peak RSS per script are appended, together with the current
+git commit, to benchmark_files/benchmark_history.csv so that regressions are visible.
+
+    python scripts/script_benchmark.py                                      # 1k and 10k acts
+    BENCHMARK_SCALES=1000,10000,100000 python scripts/script_benchmark.py   # + 100k (hours)
+"""
+
+import csv
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from replication_src import config
+from replication_src.regression import run_pipeline, PIPELINE_SCRIPTS
+from replication_src.synthetic_corpus import generate_eurlex_corpus, load_sentence_pool
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+BENCHMARK_SCALES = [int(n) for n in os.getenv("BENCHMARK_SCALES", "1000,10000").split(",")]
+SEED = 42
+HISTORY_FILE = config.BENCHMARK_DIR / "benchmark_history.csv"
+
+HEADERS = ["commit", "date", "n_acts", "script", "stage", "seconds",
+           "sentences", "sentences_per_sec", "peak_rss_mb"]
+
+
+def current_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def benchmark_scale(n_acts, pool, commit, date):
+    work_dir = Path(tempfile.mkdtemp(prefix=f"eurlex_bench_{n_acts}_"))
+    timings_dir = work_dir / "timings"
+    timings_dir.mkdir()
+
+    try:
+        start = timeit.default_timer()
+        generate_eurlex_corpus(n_acts, work_dir / "source_files", seed=SEED, pool=pool)
+        print(f"\n Generated {n_acts:,} synthetic acts in {timeit.default_timer() - start:.1f}s")
+
+        run_pipeline(work_dir, source_dir=work_dir / "source_files",
+                     extra_env={"STAGE_TIMINGS_DIR": str(timings_dir)})
+
+        rows = []
+        for script in PIPELINE_SCRIPTS:
+            with open(timings_dir / f"{Path(script).stem}.json", "r", encoding="utf-8") as f:
+                timings = json.load(f)
+            n_sentences = timings["counts"].get("sentences", 0)
+            for stage, seconds in timings["seconds"].items():
+                rows.append([commit, date, n_acts, Path(script).stem, stage, round(seconds, 3),
+                             n_sentences, round(n_sentences / seconds, 1) if seconds else None,
+                             timings["peak_rss_mb"]])
+        return rows
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== EurLex Benchmark Suite ===")
+    commit = current_commit()
+    date = datetime.now().isoformat(timespec="seconds")
+    pool = load_sentence_pool()
+    print(f"Commit {commit} | scales {BENCHMARK_SCALES} | sentence pool {len(pool):,}")
+
+    config.BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    new_file = not HISTORY_FILE.exists()
+    with open(HISTORY_FILE, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(HEADERS)
+
+        for n_acts in BENCHMARK_SCALES:
+            rows = benchmark_scale(n_acts, pool, commit, date)
+            writer.writerows(rows)
+            f.flush()
+
+            print(f"\n Results for {n_acts:,} acts:")
+            for row in rows:
+                print(f"  {row[3]:<30} {row[4]:<15} {row[5]:>10.2f}s "
+                      f"{row[7] or 0:>10.1f} sent/s  peak RSS {row[8]} MB")
+
+    print(f"\n✅ Benchmark results appended to: {HISTORY_FILE}")
@@ -0,0 +1,118 @@
+# scripts/script_benchmark_ner.py
+"""
+Throughput/accuracy benchmark of the NER model configurations.
+
+Sweeps the tok2vec architecture (MaxoutWindowEncoder width and depth, MultiHashEmbed rows)
+and the training batch size over the NER_training train/dev DocBins, training the variants
+concurrently on CPU (see replication_src/ner_benchmark.py). For every variant, training
+words/sec, inference words/sec, model size and dev F are collected into
+benchmark_files/ner_benchmark.csv, with the Pareto-optimal variants (dev F vs inference
+words/sec) flagged, to choose a faster model for large annotation runs.
+
+    BENCH_WIDTHS=64,96 BENCH_DEPTHS=2,4 BENCH_MAX_STEPS=2000 python scripts/script_benchmark_ner.py
+
+Finished runs (benchmark_files/ner/<model>/<variant>/benchmark.json) are reused on a rerun.
+"""
+
+import csv
+import json
+import os
+import sys
+from itertools import product
+from tabulate import tabulate
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+import config
+from ner_training import run_jobs, thread_budget
+from ner_benchmark import ROWS_PRESETS, RESULT_FILE, benchmark_job, variant_overrides, pareto_front
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+TRAINING_DIR = config.MODELS_DIR / "NER_training"
+BENCH_MODELS = os.getenv("BENCH_MODELS", "NER_institutions,NER_verbs").split(",")
+
+BENCH_WIDTHS = [int(x) for x in os.getenv("BENCH_WIDTHS", "64,96,128").split(",")]
+BENCH_DEPTHS = [int(x) for x in os.getenv("BENCH_DEPTHS", "2,4").split(",")]
+BENCH_ROWS = os.getenv("BENCH_ROWS", "small,default").split(",")               # keys of ROWS_PRESETS
+BENCH_BATCH_SIZES = [int(x) for x in os.getenv("BENCH_BATCH_SIZES", "1000,2000").split(",")]
+BENCH_MAX_STEPS = int(os.getenv("BENCH_MAX_STEPS", 2000))   # shipped configs: 20000
+
+BENCH_WORKERS = int(os.getenv("BENCH_WORKERS", max(1, (os.cpu_count() or 1) // 2)))
+THREADS_PER_WORKER = int(os.getenv("THREADS_PER_WORKER", thread_budget(BENCH_WORKERS)))
+
+RUNS_DIR = config.BENCHMARK_DIR / "ner"
+RESULTS_FILE = config.BENCHMARK_DIR / "ner_benchmark.csv"
+
+HEADERS = ["model", "width", "depth", "rows", "batch_size", "steps", "train_wps",
+           "infer_wps", "size_mb", "ents_p", "ents_r", "ents_f", "pareto"]
+
+
+def variant_name(width, depth, rows, batch_size):
+    return f"w{width}_d{depth}_{rows}_b{batch_size}"
+
+
+def sweep_jobs(model):
+    model_dir = TRAINING_DIR / model
+    jobs = {}
+    for width, depth, rows, batch_size in product(BENCH_WIDTHS, BENCH_DEPTHS, BENCH_ROWS, BENCH_BATCH_SIZES):
+        run_dir = RUNS_DIR / model / variant_name(width, depth, rows, batch_size)
+        jobs[(model, width, depth, rows, batch_size)] = {
+            "cfg_path": (model_dir / "config.cfg").resolve(),
+            "train_path": model_dir / "train.spacy",
+            "dev_path": model_dir / "dev.spacy",
+            "output_path": run_dir,
+            "overrides": variant_overrides(width, depth, ROWS_PRESETS[rows], batch_size, BENCH_MAX_STEPS),
+            "log_path": run_dir / "training.log",
+        }
+    return jobs
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== NER Throughput Benchmark ===")
+    jobs = {}
+    for model in BENCH_MODELS:
+        jobs.update(sweep_jobs(model))
+
+    pending = {"/".join(map(str, key)): kwargs for key, kwargs in jobs.items()
+               if not (kwargs["output_path"] / RESULT_FILE).exists()}
+    print(f" {len(jobs)} variant(s), {len(pending)} to train with {BENCH_WORKERS} worker(s) x "
+          f"{THREADS_PER_WORKER} thread(s), max {BENCH_MAX_STEPS} steps each")
+    if pending:
+        for kwargs in pending.values():
+            kwargs["output_path"].mkdir(parents=True, exist_ok=True)
+        run_jobs(pending, BENCH_WORKERS, THREADS_PER_WORKER, target=benchmark_job)
+
+    rows = []
+    for (model, width, depth, rows_preset, batch_size), kwargs in jobs.items():
+        result_file = kwargs["output_path"] / RESULT_FILE
+        if not result_file.exists():
+            print(f"⚠️ No result for {model} {variant_name(width, depth, rows_preset, batch_size)}")
+            continue
+        with open(result_file, "r", encoding="utf-8") as f:
+            result = json.load(f)
+        row = {"model": model, "width": width, "depth": depth, "rows": rows_preset, "batch_size": batch_size}
+        row.update(result)
+        rows.append(row)
+
+    # Pareto front per model: no other variant is both more accurate and faster at inference
+    for model in BENCH_MODELS:
+        model_rows = [r for r in rows if r["model"] == model and r["infer_wps"] is not None]
+        for row, optimal in zip(model_rows, pareto_front(model_rows)):
+            row["pareto"] = optimal
+
+    table = [[row.get(h, False) if h == "pareto" else row.get(h) for h in HEADERS]
+             for row in sorted(rows, key=lambda r: (r["model"], -r["ents_f"]))]
+    print(tabulate(table, headers=HEADERS, tablefmt="pipe", floatfmt=".3f"))
+
+    config.BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(RESULTS_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        writer.writerows(table)
+    print(f"\n✅ Saved benchmark table → {RESULTS_FILE}")
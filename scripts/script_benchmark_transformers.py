@@ -0,0 +1,141 @@
+# scripts/script_benchmark_transformers.py
+"""
+CPU training-profile benchmark for the Transformer fine-tuning (script 06).
+
+For each model, a fixed number of training steps on authors_annotation.csv is timed with
+the CPU profile options of replication_src/transformer_training.py switched on one after
+the other:
+
+    fp32       torch defaults (the original loop)
+    threads    torch.set_num_threads(BENCH_THREADS)
+    bf16       + bfloat16 autocast
+    accum      + gradient accumulation (GRAD_ACCUM_STEPS batches per optimizer step)
+    compile    + torch.compile
+
+Samples/sec, effective tokens/sec and the estimated hours of the full 5-fold sweep
+(NUM_FOLDS x EPOCHS epochs, no early stopping) are saved to
+benchmark_files/transformer_cpu_profile.csv.
+
+    BENCH_TRANSFORMERS=DistilBERT BENCH_STEPS=30 python scripts/script_benchmark_transformers.py
+"""
+
+import csv
+import os
+import sys
+import time
+from pathlib import Path
+from functools import partial
+
+import pandas as pd
+import torch
+from tabulate import tabulate
+from transformers import AutoTokenizer
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+import config
+from transformer_data import load_token_cache, CachedDataset, LengthBucketSampler, pad_collate
+from transformer_training import TransformerClassifier, train_one_epoch, prepare_model, bf16_supported
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+MODELS = {
+    "BERT": "bert-base-uncased",
+    "RoBERTa": "roberta-base",
+    "DistilBERT": "distilbert-base-uncased",
+    "LegalBERT_EU": "nlpaueb/bert-base-uncased-eurlex",
+}
+BENCH_TRANSFORMERS = os.getenv("BENCH_TRANSFORMERS", ",".join(MODELS)).split(",")
+BENCH_THREADS = int(os.getenv("BENCH_THREADS", os.cpu_count() or 1))
+BENCH_STEPS = int(os.getenv("BENCH_STEPS", 50))        # timed training steps per variant
+WARMUP_STEPS = int(os.getenv("WARMUP_STEPS", 5))       # untimed (also triggers torch.compile)
+GRAD_ACCUM_STEPS = int(os.getenv("GRAD_ACCUM_STEPS", 4))
+BATCH_SIZE = int(os.getenv("TRAIN_BATCH_SIZE", 4))
+MAX_LEN = 200
+LEARNING_RATE = 1e-5
+SEED = 42
+
+# sweep of script 06: 5 folds x 10 epochs over 64% of the annotations (train split of each fold)
+NUM_FOLDS = 5
+EPOCHS = 10
+TOKEN_CACHE_DIR = Path(os.getenv("TOKEN_CACHE_DIR", config.MODELS_DIR / "token_cache"))
+REPORT_FILE = config.BENCHMARK_DIR / "transformer_cpu_profile.csv"
+
+BASE_PROFILE = {"num_threads": 0, "interop_threads": 0, "bf16": False, "grad_accum": 1, "compile": False}
+VARIANTS = {
+    "fp32": {},
+    "threads": {"num_threads": BENCH_THREADS},
+    "bf16": {"num_threads": BENCH_THREADS, "bf16": True},
+    "accum": {"num_threads": BENCH_THREADS, "bf16": True, "grad_accum": GRAD_ACCUM_STEPS},
+    "compile": {"num_threads": BENCH_THREADS, "bf16": True, "grad_accum": GRAD_ACCUM_STEPS, "compile": True},
+}
+
+
+def load_annotations():
+    df = pd.read_csv(config.SOURCE_TEXT_DIR / "authors_annotation.csv")
+    targets = (df.iloc[:, 2:] > 0).astype(int).values.tolist()
+    return df["text"].tolist(), targets
+
+
+def time_variant(model_path, dataset, num_labels, profile):
+    """Samples/sec and tokens/sec of BENCH_STEPS training steps under `profile`."""
+    default_threads = torch.get_num_threads()
+    if profile["num_threads"]:
+        torch.set_num_threads(profile["num_threads"])
+    torch.manual_seed(SEED)
+    model = TransformerClassifier(model_path, num_labels)
+    optimizer = torch.optim.Adam(model.parameters(), lr=LEARNING_RATE)
+    train_model = prepare_model(model, profile)
+    loader = torch.utils.data.DataLoader(
+        dataset, batch_sampler=LengthBucketSampler(dataset.lengths, BATCH_SIZE, shuffle=True, seed=SEED),
+        collate_fn=partial(pad_collate, dynamic=True))
+
+    train_one_epoch(train_model, loader, optimizer, "cpu", profile, max_steps=WARMUP_STEPS)
+    start = time.perf_counter()
+    _, tokens_per_sec = train_one_epoch(train_model, loader, optimizer, "cpu", profile, max_steps=BENCH_STEPS)
+    samples_per_sec = BENCH_STEPS * BATCH_SIZE / (time.perf_counter() - start)
+    torch.set_num_threads(default_threads)
+    return samples_per_sec, tokens_per_sec
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== Transformer CPU Profile Benchmark ===")
+    if not bf16_supported():
+        print("⚠️ No native bf16 instructions on this CPU: bf16 autocast is emulated and may be slower")
+
+    texts, targets = load_annotations()
+    train_size = int(len(texts) * (1 - 1 / NUM_FOLDS) * 0.8)
+    table = []
+    for model_name in BENCH_TRANSFORMERS:
+        model_path = MODELS[model_name]
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        cache = load_token_cache(tokenizer, model_path, texts, MAX_LEN, TOKEN_CACHE_DIR)
+        dataset = CachedDataset(cache, range(len(texts)), targets)
+
+        baseline = None
+        for variant, options in VARIANTS.items():
+            profile = dict(BASE_PROFILE, **options)
+            print(f"🔹 {model_name}: {variant}")
+            samples_per_sec, tokens_per_sec = time_variant(model_path, dataset, len(targets[0]), profile)
+            baseline = baseline or samples_per_sec
+            sweep_hours = NUM_FOLDS * EPOCHS * train_size / samples_per_sec / 3600
+            table.append([model_name, variant, profile["num_threads"] or torch.get_num_threads(), profile["bf16"],
+                          profile["grad_accum"], profile["compile"], samples_per_sec, tokens_per_sec,
+                          samples_per_sec / baseline, sweep_hours])
+
+    headers = ["Model", "Variant", "Threads", "BF16", "Grad accum", "Compile",
+               "Samples/sec", "Tokens/sec", "Relative", "Sweep hours (est.)"]
+    print()
+    print(tabulate(table, headers=headers, tablefmt="pipe", floatfmt=".2f"))
+
+    config.BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(table)
+    print(f"\n✅ Saved report → {REPORT_FILE}")
@@ -0,0 +1,149 @@
+# scripts/script_build_annotation_model.py
+"""
+Build the composite institutions + verbs NER used by the annotation pipeline (script 05).
+
+find_root needs the verb entities (DELEGATION, PERMISSION, CONSTRAINT, SOFT_IMPL, ...) of
+the verbs NER, but adding it as a second sourced model would add another tok2vec pass per
+doc. This script:
+
+  1. trains both NER models on models_files/NER_training so that they listen to
+     en_core_web_lg's frozen tok2vec (skipped for models already trained), and assembles
+     them into models_files/NER_composite (tok2vec + ner + ner_verbs);
+  2. assembles the shipped models as they are into models_files/NER_composite_separate
+     (each NER with its own tok2vec), as the baseline;
+  3. times the script-05 pipeline with the institution NER only, with both NERs run
+     separately and with the shared composite, and scores the NERs on their dev sets.
+
+Throughput and dev F are saved to benchmark_files/annotation_model.csv and
+annotation_model_scores.csv. To annotate with the composite:
+    ANNOTATION_MODEL=models_files/NER_composite python scripts/05_script_pipeline_main.py
+"""
+
+import csv
+import os
+import sys
+from tabulate import tabulate
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+import config
+from ner_training import run_jobs, thread_budget
+from ner_driver import driver_settings
+from ner_evaluation import evaluate_ner
+from ner_distillation import (shared_tok2vec_config, iter_sentence_texts, annotation_pipeline,
+                              annotation_speed, BASE_MODEL)
+from annotation_model import assemble_composite, add_annotation_model
+import spacy
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+TRAINING_DIR = config.MODELS_DIR / "NER_training"
+WORK_DIR = config.MODELS_DIR / "NER_composite_training"
+
+SHIPPED = {
+    "NER_institutions": config.MODELS_DIR / "NER_institutions" / "model-last",
+    "NER_verbs": config.MODELS_DIR / "NER_verbs" / "model-last",
+}
+SHARED = {
+    "NER_institutions": config.MODELS_DIR / "NER_institutions_shared",
+    "NER_verbs": config.MODELS_DIR / "NER_verbs_shared",
+}
+COMPOSITE_DIR = config.MODELS_DIR / "NER_composite"
+SEPARATE_DIR = config.MODELS_DIR / "NER_composite_separate"
+
+BUILD_SHARED = os.getenv("BUILD_SHARED", "1") == "1"     # 0: only the separate baseline package
+SPEED_SENTENCES = int(os.getenv("SPEED_SENTENCES", 2000))
+SENTENCES_FILE = config.CORPUS_DIR / "EurLex_sentences.jsonl"
+THREADS_PER_WORKER = int(os.getenv("THREADS_PER_WORKER", thread_budget(len(SHARED))))
+DRIVER = driver_settings()
+
+REPORT_FILE = config.BENCHMARK_DIR / "annotation_model.csv"
+SCORES_FILE = config.BENCHMARK_DIR / "annotation_model_scores.csv"
+
+
+def shared_training_jobs():
+    WORK_DIR.mkdir(parents=True, exist_ok=True)
+    jobs = {}
+    for name, output in SHARED.items():
+        if (output / "model-best" / "meta.json").exists():
+            print(f"✅ {name} with shared tok2vec already trained → {output}")
+            continue
+        cfg_path = shared_tok2vec_config(TRAINING_DIR / name / "config.cfg", WORK_DIR / f"config_{name}.cfg")
+        jobs[name] = {
+            "cfg_path": cfg_path.resolve(),
+            "output_path": output.resolve(),
+            "overrides": {
+                "paths.train": str((TRAINING_DIR / name / "train.spacy").resolve()),
+                "paths.dev": str((TRAINING_DIR / name / "dev.spacy").resolve()),
+            },
+            "log_path": WORK_DIR / f"training_{name}.log",
+            "driver": DRIVER,
+        }
+    return jobs
+
+
+def composite_pipeline(model_dir):
+    nlp = spacy.load(BASE_MODEL, exclude=["ner"])
+    return add_annotation_model(nlp, model_dir)
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== Composite Annotation Model ===")
+
+    pipelines = {"institutions only": lambda: annotation_pipeline(SHIPPED["NER_institutions"])}
+
+    print(assemble_composite(SHIPPED["NER_institutions"], SHIPPED["NER_verbs"], SEPARATE_DIR, shared=False),
+          f"→ {SEPARATE_DIR}")
+    pipelines["institutions + verbs, separate tok2vecs"] = lambda: composite_pipeline(SEPARATE_DIR)
+
+    scores = {}
+    if BUILD_SHARED:
+        jobs = shared_training_jobs()
+        if jobs:
+            results = run_jobs(jobs, len(jobs), THREADS_PER_WORKER)
+            failed = [name for name, r in results.items() if r["error"] is not None]
+            if failed:
+                raise RuntimeError(f"Training failed for {', '.join(failed)} (see the logs in {WORK_DIR})")
+
+        print(assemble_composite(SHARED["NER_institutions"] / "model-best", SHARED["NER_verbs"] / "model-best",
+                                 COMPOSITE_DIR, shared=True), f"→ {COMPOSITE_DIR}")
+        pipelines["institutions + verbs, shared tok2vec"] = lambda: composite_pipeline(COMPOSITE_DIR)
+
+        for name in SHARED:
+            dev_file = TRAINING_DIR / name / "dev.spacy"
+            scores[name] = {
+                "shipped": evaluate_ner(SHIPPED[name], dev_file)[0]["ents_f"],
+                "shared": evaluate_ner(SHARED[name] / "model-best", dev_file)[0]["ents_f"],
+            }
+
+    texts = list(iter_sentence_texts(SENTENCES_FILE, SPEED_SENTENCES))
+    table = []
+    for label, build in pipelines.items():
+        nlp = build()
+        print(f" Timing {label}: {nlp.pipe_names}")
+        table.append([label, " ".join(nlp.pipe_names), annotation_speed(nlp, texts)])
+    for row in table:
+        row.append(row[2] / table[0][2])
+
+    headers = ["Pipeline", "Components", "Words/sec", "Relative"]
+    print()
+    print(tabulate(table, headers=headers, tablefmt="pipe", floatfmt=".3f"))
+    for name, s in scores.items():
+        print(f" {name} dev F: shipped {s['shipped']:.3f} | shared tok2vec {s['shared']:.3f}")
+
+    config.BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(table)
+    if scores:
+        with open(SCORES_FILE, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Model", "F-score shipped", "F-score shared tok2vec"])
+            writer.writerows([name, s["shipped"], s["shared"]] for name, s in scores.items())
+    print(f"\n✅ Saved report → {REPORT_FILE}")
@@ -0,0 +1,59 @@
+# scripts/script_build_corpus_store.py
+"""
+Build the shared corpus store for the institution NER folds.
+
+The train.spacy/dev.spacy files of fold_a ... fold_e hold largely the same annotated
+sentences. This script merges them into a single deduplicated corpus.spacy plus one small
+index file and store-reading config per fold (see replication_src/corpus_store.py), so that
+all folds read one corpus and new splits cost only an index file.
+
+    python scripts/script_build_corpus_store.py
+    NEW_SPLITS=10 python scripts/script_build_corpus_store.py    # + split_1 ... split_10
+
+Then train and evaluate through the store with
+    CORPUS_STORE=1 python scripts/02_script_train_eval_ner_institutions.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from replication_src import config
+from replication_src.corpus_store import build_store, make_kfold_splits
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+base_path = config.MODELS_DIR / "NER_validation" / "NER_institutions"
+folds = ["fold_a", "fold_b", "fold_c", "fold_d", "fold_e"]
+store_dir = base_path / "corpus_store"
+
+NEW_SPLITS = int(os.getenv("NEW_SPLITS", 0))   # extra k-fold splits over the whole store (0 = none)
+SEED = int(os.getenv("SEED", 42))
+
+
+def size_mb(paths):
+    return sum(p.stat().st_size for p in paths if p.exists()) / 1024 ** 2
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    fold_dirs = [base_path / fold for fold in folds]
+    fold_files = [d / f"{split}.spacy" for d in fold_dirs for split in ["train", "dev"]]
+    print(f"\n Per-fold DocBins: {size_mb(fold_files):.1f} MB in {len(fold_files)} files")
+
+    n_docs = build_store(fold_dirs, store_dir)
+    store_files = list(store_dir.rglob("*"))
+    print(f"✅ Corpus store: {n_docs:,} distinct docs, {size_mb([p for p in store_files if p.is_file()]):.1f} MB"
+          f" → {store_dir}")
+
+    if NEW_SPLITS:
+        names = make_kfold_splits(store_dir, NEW_SPLITS, fold_dirs[0] / "config.cfg", seed=SEED)
+        print(f"✅ {len(names)} new splits: {', '.join(names)}")
+        print(f"   Train them with CORPUS_STORE=1 FOLDS={','.join(names)}")
@@ -0,0 +1,155 @@
+# scripts/script_distil_ner_institutions.py
+"""
+Train faster variants of the institution NER for the annotation pipeline (script 05).
+
+  shared   NER listening to en_core_web_lg's frozen tok2vec (no second embedding pass)
+  student  smaller standalone tok2vec + NER trained on gold data plus the teacher's
+           annotations of EurLex_sentences.jsonl
+
+The teacher is the shipped models_files/NER_institutions/model-last. All models are scored
+on the NER_training dev set, compared with the teacher and with the cross-validated F of
+table_A2.csv, and timed inside the script-05 pipeline; the report is saved to
+benchmark_files/ner_distillation.csv.
+
+    DISTIL_MODE=shared python scripts/script_distil_ner_institutions.py
+
+To annotate with a variant:
+    INSTITUTIONS_NER=models_files/NER_institutions_shared/model-best SHARED_TOK2VEC=1 \
+        python scripts/05_script_pipeline_main.py
+"""
+
+import csv
+import os
+import shutil
+import sys
+from tabulate import tabulate
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+import config
+from ner_training import run_jobs, thread_budget
+from ner_evaluation import evaluate_ner
+from ner_benchmark import ROWS_PRESETS
+from ner_distillation import (shared_tok2vec_config, write_silver_docbin, iter_sentence_texts,
+                              annotation_pipeline, annotation_speed)
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+DISTIL_MODE = os.getenv("DISTIL_MODE", "both")          # "shared", "student" or "both"
+
+TRAINING_DIR = config.MODELS_DIR / "NER_training" / "NER_institutions"
+TEACHER_DIR = config.MODELS_DIR / "NER_institutions" / "model-last"
+SENTENCES_FILE = config.CORPUS_DIR / "EurLex_sentences.jsonl"
+WORK_DIR = config.MODELS_DIR / "NER_distillation"
+
+SHARED_OUTPUT = config.MODELS_DIR / "NER_institutions_shared"
+STUDENT_OUTPUT = config.MODELS_DIR / "NER_institutions_student"
+
+STUDENT_WIDTH = int(os.getenv("STUDENT_WIDTH", 64))
+STUDENT_DEPTH = int(os.getenv("STUDENT_DEPTH", 2))
+STUDENT_ROWS = os.getenv("STUDENT_ROWS", "small")      # key of ROWS_PRESETS
+SILVER_SENTENCES = int(os.getenv("SILVER_SENTENCES", 50000))   # teacher-annotated sentences (0 = all)
+
+SPEED_SENTENCES = int(os.getenv("SPEED_SENTENCES", 2000))      # sentences timed in the script-05 pipeline
+THREADS_PER_WORKER = int(os.getenv("THREADS_PER_WORKER", thread_budget(2)))
+
+REPORT_FILE = config.BENCHMARK_DIR / "ner_distillation.csv"
+HEADERS = ["model", "ents_p", "ents_r", "ents_f", "delta_f_teacher", "delta_f_table_A2",
+           "annotation_wps", "speedup"]
+
+
+def table_a2_f():
+    path = config.OUTPUT_TABLES_DIR / "table_A2.csv"
+    if not path.exists():
+        return None
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row["Label"] == "Overall":
+                return float(row["F-score"])
+    return None
+
+
+def training_jobs():
+    base_overrides = {"paths.dev": str((TRAINING_DIR / "dev.spacy").resolve())}
+    jobs = {}
+
+    if DISTIL_MODE in ("shared", "both"):
+        WORK_DIR.mkdir(parents=True, exist_ok=True)
+        cfg_path = shared_tok2vec_config(TRAINING_DIR / "config.cfg", WORK_DIR / "config_shared.cfg")
+        jobs["shared"] = {
+            "cfg_path": cfg_path.resolve(),
+            "output_path": SHARED_OUTPUT.resolve(),
+            "overrides": dict(base_overrides, **{"paths.train": str((TRAINING_DIR / "train.spacy").resolve())}),
+            "log_path": WORK_DIR / "training_shared.log",
+        }
+
+    if DISTIL_MODE in ("student", "both"):
+        # gold + silver: spacy.Corpus reads every .spacy file of the directory
+        train_dir = WORK_DIR / "student_train"
+        train_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy(TRAINING_DIR / "train.spacy", train_dir / "gold.spacy")
+        print(f" Annotating up to {SILVER_SENTENCES or 'all'} sentences with the teacher ...")
+        n_docs, n_ents = write_silver_docbin(TEACHER_DIR, SENTENCES_FILE, train_dir / "silver.spacy",
+                                             limit=SILVER_SENTENCES)
+        print(f"✅ Silver data: {n_docs:,} sentences, {n_ents:,} entities")
+        jobs["student"] = {
+            "cfg_path": (TRAINING_DIR / "config.cfg").resolve(),
+            "output_path": STUDENT_OUTPUT.resolve(),
+            "overrides": dict(base_overrides, **{
+                "paths.train": str(train_dir.resolve()),
+                "components.tok2vec.model.encode.width": STUDENT_WIDTH,
+                "components.tok2vec.model.encode.depth": STUDENT_DEPTH,
+                "components.tok2vec.model.embed.rows": ROWS_PRESETS[STUDENT_ROWS],
+            }),
+            "log_path": WORK_DIR / "training_student.log",
+        }
+    return jobs
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== Institution NER Distillation ===")
+    jobs = training_jobs()
+    results = run_jobs(jobs, len(jobs), THREADS_PER_WORKER)
+    failed = [name for name, r in results.items() if r["error"] is not None]
+    if failed:
+        raise RuntimeError(f"Training failed for {', '.join(failed)} (see the logs in {WORK_DIR})")
+
+    candidates = {"teacher": (TEACHER_DIR, False)}
+    if "shared" in jobs:
+        candidates["shared"] = (SHARED_OUTPUT / "model-best", True)
+    if "student" in jobs:
+        candidates["student"] = (STUDENT_OUTPUT / "model-best", False)
+
+    texts = list(iter_sentence_texts(SENTENCES_FILE, SPEED_SENTENCES))
+    reference_f = table_a2_f()
+    rows = {}
+    for name, (model_dir, shared) in candidates.items():
+        print(f"\n Scoring and timing {name} ({model_dir})")
+        overall, _ = evaluate_ner(model_dir, TRAINING_DIR / "dev.spacy")
+        wps = annotation_speed(annotation_pipeline(model_dir, shared), texts)
+        rows[name] = {"model": name, "annotation_wps": wps, **overall}
+
+    teacher = rows["teacher"]
+    table = []
+    for row in rows.values():
+        table.append([
+            row["model"], row["ents_p"], row["ents_r"], row["ents_f"],
+            row["ents_f"] - teacher["ents_f"],
+            row["ents_f"] - reference_f if reference_f is not None else None,
+            row["annotation_wps"],
+            row["annotation_wps"] / teacher["annotation_wps"],
+        ])
+    print()
+    print(tabulate(table, headers=HEADERS, tablefmt="pipe", floatfmt=".3f"))
+
+    config.BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        writer.writerows(table)
+    print(f"\n✅ Saved distillation report → {REPORT_FILE}")
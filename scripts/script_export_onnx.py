@@ -0,0 +1,109 @@
+# scripts/script_export_onnx.py
+"""
+Export final Transformer classifiers to ONNX, with int8 dynamic quantisation, for
+corpus-scale CPU inference (script_transformer_inference.py with INFER_BACKEND=onnx-int8).
+
+For every model in EXPORT_MODELS saved by script 06 (FINAL_MODELS), this script:
+
+  1. exports models_files/transformer_final/<model>/model.onnx and model.int8.onnx
+     (see replication_src/transformer_onnx.py);
+  2. checks accuracy parity on the held-out 20% of the final model's split: per-label F1
+     and MCC of each ONNX backend against the PyTorch model, and the largest absolute
+     probability difference;
+  3. benchmarks single-sentence latency (mean, p95) and batched throughput (sentences/sec,
+     tokenisation included) of PyTorch fp32, ONNX fp32 and ONNX int8.
+
+Reports: benchmark_files/transformer_onnx_parity.csv and transformer_onnx_speed.csv.
+
+    EXPORT_MODELS=LegalBERT_EU,DistilBERT BENCH_THREADS=8 python scripts/script_export_onnx.py
+"""
+
+import csv
+import os
+import sys
+
+import numpy as np
+import torch
+from tabulate import tabulate
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+import config
+from transformer_inference import load_classifier
+from transformer_onnx import (export_onnx, quantize_int8, load_backend, label_scores, latency, throughput,
+                              BACKEND_FILES)
+from transformer_sweep import load_annotations, final_split
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+EXPORT_MODELS = os.getenv("EXPORT_MODELS", "LegalBERT_EU").split(",")
+OPSET = int(os.getenv("OPSET", 17))
+BENCH_THREADS = int(os.getenv("BENCH_THREADS", os.cpu_count() or 1))
+LATENCY_SENTENCES = int(os.getenv("LATENCY_SENTENCES", 200))
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", 64))
+SEED = 42
+
+FINAL_DIR = config.MODELS_DIR / "transformer_final"
+ANNOTATION_FILE = config.SOURCE_TEXT_DIR / "authors_annotation.csv"
+PARITY_FILE = config.BENCHMARK_DIR / "transformer_onnx_parity.csv"
+SPEED_FILE = config.BENCHMARK_DIR / "transformer_onnx_speed.csv"
+BACKENDS = ["torch"] + list(BACKEND_FILES)
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== ONNX Export ===")
+    torch.set_num_threads(BENCH_THREADS)
+    texts, targets, _ = load_annotations(ANNOTATION_FILE)
+    _, heldout = final_split(len(texts), SEED)
+    heldout_texts = [texts[i] for i in heldout]
+    heldout_targets = np.asarray(targets)[heldout]
+
+    parity_rows, speed_rows = [], []
+    for model_name in EXPORT_MODELS:
+        model_dir = FINAL_DIR / model_name
+        model, _, meta = load_classifier(model_dir)
+        export_onnx(model, model_dir / BACKEND_FILES["onnx"], OPSET)
+        quantize_int8(model_dir / BACKEND_FILES["onnx"], model_dir / BACKEND_FILES["onnx-int8"])
+        print(f"✅ {model_name}: exported → {model_dir / BACKEND_FILES['onnx']}, {model_dir / BACKEND_FILES['onnx-int8']}")
+
+        scores, speed = {}, {}
+        for backend in BACKENDS:
+            runner, tokenizer, _ = load_backend(model_dir, backend, BENCH_THREADS)
+            sentences_per_sec, probs = throughput(runner, tokenizer, heldout_texts, meta["max_len"], BATCH_SIZE)
+            mean_ms, p95_ms = latency(runner, tokenizer, heldout_texts[:LATENCY_SENTENCES], meta["max_len"])
+            scores[backend] = (probs, *label_scores(heldout_targets, probs))
+            speed[backend] = (mean_ms, p95_ms, sentences_per_sec)
+
+        torch_probs, torch_f1, torch_mcc = scores["torch"]
+        for backend in BACKEND_FILES:
+            probs, f1, mcc = scores[backend]
+            max_diff = float(np.abs(probs - torch_probs).max())
+            print(f" {model_name} {backend}: max |Δp| {max_diff:.4f} | max |ΔF1| {np.abs(f1 - torch_f1).max():.4f} "
+                  f"| max |ΔMCC| {np.abs(mcc - torch_mcc).max():.4f}")
+            for j, label in enumerate(meta["labels"]):
+                parity_rows.append([model_name, backend, label, torch_f1[j], f1[j], f1[j] - torch_f1[j],
+                                    torch_mcc[j], mcc[j], mcc[j] - torch_mcc[j], max_diff])
+        for backend, (mean_ms, p95_ms, sentences_per_sec) in speed.items():
+            speed_rows.append([model_name, backend, mean_ms, p95_ms, sentences_per_sec,
+                               sentences_per_sec / speed["torch"][2]])
+
+    speed_headers = ["Model", "Backend", "Latency ms (mean)", "Latency ms (p95)", "Sentences/sec", "Speed-up"]
+    print()
+    print(tabulate(speed_rows, headers=speed_headers, tablefmt="pipe", floatfmt=".2f"))
+
+    config.BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(PARITY_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Model", "Backend", "Label", "F1 torch", "F1", "F1 drift",
+                         "MCC torch", "MCC", "MCC drift", "Max prob diff"])
+        writer.writerows(parity_rows)
+    with open(SPEED_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(speed_headers)
+        writer.writerows(speed_rows)
+    print(f"\n✅ Saved reports → {PARITY_FILE}, {SPEED_FILE}")
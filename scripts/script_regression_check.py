@@ -0,0 +1,75 @@
+# scripts/script_regression_check.py
+"""
+Golden-output regression check for scripts 01 and 05.
+
+Runs the preprocessing and the full classification pipeline end-to-end on
+source_files/EurLex_sample.csv in a temporary directory and compares every
+output cell, column by column, with the golden files in regression_files/golden/.
+
+Use it before and after any performance change: the outputs must be identical.
+
+The golden files are generated by the scripts of GOLDEN_REF (default: the baseline, i.e. the
+root commit), checked out in a temporary git worktree, never by the working tree; golden.json
+records that commit and the checksum of every golden file.
+
+    python scripts/script_regression_check.py                  # compare with golden
+    UPDATE_GOLDEN=1 python scripts/script_regression_check.py  # (re)write golden files from GOLDEN_REF
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from replication_src import config
+from replication_src.regression import (GOLDEN_DIR, run_pipeline, compare_outputs, update_golden, golden_outputs,
+                                       remove_worktree, baseline_commit)
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+UPDATE_GOLDEN = os.getenv("UPDATE_GOLDEN", "0") == "1"
+GOLDEN_REF = os.getenv("GOLDEN_REF", "")                 # commit the golden files come from ("" = baseline)
+KEEP_WORK_DIR = os.getenv("KEEP_WORK_DIR", "0") == "1"   # keep the outputs of the run for inspection
+INSTITUTIONS_NER = Path(os.getenv("INSTITUTIONS_NER", config.MODELS_DIR / "NER_institutions" / "model-last"))
+REPORT_FILE = config.REGRESSION_DIR / "last_report.txt"
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== Golden-Output Regression Check ===")
+
+    if UPDATE_GOLDEN:
+        commit, worktree, outputs = golden_outputs(GOLDEN_REF or baseline_commit(), INSTITUTIONS_NER)
+        try:
+            update_golden(outputs, commit)
+        finally:
+            remove_worktree(worktree)
+        print(f"\n✅ Golden files of commit {commit[:12]} written to {GOLDEN_DIR}")
+        sys.exit(0)
+
+    work_dir = Path(tempfile.mkdtemp(prefix="eurlex_regression_"))
+    outputs = run_pipeline(work_dir)
+    ok, report = compare_outputs(outputs)
+    print("\n" + report)
+    config.REGRESSION_DIR.mkdir(parents=True, exist_ok=True)
+    REPORT_FILE.write_text(report + "\n", encoding="utf-8")
+    print(f"\n Report saved to: {REPORT_FILE}")
+
+    if KEEP_WORK_DIR:
+        print(f" Outputs kept in: {work_dir}")
+    else:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if ok:
+        print("\n✅ Outputs identical to golden files.")
+    else:
+        print("\n❌ Outputs differ from golden files.")
+    sys.exit(0 if ok else 1)
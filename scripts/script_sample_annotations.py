@@ -0,0 +1,65 @@
+# scripts/script_sample_annotations.py
+"""
+Select new sentences to annotate for the institution NER (active learning).
+
+Sentences are streamed from corpus_files/EurLex_sentences.jsonl (or from the annotated
+output EURLEX_corpus_annotated.csv), scored by NER uncertainty (beam-score margin) and
+disagreement between the NER and plain-text actor cues, and the top k mutually dissimilar
+sentences (MinHash near-duplicate filter) are written as Prodigy-style tasks with the
+model's pre-annotations, in the format of annotations_institutions_10k.jsonl.
+See replication_src/active_learning.py.
+
+    AL_K=500 AL_WORKERS=8 python scripts/script_sample_annotations.py
+"""
+
+import os
+import sys
+import timeit
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from replication_src import config
+from replication_src.active_learning import (iter_sentences_jsonl, iter_annotated_csv, load_annotated_texts,
+                                             sample, write_tasks)
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+AL_SOURCE = os.getenv("AL_SOURCE", "sentences")      # "sentences" (EurLex_sentences.jsonl) or "annotated" (CSV)
+AL_MODEL = Path(os.getenv("AL_MODEL", config.MODELS_DIR / "NER_institutions" / "model-last"))
+AL_K = int(os.getenv("AL_K", 1000))                  # sentences to select
+AL_WORKERS = int(os.getenv("AL_WORKERS", max(1, (os.cpu_count() or 1) - 1)))
+CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", 2000))      # sentences per worker task
+BEAM_WIDTH = int(os.getenv("BEAM_WIDTH", 8))
+WEIGHT_UNCERTAINTY = float(os.getenv("WEIGHT_UNCERTAINTY", 0.7))
+WEIGHT_DISAGREEMENT = float(os.getenv("WEIGHT_DISAGREEMENT", 0.3))
+OVERSAMPLE = int(os.getenv("OVERSAMPLE", 5))         # candidates kept per selected sentence before dedup
+LSH_BANDS = int(os.getenv("LSH_BANDS", 16))          # more bands = stricter near-duplicate filter
+
+ANNOTATED_FILE = config.MODELS_DIR / "NER_training" / "NER_institutions" / "annotations_institutions_10k.jsonl"
+OUT_FILE = config.OUTPUT_FILES_DIR / f"al_candidates_institutions_{AL_K}.jsonl"
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== Active-learning sampler ===")
+    if AL_SOURCE == "annotated":
+        records = iter_annotated_csv(config.OUTPUT_FILES_DIR / "EURLEX_corpus_annotated.csv")
+    else:
+        records = iter_sentences_jsonl(config.CORPUS_DIR / "EurLex_sentences.jsonl")
+    skip_texts = load_annotated_texts(ANNOTATED_FILE)
+    print(f" Model {AL_MODEL} | {AL_WORKERS} worker(s) | skipping {len(skip_texts):,} annotated sentences")
+
+    start = timeit.default_timer()
+    tasks = sample(records, AL_MODEL, AL_K, n_workers=AL_WORKERS, chunk_size=CHUNK_SIZE, beam_width=BEAM_WIDTH,
+                   weights=(WEIGHT_UNCERTAINTY, WEIGHT_DISAGREEMENT), oversample=OVERSAMPLE, bands=LSH_BANDS,
+                   skip_texts=skip_texts)
+
+    config.OUTPUT_FILES_DIR.mkdir(parents=True, exist_ok=True)
+    write_tasks(tasks, OUT_FILE)
+    print(f"\n✅ {len(tasks):,} sentences selected in {timeit.default_timer() - start:.0f}s → {OUT_FILE}")
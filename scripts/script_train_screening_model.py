@@ -0,0 +1,180 @@
+# scripts/script_train_screening_model.py
+"""
+Train and evaluate the screening model of the classification pipeline (script 05).
+
+  1. Builds a textcat_multilabel training set from script 05's output on the full corpus:
+     one Doc per record of corpus_files/EurLex_sentences.jsonl, with the classification
+     columns that script 05 filled for any of its chunks as categories: the 13 primary ones
+     (del_ms ... con_age) and the secondary ones (del_ms2 ... con_age2).
+     The acts of source_files/EurLex_sample.csv are left out, so that step 3 is evaluated on
+     records the model has not seen. Script 05's output must come from a run without
+     SCREEN_MODEL (records skipped by a screen have no labels).
+  2. Trains a bag-of-words (SCREEN_ARCH=bow) or small CNN (cnn) text classifier into
+     models_files/screening_model and calibrates the screening threshold on the dev set
+     for TARGET_RECALL of the records with a label.
+  3. Runs scripts 01 + 05 on the sample, then 05 again on the records that pass the screen
+     only, and reports per-label recall of the screened run against the full run and the
+     end-to-end speed of both (benchmark_files/screening_report.csv, screening_speed.csv).
+
+To annotate with screening:
+    SCREEN_MODEL=models_files/screening_model python scripts/05_script_pipeline_main.py
+"""
+
+import csv
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(BASE_DIR))
+
+from replication_src import config
+from replication_src.regression import (run_pipeline, load_annotated_csv, ANNOTATED_FILE, SENTENCES_FILE,
+                                       PIPELINE_SCRIPTS)
+from replication_src.screening import (SCREEN_LABELS, SCREEN_FILE, labels_by_record, iter_labeled_records,
+                                       write_docbins, screen_config, screen_scores, calibrate_threshold,
+                                       save_screening, load_screen, screen_records, screened_marker)
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+SCREEN_ARCH = os.getenv("SCREEN_ARCH", "bow")             # "bow" or "cnn"
+TARGET_RECALL = float(os.getenv("TARGET_RECALL", 0.99))   # share of labelled records kept on dev
+TRAIN_LIMIT = int(os.getenv("TRAIN_LIMIT", 0))            # max records for training (0 = all)
+RETRAIN = os.getenv("RETRAIN", "0") == "1"
+KEEP_WORK_DIR = os.getenv("KEEP_WORK_DIR", "0") == "1"
+SEED = 42
+
+ANNOTATED_CSV = config.OUTPUT_FILES_DIR / ANNOTATED_FILE
+SENTENCES_JSONL = config.CORPUS_DIR / SENTENCES_FILE
+TRAINING_DIR = config.MODELS_DIR / "screening_training"
+MODEL_DIR = config.MODELS_DIR / "screening_model"
+REPORT_FILE = config.BENCHMARK_DIR / "screening_report.csv"
+SPEED_FILE = config.BENCHMARK_DIR / "screening_speed.csv"
+
+
+def train_screening_model(heldout_celex):
+    from spacy.cli.train import train
+    import spacy
+    from spacy.tokens import DocBin
+
+    if screened_marker(ANNOTATED_CSV).exists():
+        raise RuntimeError(f"{ANNOTATED_CSV} was produced with SCREEN_MODEL (see {screened_marker(ANNOTATED_CSV)}); "
+                           f"rerun script 05 without it before training a screening model")
+    labels = labels_by_record(ANNOTATED_CSV)
+    records = iter_labeled_records(SENTENCES_JSONL, labels, exclude_celex=heldout_celex)
+    n_train, n_dev = write_docbins(records, TRAINING_DIR, seed=SEED, limit=TRAIN_LIMIT)
+    print(f" {n_train:,} training / {n_dev:,} dev records → {TRAINING_DIR}")
+
+    cfg_path = screen_config(TRAINING_DIR / f"config_{SCREEN_ARCH}.cfg", SCREEN_ARCH)
+    train(cfg_path, TRAINING_DIR / "output", overrides={
+        "paths.train": str(TRAINING_DIR / "train.spacy"),
+        "paths.dev": str(TRAINING_DIR / "dev.spacy"),
+    })
+    shutil.rmtree(MODEL_DIR, ignore_errors=True)
+    shutil.copytree(TRAINING_DIR / "output" / "model-best", MODEL_DIR)
+
+    nlp = spacy.load(MODEL_DIR)
+    dev_docs = list(DocBin().from_disk(TRAINING_DIR / "dev.spacy").get_docs(nlp.vocab))
+    scores = screen_scores(nlp, [doc.text for doc in dev_docs])
+    positive = np.array([max(doc.cats.values()) > 0 for doc in dev_docs])
+    threshold = calibrate_threshold(scores, positive, TARGET_RECALL)
+    kept = scores >= threshold
+    dev_recall = float(kept[positive].mean()) if positive.any() else 1.0
+    save_screening(MODEL_DIR, threshold, arch=SCREEN_ARCH, target_recall=TARGET_RECALL, dev_recall=dev_recall,
+                   dev_pass_rate=float(kept.mean()), n_train=n_train, n_dev=n_dev,
+                   labels=SCREEN_LABELS, heldout_celex=sorted(heldout_celex))
+    print(f"✅ Threshold {threshold:.4f}: dev recall {dev_recall:.3f}, {kept.mean():.1%} of dev records pass")
+
+
+def is_current(model_dir, celex):
+    """True if the saved screening model predicts SCREEN_LABELS and was trained without the acts in `celex`."""
+    screen_file = model_dir / SCREEN_FILE
+    if not screen_file.exists():
+        return False
+    with open(screen_file, "r", encoding="utf-8") as f:
+        stats = json.load(f)
+    return stats.get("labels") == SCREEN_LABELS and celex <= set(stats.get("heldout_celex", []))
+
+
+def pipeline_seconds(timings_dir):
+    with open(timings_dir / "05_script_pipeline_main.json", "r", encoding="utf-8") as f:
+        return sum(json.load(f)["seconds"].values())
+
+
+def timed_run(work_dir, scripts):
+    """Run `scripts` in `work_dir`; returns their outputs and the stage seconds of script 05."""
+    timings_dir = work_dir / "timings"
+    timings_dir.mkdir(parents=True, exist_ok=True)
+    outputs = run_pipeline(work_dir, scripts=scripts, extra_env={"STAGE_TIMINGS_DIR": str(timings_dir)})
+    return outputs, pipeline_seconds(timings_dir)
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== Screening Model ===")
+    work_dir = Path(tempfile.mkdtemp(prefix="eurlex_screening_"))
+    full_outputs, full_seconds = timed_run(work_dir / "full", PIPELINE_SCRIPTS)
+    with open(full_outputs[SENTENCES_FILE], "r", encoding="utf-8") as f:
+        records = [dict(json.loads(line), line=line) for line in f]
+
+    # the sample's acts are held out of training, so the report below is out-of-sample
+    sample_celex = {str(record["metadata"]["CELEX_number"]) for record in records}
+    if RETRAIN or not is_current(MODEL_DIR, sample_celex):
+        train_screening_model(sample_celex)
+    nlp, threshold = load_screen(MODEL_DIR)
+
+    # screen the sample's records and run script 05 again on those that pass
+    screened_dir = work_dir / "screened"
+    (screened_dir / "corpus_files").mkdir(parents=True)
+    start = timeit.default_timer()
+    kept = list(screen_records(records, nlp, threshold))
+    screen_seconds = timeit.default_timer() - start
+    with open(screened_dir / "corpus_files" / SENTENCES_FILE, "w", encoding="utf-8") as f:
+        f.writelines(record["line"] for record in kept)
+    screened_outputs, screened_seconds = timed_run(screened_dir, ["05_script_pipeline_main.py"])
+
+    _, full_rows = load_annotated_csv(full_outputs[ANNOTATED_FILE])
+    _, screened_rows = load_annotated_csv(screened_outputs[ANNOTATED_FILE])
+    report = []
+    for label in SCREEN_LABELS + ["any"]:
+        if label == "any":
+            positives = [k for k, row in full_rows.items() if any(row[l] for l in SCREEN_LABELS)]
+            recovered = [k for k in positives if k in screened_rows]
+        else:
+            positives = [k for k, row in full_rows.items() if row[label]]
+            recovered = [k for k in positives if k in screened_rows and screened_rows[k][label] == full_rows[k][label]]
+        report.append([label, len(positives), len(recovered), len(recovered) / len(positives) if positives else 1.0])
+
+    total_screened = screen_seconds + screened_seconds
+    speed = [
+        ["full pipeline", len(records), full_seconds, len(records) / full_seconds],
+        ["screening + pipeline", len(kept), total_screened, len(records) / total_screened],
+    ]
+    print(f"\n {len(kept):,} of {len(records):,} records pass the screen (threshold {threshold:.4f})")
+    print(f" Recall of labelled rows: {report[-1][3]:.3f} | speed-up ×{full_seconds / total_screened:.2f}")
+
+    config.BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Label", "Rows (full pipeline)", "Rows recovered", "Recall"])
+        writer.writerows(report)
+    with open(SPEED_FILE, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Run", "Records annotated", "Seconds", "Records/sec (all records)"])
+        writer.writerows(speed)
+
+    if KEEP_WORK_DIR:
+        print(f" Outputs kept in: {work_dir}")
+    else:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    print(f"\n✅ Saved reports → {REPORT_FILE}, {SPEED_FILE}")
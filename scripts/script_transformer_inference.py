@@ -0,0 +1,64 @@
+# scripts/script_transformer_inference.py
+"""
+Apply a final Transformer classifier to the whole corpus, for comparison with the rule-based
+classification of script 05.
+
+The classifier is trained and saved by script 06:
+    FINAL_MODELS=LegalBERT_EU python scripts/06_script_train_eval_transformers.py
+
+Sentences are streamed from corpus_files/EurLex_sentences*.jsonl (one file or several shards)
+to a pool of CPU workers, tokenised in length-sorted batches and classified under
+torch.inference_mode (see replication_src/transformer_inference.py). The 13 label
+probabilities per sub_sentence_id are written to output_files/transformer_probs_<model>.npz
+(one column per label). An interrupted run resumes from its finished chunks.
+
+    INFER_MODEL=LegalBERT_EU INFER_WORKERS=4 python scripts/script_transformer_inference.py
+"""
+
+import json
+import os
+import sys
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+import config
+from ner_training import thread_budget
+from transformer_inference import shard_paths, run_inference, merge_parts, META_FILE
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+INFER_MODEL = os.getenv("INFER_MODEL", "LegalBERT_EU")
+INFER_INPUT = os.getenv("INFER_INPUT", str(config.CORPUS_DIR / "EurLex_sentences*.jsonl"))   # glob of shards
+INFER_WORKERS = int(os.getenv("INFER_WORKERS", max(1, (os.cpu_count() or 1) // 4)))
+THREADS_PER_WORKER = int(os.getenv("THREADS_PER_WORKER", thread_budget(INFER_WORKERS)))
+CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", 5000))     # sentences per worker task (one part file)
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", 64))
+INFER_BACKEND = os.getenv("INFER_BACKEND", "torch")   # "torch", "onnx" or "onnx-int8" (scripts/script_export_onnx.py)
+
+MODEL_DIR = config.MODELS_DIR / "transformer_final" / INFER_MODEL
+WORK_DIR = config.OUTPUT_FILES_DIR / f"transformer_probs_{INFER_MODEL}"
+OUT_FILE = config.OUTPUT_FILES_DIR / f"transformer_probs_{INFER_MODEL}.npz"
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print("\n=== Transformer Corpus Inference ===")
+    if not (MODEL_DIR / META_FILE).exists():
+        raise FileNotFoundError(f"No final classifier in {MODEL_DIR}; run script 06 with FINAL_MODELS={INFER_MODEL}")
+    with open(MODEL_DIR / META_FILE, "r", encoding="utf-8") as f:
+        labels = json.load(f)["labels"]
+
+    paths = shard_paths(INFER_INPUT)
+    print(f" {INFER_MODEL} ({INFER_BACKEND}) | {len(paths)} shard(s) | {INFER_WORKERS} worker(s) × {THREADS_PER_WORKER} thread(s)")
+    n_sentences, seconds = run_inference(MODEL_DIR, paths, WORK_DIR, n_workers=INFER_WORKERS,
+                                         threads_per_worker=THREADS_PER_WORKER, chunk_size=CHUNK_SIZE,
+                                         batch_size=BATCH_SIZE, backend=INFER_BACKEND)
+    if n_sentences:
+        print(f" {n_sentences:,} sentences in {seconds:.0f}s → {n_sentences / seconds:,.1f} sentences/sec")
+
+    n_rows = merge_parts(WORK_DIR, labels, OUT_FILE)
+    print(f"\n✅ {n_rows:,} sentences × {len(labels)} label probabilities → {OUT_FILE}")
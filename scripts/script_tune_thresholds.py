@@ -0,0 +1,103 @@
+# scripts/script_tune_thresholds.py
+"""
+Per-label decision thresholds for the fine-tuned Transformer classifiers, from the
+out-of-fold test probabilities stored by script 06 (no training is re-run).
+
+For every model in TUNE_MODELS, this script reads the 5 fold files
+models_files/transformer_sweep/<model>/fold_<k>_probs.npz (SWEEP_DIR) and:
+
+  1. evaluates precision, recall, F1 and MCC of all 13 labels at every threshold of a grid
+     (THRESHOLD_STEP) → SWEEP_DIR/<model>/threshold_grid.csv (fold-averaged, in percent);
+  2. checks that the grid evaluator reproduces output_tables/<model>_metrics.csv at 0.5;
+  3. picks, per label, the threshold maximising the fold-averaged TUNE_METRIC (F1 or MCC)
+     and writes output_tables/<model>_metrics_tuned.csv: the Table A7–A10 metrics at the
+     tuned thresholds, cross-fitted (each test fold scored at the thresholds chosen on the
+     other folds), with the thresholds chosen on all folds in the Threshold column.
+
+A summary of mean F1/MCC at 0.5 and tuned goes to output_tables/threshold_summary.csv.
+
+    TUNE_METRIC=MCC python scripts/script_tune_thresholds.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# make local imports work
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'replication_src')))
+import config
+from transformer_sweep import fold_result_path, oof_path
+from threshold_evaluation import load_oof, threshold_grid, fold_grids, fixed_table, tuned_table, grid_table
+
+
+# ============================================================
+# ------------------------ SETTINGS ---------------------------
+# ============================================================
+TUNE_MODELS = os.getenv("TUNE_MODELS", "BERT,RoBERTa,DistilBERT,LegalBERT_EU").split(",")
+TUNE_METRIC = os.getenv("TUNE_METRIC", "F1")                     # "F1" or "MCC"
+THRESHOLD_STEP = float(os.getenv("THRESHOLD_STEP", 0.01))
+NUM_FOLDS = 5
+
+# fold results of script 06 (the same SWEEP_DIR)
+SWEEP_DIR = Path(os.getenv("SWEEP_DIR", config.MODELS_DIR / "transformer_sweep"))
+SUMMARY_FILE = config.OUTPUT_TABLES_DIR / "threshold_summary.csv"
+
+
+def load_folds(model_name):
+    """Out-of-fold probabilities of every fold of `model_name`, or None if a fold has none."""
+    paths = [oof_path(fold_result_path(SWEEP_DIR, model_name, fold)) for fold in range(1, NUM_FOLDS + 1)]
+    missing = [p for p in paths if not p.exists()]
+    if missing:
+        print(f"⚠️ {model_name}: no probabilities in {', '.join(str(p) for p in missing)} "
+              f"(rerun script 06 with RESUME=0 for this model)")
+        return None
+    return [load_oof(p) for p in paths]
+
+
+# ============================================================
+# ------------------------- MAIN ------------------------------
+# ============================================================
+if __name__ == "__main__":
+    print(f"\n=== Threshold Tuning ({TUNE_METRIC}) ===")
+    if TUNE_METRIC not in ("F1", "MCC"):
+        raise ValueError(f"TUNE_METRIC must be F1 or MCC, not {TUNE_METRIC!r}")
+    thresholds = threshold_grid(THRESHOLD_STEP)
+    config.OUTPUT_TABLES_DIR.mkdir(parents=True, exist_ok=True)
+
+    summary = []
+    for model_name in TUNE_MODELS:
+        folds = load_folds(model_name)
+        if folds is None:
+            continue
+        class_names = folds[0][3]
+        grids = fold_grids(folds, thresholds)
+
+        grid_path = SWEEP_DIR / model_name / "threshold_grid.csv"
+        grid_table(grids, thresholds, class_names).to_csv(grid_path, index=False)
+
+        fixed = fixed_table(folds, class_names, 0.5)
+        reported = config.OUTPUT_TABLES_DIR / f"{model_name}_metrics.csv"
+        if reported.exists():
+            diff = (fixed.set_index("Label") - pd.read_csv(reported).set_index("Label")).abs().to_numpy().max()
+            print(f" {model_name}: max |Δ| against {reported.name} at 0.5: {diff:.2f}")
+
+        tuned = tuned_table(grids, thresholds, class_names, TUNE_METRIC)
+        print(f"\n✅ {model_name}: metrics at per-label {TUNE_METRIC}-optimal thresholds (cross-fitted):")
+        print(tuned)
+        output_path = config.OUTPUT_TABLES_DIR / f"{model_name}_metrics_tuned.csv"
+        tuned.to_csv(output_path, index=False)
+        print(f"\n Saved metrics to: {output_path}")
+
+        summary.append({"Model": model_name, "Mean F1 (0.5)": fixed["F1"].mean(), "Mean F1 (tuned)": tuned["F1"].mean(),
+                        "Mean MCC (0.5)": fixed["MCC"].mean(), "Mean MCC (tuned)": tuned["MCC"].mean(),
+                        "Mean threshold": float(np.mean(tuned["Threshold"]))})
+
+    if summary:
+        summary = pd.DataFrame(summary).round(2)
+        print(f"\n✅ Thresholds at 0.5 vs tuned on {TUNE_METRIC} (mean over labels):")
+        print(summary)
+        summary.to_csv(SUMMARY_FILE, index=False)
+        print(f"\n Saved summary to: {SUMMARY_FILE}")